@@ -21,6 +21,17 @@ ConnectionType = Union[AsyncConnection, "AsyncConnectionWrapper"]
 class BaseAdapter(ABC):
     """Base adapter defining database-specific interface."""
 
+    # Whether a failed statement leaves the connection unusable until the
+    # transaction is rolled back, so it must not be reused for further work
+    errors_abort_transaction = False
+
+    # Table references _table_ref_cache holds at most; the oldest is evicted
+    _TABLE_REF_CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
+        # Qualified table references memoized per (schema, table)
+        self._table_ref_cache: dict[tuple[Optional[str], str], str] = {}
+
     @property
     @abstractmethod
     def capabilities(self) -> DatabaseCapabilities:
@@ -59,6 +70,88 @@ class BaseAdapter(ABC):
         """
         ...
 
+    async def enrich_schemas_batch(
+        self, conn: ConnectionType, schemas: list[SchemaInfo]
+    ) -> list[SchemaInfo]:
+        """
+        Enrich several schemas with database-specific metadata.
+
+        The default enriches each schema in turn. Adapters that can fetch
+        metadata for many schemas in one round trip override this.
+
+        Args:
+            conn: Database connection
+            schemas: Basic schema information
+
+        Returns:
+            Enriched schema information, in the same order as schemas
+        """
+        return [await self.enrich_schema_info(conn, schema) for schema in schemas]
+
+    async def list_tables(
+        self, conn: ConnectionType, schema: Optional[str], include_views: bool
+    ) -> list[tuple[str, str]]:
+        """
+        List the tables, and optionally views, of a schema in one query.
+
+        Adapters that can read both kinds from the catalog at once override
+        this. The default raises NotImplementedError so callers fall back to
+        separate table and view reflection.
+
+        Args:
+            conn: Database connection
+            schema: Schema name (None for default)
+            include_views: Whether to include views
+
+        Returns:
+            (name, "BASE TABLE" or "VIEW") pairs, tables before views
+
+        Raises:
+            NotImplementedError: If the adapter has no single-query implementation
+        """
+        raise NotImplementedError
+
+    async def get_schema_object_counts(
+        self, conn: ConnectionType, exclude: frozenset[str]
+    ) -> dict[str, tuple[int, int]]:
+        """
+        Count the tables and views of every schema in one query.
+
+        Adapters that can read the counts for all schemas from the catalog
+        at once override this. The default raises NotImplementedError so
+        callers fall back to reflecting each schema.
+
+        Args:
+            conn: Database connection
+            exclude: Schema names to leave out
+
+        Returns:
+            Mapping of schema name to (table count, view count), ordered by
+            schema name
+
+        Raises:
+            NotImplementedError: If the adapter has no single-query implementation
+        """
+        raise NotImplementedError
+
+    async def enrich_tables_batch(
+        self, conn: ConnectionType, tables: list[TableInfo]
+    ) -> list[TableInfo]:
+        """
+        Enrich several tables with database-specific metadata.
+
+        The default enriches each table in turn. Adapters that can fetch
+        metadata for many tables in one round trip override this.
+
+        Args:
+            conn: Database connection
+            tables: Basic table information
+
+        Returns:
+            Enriched table information, in the same order as tables
+        """
+        return [await self.enrich_table_info(conn, table) for table in tables]
+
     async def enrich_column_comments(
         self,
         conn: ConnectionType,
@@ -107,6 +200,34 @@ class BaseAdapter(ABC):
         """
         ...
 
+    async def get_multi_column_statistics(
+        self,
+        conn: ConnectionType,
+        table_name: str,
+        column_names: list[str],
+        schema: Optional[str],
+    ) -> list[ColumnStats]:
+        """
+        Get statistics for several columns of one table in a single scan.
+
+        Adapters that can aggregate many columns in one pass over the table
+        override this. The default raises NotImplementedError so callers fall
+        back to per-column get_column_statistics calls.
+
+        Args:
+            conn: Database connection
+            table_name: Table name
+            column_names: Column names
+            schema: Schema name
+
+        Returns:
+            Column statistics in the same order as column_names
+
+        Raises:
+            NotImplementedError: If the adapter has no single-scan implementation
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_value_distribution(
         self,
@@ -133,18 +254,26 @@ class BaseAdapter(ABC):
 
     @abstractmethod
     async def get_sample_query(
-        self, table_name: str, schema: Optional[str], limit: int
-    ) -> str:
+        self,
+        conn: ConnectionType,
+        table_name: str,
+        schema: Optional[str],
+        limit: int,
+    ) -> tuple[str, dict[str, Any]]:
         """
         Generate database-specific efficient sampling query.
 
+        The row limit is passed as a bind parameter so the SQL text stays
+        identical across calls for the same table.
+
         Args:
+            conn: Database connection, for adapters that size the sample
             table_name: Table name
             schema: Schema name
             limit: Number of rows to sample
 
         Returns:
-            SQL query for sampling
+            Tuple of (SQL query for sampling, bind parameters)
         """
         ...
 
@@ -153,6 +282,9 @@ class BaseAdapter(ABC):
         """
         Generate database-specific EXPLAIN query.
 
+        EXPLAIN cannot take the explained statement as a bind parameter, so
+        the query text is embedded verbatim and must already be validated.
+
         Args:
             query: Query to explain
             analyze: Whether to use EXPLAIN ANALYZE
@@ -208,10 +340,22 @@ class BaseAdapter(ABC):
 
     def _build_table_reference(self, table_name: str, schema: Optional[str]) -> str:
         """Build qualified table reference with validation and quoting."""
+        key = (schema, table_name)
+        table_ref = self._table_ref_cache.get(key)
+        if table_ref is not None:
+            return table_ref
+
         self._validate_identifier(table_name, "table")
         if schema:
             self._validate_identifier(schema, "schema")
-            return (
+            table_ref = (
                 f"{self._quote_identifier(schema)}.{self._quote_identifier(table_name)}"
             )
-        return self._quote_identifier(table_name)
+        else:
+            table_ref = self._quote_identifier(table_name)
+
+        # Names come from clients, so keep the memo bounded
+        if len(self._table_ref_cache) >= self._TABLE_REF_CACHE_SIZE:
+            del self._table_ref_cache[next(iter(self._table_ref_cache))]
+        self._table_ref_cache[key] = table_ref
+        return table_ref
@@ -1,9 +1,10 @@
 """ClickHouse adapter optimized for analytics workloads."""
 
+from functools import cached_property
 from typing import Any, Optional
 
 import orjson
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from db_connect_mcp.adapters.base import BaseAdapter
@@ -20,7 +21,7 @@ class ClickHouseAdapter(BaseAdapter):
         """ClickHouse uses backtick quoting."""
         return f"`{name}`"
 
-    @property
+    @cached_property
     def capabilities(self) -> DatabaseCapabilities:
         """ClickHouse analytics-focused capabilities."""
         return DatabaseCapabilities(
@@ -64,6 +65,65 @@ class ClickHouseAdapter(BaseAdapter):
 
         return schema_info
 
+    async def enrich_schemas_batch(
+        self, conn: AsyncConnection, schemas: list[SchemaInfo]
+    ) -> list[SchemaInfo]:
+        """Add ClickHouse-specific metadata for many databases in one query."""
+        if not schemas:
+            return schemas
+
+        try:
+            query = text("""
+                SELECT
+                    database,
+                    sum(bytes) as size_bytes
+                FROM system.parts
+                WHERE database IN :schema_names
+                  AND active = 1
+                GROUP BY database
+            """).bindparams(bindparam("schema_names", expanding=True))
+
+            result = await conn.execute(
+                query, {"schema_names": [s.name for s in schemas]}
+            )
+            sizes = {row[0]: row[1] for row in result}
+
+            for schema_info in schemas:
+                if sizes.get(schema_info.name):
+                    schema_info.size_bytes = int(sizes[schema_info.name])
+        except Exception:
+            # Permission denied or table not available
+            # This is common for readonly users, just skip enrichment
+            pass
+
+        return schemas
+
+    async def get_schema_object_counts(
+        self, conn: AsyncConnection, exclude: frozenset[str]
+    ) -> dict[str, tuple[int, int]]:
+        """Count ClickHouse tables per database from system.tables."""
+        # SHOW TABLES, which SQLAlchemy reflection uses, lists views among the
+        # tables and reports no separate views, so neither do these counts.
+        # Unmatched LEFT JOIN rows carry an empty name rather than NULL.
+        query = text("""
+            SELECT
+                d.name,
+                countIf(t.name != '') as table_count
+            FROM system.databases AS d
+            LEFT JOIN (
+                SELECT database, name
+                FROM system.tables
+                WHERE NOT is_temporary
+                  AND database NOT IN :exclude
+            ) AS t ON t.database = d.name
+            WHERE d.name NOT IN :exclude
+            GROUP BY d.name
+            ORDER BY d.name
+        """).bindparams(bindparam("exclude", expanding=True))
+
+        result = await conn.execute(query, {"exclude": sorted(exclude)})
+        return {row[0]: (int(row[1]), 0) for row in result}
+
     async def enrich_table_info(
         self, conn: AsyncConnection, table_info: TableInfo
     ) -> TableInfo:
@@ -180,7 +240,8 @@ class ClickHouseAdapter(BaseAdapter):
         self._validate_identifier(column_name, "column")
         table_ref = self._build_table_reference(table_name, schema)
 
-        # ClickHouse has excellent support for quantiles
+        # ClickHouse has excellent support for quantiles; the most common
+        # values ride along as a scalar subquery so everything is one round trip
         query = text(f"""
             SELECT
                 count() as total_rows,
@@ -195,7 +256,18 @@ class ClickHouseAdapter(BaseAdapter):
                 quantile(0.75)(`{column_name}`) as p75,
                 quantile(0.95)(`{column_name}`) as p95,
                 quantile(0.99)(`{column_name}`) as p99,
-                toTypeName(`{column_name}`) as data_type
+                toTypeName(`{column_name}`) as data_type,
+                (
+                    SELECT arrayReverseSort(x -> x.2, groupArray((value, count)))
+                    FROM (
+                        SELECT toString(`{column_name}`) as value, count() as count
+                        FROM {table_ref}
+                        WHERE `{column_name}` IS NOT NULL
+                        GROUP BY `{column_name}`
+                        ORDER BY count DESC
+                        LIMIT 10
+                    )
+                ) as most_common
             FROM {table_ref}
         """)
 
@@ -213,19 +285,11 @@ class ClickHouseAdapter(BaseAdapter):
                     warning="No data found",
                 )
 
-            # Get most common values
-            mcv_query = text(f"""
-                SELECT `{column_name}` as value, count() as count
-                FROM {table_ref}
-                WHERE `{column_name}` IS NOT NULL
-                GROUP BY `{column_name}`
-                ORDER BY count DESC
-                LIMIT 10
-            """)
-
-            mcv_result = await conn.execute(mcv_query)
-            mcv_rows = mcv_result.fetchall()
-            most_common = [{"value": str(r[0]), "count": int(r[1])} for r in mcv_rows]
+            # Most common values arrive with the aggregates, already
+            # converted to text server-side
+            most_common = [
+                {"value": value, "count": int(count)} for value, count in row[13]
+            ]
 
             # Helper to ensure JSON-serializable values
             def safe_value(val):
@@ -237,7 +301,9 @@ class ClickHouseAdapter(BaseAdapter):
                 except Exception:
                     return str(val)
 
-            return ColumnStats(
+            # Every field below is already coerced to its model type, so
+            # skip Pydantic validation
+            return ColumnStats.model_construct(
                 column=column_name,
                 data_type=str(row[12]),
                 total_rows=int(row[0]),
@@ -313,7 +379,7 @@ class ClickHouseAdapter(BaseAdapter):
                 sample_size=0,
             )
 
-        return Distribution(
+        return Distribution.model_construct(
             column=column_name,
             total_rows=int(stats_row[0]),
             unique_values=int(stats_row[1]),
@@ -323,12 +389,16 @@ class ClickHouseAdapter(BaseAdapter):
         )
 
     async def get_sample_query(
-        self, table_name: str, schema: Optional[str], limit: int
-    ) -> str:
+        self,
+        conn: AsyncConnection,
+        table_name: str,
+        schema: Optional[str],
+        limit: int,
+    ) -> tuple[str, dict[str, Any]]:
         """Generate ClickHouse sampling query with SAMPLE clause."""
         table_ref = self._build_table_reference(table_name, schema)
         # ClickHouse SAMPLE clause for efficient sampling on large datasets
-        return f"SELECT * FROM {table_ref} SAMPLE 0.01 LIMIT {limit}"
+        return f"SELECT * FROM {table_ref} SAMPLE 0.01 LIMIT :limit", {"limit": limit}
 
     async def get_explain_query(self, query: str, analyze: bool) -> str:
         """Generate ClickHouse EXPLAIN query."""
@@ -1,14 +1,13 @@
 """MySQL adapter with good feature support."""
 
-import json
+from functools import cached_property
 from typing import Any, Optional
 
-from sqlalchemy import text
+import orjson
+from sqlalchemy import bindparam, text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from db_connect_mcp.adapters.base import BaseAdapter
-import orjson
-
 from db_connect_mcp.models.capabilities import DatabaseCapabilities
 from db_connect_mcp.models.database import SchemaInfo
 from db_connect_mcp.models.statistics import ColumnStats, Distribution
@@ -22,7 +21,7 @@ class MySQLAdapter(BaseAdapter):
         """MySQL uses backtick quoting."""
         return f"`{name}`"
 
-    @property
+    @cached_property
     def capabilities(self) -> DatabaseCapabilities:
         """MySQL has good but not comprehensive support."""
         return DatabaseCapabilities(
@@ -60,6 +59,74 @@ class MySQLAdapter(BaseAdapter):
 
         return schema_info
 
+    async def enrich_schemas_batch(
+        self, conn: AsyncConnection, schemas: list[SchemaInfo]
+    ) -> list[SchemaInfo]:
+        """Add MySQL-specific metadata for many databases in one query."""
+        if not schemas:
+            return schemas
+
+        query = text("""
+            SELECT
+                table_schema,
+                SUM(data_length + index_length) as size_bytes
+            FROM information_schema.TABLES
+            WHERE table_schema IN :schema_names
+            GROUP BY table_schema
+        """).bindparams(bindparam("schema_names", expanding=True))
+
+        result = await conn.execute(query, {"schema_names": [s.name for s in schemas]})
+        sizes = {row[0]: row[1] for row in result}
+
+        for schema_info in schemas:
+            if sizes.get(schema_info.name):
+                schema_info.size_bytes = int(sizes[schema_info.name])
+
+        return schemas
+
+    async def list_tables(
+        self, conn: AsyncConnection, schema: Optional[str], include_views: bool
+    ) -> list[tuple[str, str]]:
+        """List MySQL tables and views of a database from information_schema."""
+        # Table types match what SHOW FULL TABLES reports to SQLAlchemy
+        query = text("""
+            SELECT TABLE_NAME, TABLE_TYPE = 'VIEW' as is_view
+            FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = COALESCE(:schema_name, DATABASE())
+              AND (
+                TABLE_TYPE IN ('BASE TABLE', 'SYSTEM VERSIONED')
+                OR (:include_views AND TABLE_TYPE = 'VIEW')
+              )
+            ORDER BY is_view, TABLE_NAME
+        """)
+
+        result = await conn.execute(
+            query, {"schema_name": schema, "include_views": include_views}
+        )
+        return [(row[0], "VIEW" if row[1] else "BASE TABLE") for row in result]
+
+    async def get_schema_object_counts(
+        self, conn: AsyncConnection, exclude: frozenset[str]
+    ) -> dict[str, tuple[int, int]]:
+        """Count MySQL tables and views per database from information_schema."""
+        # Table types match what SHOW FULL TABLES reports to SQLAlchemy
+        query = text("""
+            SELECT
+                s.SCHEMA_NAME,
+                COUNT(CASE WHEN t.TABLE_TYPE IN ('BASE TABLE', 'SYSTEM VERSIONED')
+                      THEN 1 END) as table_count,
+                COUNT(CASE WHEN t.TABLE_TYPE = 'VIEW' THEN 1 END) as view_count
+            FROM information_schema.SCHEMATA s
+            LEFT JOIN information_schema.TABLES t
+              ON t.TABLE_SCHEMA = s.SCHEMA_NAME
+            WHERE s.SCHEMA_NAME NOT IN :exclude
+            GROUP BY s.SCHEMA_NAME
+            ORDER BY s.SCHEMA_NAME
+        """).bindparams(bindparam("exclude", expanding=True))
+
+        result = await conn.execute(query, {"exclude": sorted(exclude)})
+        return {row[0]: (int(row[1]), int(row[2])) for row in result}
+
     async def enrich_table_info(
         self, conn: AsyncConnection, table_info: TableInfo
     ) -> TableInfo:
@@ -268,10 +335,15 @@ class MySQLAdapter(BaseAdapter):
             LIMIT :limit
         """)
 
-        top_result = await conn.execute(top_query, {"limit": limit})
-        top_rows = top_result.fetchall()
-
-        top_values = [{"value": str(r[0]), "count": int(r[1])} for r in top_rows]
+        # Stream the top values through a server-side cursor so a large
+        # caller-supplied limit is consumed in batches rather than buffered
+        # by the driver before any row is converted
+        top_result = await conn.stream(
+            top_query, {"limit": limit}, execution_options={"yield_per": 1000}
+        )
+        top_values = [
+            {"value": str(r[0]), "count": int(r[1])} async for r in top_result
+        ]
 
         if not stats_row:
             return Distribution(
@@ -293,11 +365,15 @@ class MySQLAdapter(BaseAdapter):
         )
 
     async def get_sample_query(
-        self, table_name: str, schema: Optional[str], limit: int
-    ) -> str:
+        self,
+        conn: AsyncConnection,
+        table_name: str,
+        schema: Optional[str],
+        limit: int,
+    ) -> tuple[str, dict[str, Any]]:
         """Generate MySQL sampling query."""
         table_ref = self._build_table_reference(table_name, schema)
-        return f"SELECT * FROM {table_ref} LIMIT {limit}"
+        return f"SELECT * FROM {table_ref} LIMIT :limit", {"limit": limit}
 
     async def get_explain_query(self, query: str, analyze: bool) -> str:
         """Generate MySQL EXPLAIN query."""
@@ -310,7 +386,7 @@ class MySQLAdapter(BaseAdapter):
     ) -> dict[str, Any]:
         """Parse MySQL EXPLAIN output."""
         try:
-            plan_data = json.loads(plan_text)
+            plan_data = orjson.loads(plan_text)
 
             result: dict[str, Any] = {
                 "json": plan_data,
@@ -336,7 +412,7 @@ class MySQLAdapter(BaseAdapter):
 
             return result
 
-        except (json.JSONDecodeError, KeyError):
+        except (orjson.JSONDecodeError, KeyError):
             pass
 
         return {
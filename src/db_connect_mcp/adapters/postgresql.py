@@ -1,9 +1,12 @@
 """PostgreSQL adapter with full feature support."""
 
-import json
-from typing import Any, Optional
+import time
+from bisect import bisect_right
+from functools import cached_property, lru_cache
+from typing import Any, NamedTuple, Optional
 
-from sqlalchemy import text
+import orjson
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from db_connect_mcp.adapters.base import BaseAdapter
@@ -13,10 +16,571 @@ from db_connect_mcp.models.statistics import ColumnStats, Distribution
 from db_connect_mcp.models.table import ColumnInfo, TableInfo
 
 
+# Aggregate outputs per column in the statistics query, after total_rows
+_AGGREGATES_PER_COLUMN = 11
+
+# Percentiles reported for numeric columns
+_PERCENTILES = (0.25, 0.50, 0.75, 0.95, 0.99)
+
+
+class _CatalogColumn(NamedTuple):
+    """Catalog facts about a column, including planner statistics if any."""
+
+    data_type: str
+    is_numeric: bool
+    # pg_stats.n_distinct: a count when >= 0, minus the distinct/row ratio
+    # when negative, None when the column has never been analyzed
+    n_distinct: Optional[float]
+    mcv_values: Optional[list[str]]
+    mcv_freqs: Optional[list[float]]
+    # _PERCENTILES estimated from the pg_stats histogram, numeric columns only
+    percentiles: Optional[tuple[float, ...]]
+
+
+class _StatsColumn(NamedTuple):
+    """How one column is aggregated by ``_column_stats_query``."""
+
+    column: str  # quoted identifier
+    is_numeric: bool
+    exact_distinct: bool
+    scan_mcv: bool
+    exact_percentiles: bool
+
+
+# Keyed on already-validated, quoted identifiers so repeated calls for the same
+# column reuse one TextClause (and therefore one SQLAlchemy compiled-cache entry
+# / asyncpg prepared statement) instead of rebuilding the SQL every time.
+@lru_cache(maxsize=256)
+def _column_stats_query(
+    table_ref: str,
+    columns: tuple[_StatsColumn, ...],
+    sample_mcv: bool,
+    sample_stats: bool = False,
+) -> TextClause:
+    """Build the statistics query for one or more columns of a table.
+
+    Distinct counts, most common values and percentiles already known from
+    pg_stats are not recomputed; their slots come back NULL instead of paying
+    for ``COUNT(DISTINCT)``, ``GROUP BY`` or sort work. All aggregates are
+    computed in a single scan of the table and each column's top-10 most
+    common values come back as a JSON array, so the result is one row:
+    ``total_rows``, then ``_AGGREGATES_PER_COLUMN`` aggregates per column,
+    then one most-common-values array per column. With ``sample_mcv`` the
+    most-common-values scans run over ``TABLESAMPLE SYSTEM (:percent)`` and
+    their counts are scaled by ``:scale`` to estimate full-table counts. With
+    ``sample_stats`` the aggregates themselves read a
+    ``TABLESAMPLE SYSTEM (:stats_percent)`` block sample.
+    """
+    stats_source = (
+        f"{table_ref} TABLESAMPLE SYSTEM (CAST(:stats_percent AS float4)) REPEATABLE (42)"
+        if sample_stats
+        else table_ref
+    )
+    if sample_mcv:
+        mcv_source = (
+            f"{table_ref} TABLESAMPLE SYSTEM (CAST(:percent AS float4)) REPEATABLE (42)"
+        )
+        mcv_count = "round(COUNT(*) * CAST(:scale AS float8))::bigint"
+    else:
+        mcv_source = table_ref
+        mcv_count = "COUNT(*)"
+
+    aggregates = []
+    mcv_ctes = []
+    mcv_columns = []
+    for i, (
+        column,
+        is_numeric,
+        exact_distinct,
+        scan_mcv,
+        exact_percentiles,
+    ) in enumerate(columns):
+        prefix = f"c{i}_"
+        if is_numeric:
+            # Full numeric statistics with percentiles
+            value_stats = f"""
+                MIN({column}) as {prefix}min_val,
+                MAX({column}) as {prefix}max_val,
+                AVG({column})::float as {prefix}avg_val,
+                STDDEV({column})::float as {prefix}stddev_val,"""
+            for fraction in _PERCENTILES:
+                name = f"{prefix}p{round(fraction * 100)}"
+                if exact_percentiles:
+                    value_stats += f"""
+                PERCENTILE_CONT({fraction:.2f}) WITHIN GROUP (ORDER BY {column}) as {name},"""
+                else:
+                    value_stats += f"""
+                NULL::float8 as {name},"""
+            value_stats = value_stats.rstrip(",")
+        else:
+            # Basic statistics for non-numeric types
+            value_stats = f"""
+                MIN({column})::text as {prefix}min_val,
+                MAX({column})::text as {prefix}max_val,
+                NULL::float as {prefix}avg_val,
+                NULL::float as {prefix}stddev_val,
+                NULL as {prefix}p25,
+                NULL as {prefix}p50,
+                NULL as {prefix}p75,
+                NULL as {prefix}p95,
+                NULL as {prefix}p99"""
+
+        distinct = f"COUNT(DISTINCT {column})" if exact_distinct else "NULL::bigint"
+        aggregates.append(f"""
+                COUNT({column}) as {prefix}non_null,
+                {distinct} as {prefix}distinct_count,{value_stats}""")
+        if not scan_mcv:
+            mcv_columns.append(f"""
+            NULL::json as {prefix}most_common""")
+            continue
+        mcv_ctes.append(f"""
+        mcv_{i} AS (
+            SELECT {column}::text as value, {mcv_count} as count
+            FROM {mcv_source}
+            WHERE {column} IS NOT NULL
+            GROUP BY {column}
+            ORDER BY COUNT(*) DESC
+            LIMIT 10
+        )""")
+        mcv_columns.append(f"""
+            (
+                SELECT json_agg(
+                    json_build_object('value', m.value, 'count', m.count)
+                    ORDER BY m.count DESC
+                )
+                FROM mcv_{i} m
+            ) as {prefix}most_common""")
+
+    return text(f"""
+        WITH stats AS (
+            SELECT
+                COUNT(*) as total_rows,{",".join(aggregates)}
+            FROM {stats_source}
+        ){"".join("," + cte for cte in mcv_ctes)}
+        SELECT
+            s.*,{",".join(mcv_columns)}
+        FROM stats s
+    """)
+
+
+def _json_safe(val: Any) -> Any:
+    """Convert value to JSON-safe format."""
+    if val is None:
+        return None
+    # Try to serialize with orjson, fallback to str
+    try:
+        orjson.dumps(val)
+        return val
+    except Exception:
+        return str(val)
+
+
+def _histogram_percentiles(
+    bounds: list[float],
+    null_frac: float,
+    mcv_values: list[float],
+    mcv_freqs: list[float],
+) -> Optional[tuple[float, ...]]:
+    """Estimate ``_PERCENTILES`` of the non-null values from pg_stats.
+
+    ANALYZE describes the non-null rows as point masses at the most common
+    values plus an equi-depth histogram over the rest, each bucket holding
+    the same share of rows. Walking that cumulative distribution gives the
+    percentiles without sorting the table.
+    """
+    non_null = 1.0 - null_frac
+    if len(bounds) < 2 or non_null <= 0:
+        return None
+
+    buckets = len(bounds) - 1
+    bucket_mass = max(non_null - sum(mcv_freqs), 0.0) / buckets
+    point_mass: dict[float, float] = {}
+    for value, freq in zip(mcv_values, mcv_freqs):
+        point_mass[value] = point_mass.get(value, 0.0) + freq
+
+    def histogram_cdf(x: float) -> float:
+        k = bisect_right(bounds, x) - 1
+        if k < 0:
+            return 0.0
+        if k >= buckets:
+            return bucket_mass * buckets
+        width = bounds[k + 1] - bounds[k]
+        return bucket_mass * (k + ((x - bounds[k]) / width if width else 1.0))
+
+    # (value, cumulative mass below it, cumulative mass including it); the
+    # distribution is linear between consecutive knots
+    knots = []
+    passed = 0.0
+    for x in sorted(set(bounds) | point_mass.keys()):
+        below = histogram_cdf(x) + passed
+        passed += point_mass.get(x, 0.0)
+        knots.append((x, below, below + point_mass.get(x, 0.0)))
+
+    percentiles = []
+    for fraction in _PERCENTILES:
+        target = fraction * non_null
+        estimate = knots[-1][0]
+        previous = knots[0]
+        for knot in knots:
+            x, below, including = knot
+            if including >= target:
+                estimate = x
+                if below > target and below > previous[2]:
+                    # Inside the histogram stretch leading up to this knot
+                    px, _, p_including = previous
+                    estimate = px + (x - px) * (target - p_including) / (
+                        below - p_including
+                    )
+                break
+            previous = knot
+        percentiles.append(float(estimate))
+
+    return tuple(percentiles)
+
+
+def _estimated_distinct(n_distinct: float, total_rows: int) -> int:
+    """Turn pg_stats.n_distinct into a count; negatives are a ratio of rows."""
+    if n_distinct >= 0:
+        return int(n_distinct)
+    return round(-n_distinct * total_rows)
+
+
+def _column_stats_from_row(
+    row: Any,
+    index: int,
+    column_count: int,
+    column_name: str,
+    catalog: _CatalogColumn,
+    sample_warning: Optional[str],
+    population_rows: Optional[int] = None,
+) -> ColumnStats:
+    """Slice one column's statistics out of a ``_column_stats_query`` row.
+
+    Distinct counts, most common values and percentiles come from pg_stats
+    when the column has been analyzed, scaled to the row count of this scan.
+    When the aggregates ran over a block sample, ``population_rows`` is the
+    table's estimated size: NULL counts are scaled up to it and the scanned
+    row count is reported as the sample size.
+    """
+    sample_size = int(row[0])
+    total_rows = population_rows if population_rows is not None else sample_size
+    base = 1 + index * _AGGREGATES_PER_COLUMN
+    (
+        non_null,
+        distinct_count,
+        min_val,
+        max_val,
+        avg_val,
+        stddev_val,
+        p25,
+        p50,
+        p75,
+        p95,
+        p99,
+    ) = row[base : base + _AGGREGATES_PER_COLUMN]
+    # NULLs are derived from the row count rather than aggregated separately
+    null_count = sample_size - int(non_null)
+
+    notes = []
+    if population_rows is not None:
+        null_count = round(null_count * total_rows / sample_size) if sample_size else 0
+        notes.append(
+            f"Statistics computed from a sample of {sample_size:,} of "
+            f"~{total_rows:,} rows"
+        )
+
+    if catalog.percentiles is not None:
+        p25, p50, p75, p95, p99 = catalog.percentiles
+        notes.append("Percentiles estimated from pg_stats histogram")
+
+    if catalog.n_distinct is not None:
+        distinct_count = _estimated_distinct(catalog.n_distinct, total_rows)
+        notes.append("Distinct count estimated from pg_stats")
+    elif population_rows is not None:
+        notes.append("Distinct count covers the sampled rows only")
+
+    if catalog.mcv_values and catalog.mcv_freqs:
+        most_common = [
+            {"value": value, "count": round(freq * total_rows)}
+            for value, freq in zip(catalog.mcv_values, catalog.mcv_freqs)
+        ][:10]
+        notes.append("Most common values estimated from pg_stats")
+    else:
+        # Values were converted to text server-side for consistency
+        mcv_json = row[1 + column_count * _AGGREGATES_PER_COLUMN + index]
+        most_common = orjson.loads(mcv_json) if mcv_json else []
+        if sample_warning:
+            notes.append(sample_warning)
+
+    # Every field below is already coerced to its model type, so skip
+    # Pydantic validation
+    return ColumnStats.model_construct(
+        column=column_name,
+        data_type=catalog.data_type,
+        total_rows=total_rows,
+        null_count=null_count,
+        distinct_count=int(distinct_count) if distinct_count else None,
+        min_value=_json_safe(min_val),
+        max_value=_json_safe(max_val),
+        avg_value=float(avg_val) if avg_val is not None else None,
+        stddev_value=float(stddev_val) if stddev_val is not None else None,
+        percentile_25=_json_safe(p25),
+        median_value=_json_safe(p50),
+        percentile_75=_json_safe(p75),
+        percentile_95=_json_safe(p95),
+        percentile_99=_json_safe(p99),
+        most_common_values=most_common,
+        sample_size=sample_size,
+        warning="; ".join(notes) or None,
+    )
+
+
+@lru_cache(maxsize=256)
+def _value_distribution_query(
+    table_ref: str, column: str, exact_distinct: bool
+) -> TextClause:
+    """Build the value distribution query; the row limit is a bind parameter.
+
+    Top values come back as parallel text and bigint arrays, which the driver
+    decodes natively, rather than as JSON to be parsed again client-side.
+
+    Without ``exact_distinct`` the unique value count is left NULL for the
+    caller to fill in from pg_stats.
+    """
+    distinct = f"COUNT(DISTINCT {column})" if exact_distinct else "NULL::bigint"
+    return text(f"""
+        WITH stats AS (
+            SELECT
+                COUNT(*) as total_rows,
+                {distinct} as unique_values,
+                COUNT({column}) as non_null
+            FROM {table_ref}
+        ),
+        top_values AS (
+            SELECT {column} as value, COUNT(*) as count
+            FROM {table_ref}
+            WHERE {column} IS NOT NULL
+            GROUP BY {column}
+            ORDER BY count DESC
+            LIMIT :limit
+        )
+        SELECT
+            s.total_rows,
+            s.unique_values,
+            s.non_null,
+            -- Identical sort keys keep the two arrays aligned on ties
+            array_agg(t.value::text ORDER BY t.count DESC, t.value::text)
+                FILTER (WHERE t.count IS NOT NULL) as top_values,
+            array_agg(t.count ORDER BY t.count DESC, t.value::text)
+                FILTER (WHERE t.count IS NOT NULL) as top_counts
+        FROM stats s
+        LEFT JOIN top_values t ON true
+        GROUP BY s.total_rows, s.unique_values, s.non_null
+    """)
+
+
+# Catalog statements are fixed text, built once at import so every call hits
+# the same SQLAlchemy compiled-cache entry and asyncpg prepared statement
+
+_SCHEMA_ENRICH_COLUMNS = """
+        pg_catalog.pg_get_userbyid(n.nspowner) as owner,
+        pg_catalog.obj_description(n.oid, 'pg_namespace') as comment,
+        (
+            SELECT SUM(pg_total_relation_size(c.oid))::bigint
+            FROM pg_catalog.pg_class c
+            WHERE c.relnamespace = n.oid
+              AND c.relkind IN ('r', 'p')
+        ) as size_bytes"""
+
+_SCHEMA_ENRICH_SQL = text(f"""
+    SELECT{_SCHEMA_ENRICH_COLUMNS}
+    FROM pg_catalog.pg_namespace n
+    WHERE n.nspname = :schema_name
+""")
+
+# The same metadata for several schemas at once
+_SCHEMAS_ENRICH_SQL = text(f"""
+    SELECT
+        n.nspname as schema_name,{_SCHEMA_ENRICH_COLUMNS}
+    FROM pg_catalog.pg_namespace n
+    WHERE n.nspname = ANY(CAST(:schema_names AS text[]))
+""")
+
+# Tables and views per schema, counted like SQLAlchemy's get_table_names and
+# get_view_names: no temporary relations, no pg_* schemas
+_SCHEMA_COUNTS_SQL = text("""
+    SELECT
+        n.nspname as schema_name,
+        count(c.oid) FILTER (WHERE c.relkind IN ('r', 'p')) as table_count,
+        count(c.oid) FILTER (WHERE c.relkind = 'v') as view_count
+    FROM pg_catalog.pg_namespace n
+    LEFT JOIN pg_catalog.pg_class c
+      ON c.relnamespace = n.oid
+     AND c.relkind IN ('r', 'p', 'v')
+     AND c.relpersistence != 't'
+    WHERE n.nspname NOT LIKE 'pg_%'
+      AND n.nspname <> ALL(CAST(:exclude AS text[]))
+    GROUP BY n.nspname
+    ORDER BY n.nspname
+""")
+
+_TABLE_SIZE_COLUMNS = """
+        pg_total_relation_size(c.oid)::bigint as total_size,
+        pg_relation_size(c.oid)::bigint as table_size,
+        pg_indexes_size(c.oid)::bigint as indexes_size,
+        c.reltuples::bigint as row_count"""
+
+# Sizes only, for when the slower moving catalog facts are still cached
+_TABLE_SIZE_SQL = text(f"""
+    SELECT{_TABLE_SIZE_COLUMNS}
+    FROM pg_catalog.pg_class c
+    WHERE c.oid = CAST(CAST(:table_ident AS text) AS regclass)
+""")
+
+_TABLE_INFO_SQL = text(f"""
+    SELECT{_TABLE_SIZE_COLUMNS},
+        obj_description(c.oid, 'pg_class') as comment,
+        c.relkind::text as table_kind,
+        c.relpersistence::text as persistence,
+        c.relispartition as is_partition
+    FROM pg_catalog.pg_class c
+    WHERE c.oid = CAST(CAST(:table_ident AS text) AS regclass)
+""")
+
+# Tables and optionally views of one schema, listed like SQLAlchemy's
+# get_table_names and get_view_names: no temporary relations. Also returns
+# everything _TABLE_INFO_SQL does, so listing fills the enrichment caches.
+_TABLE_LIST_SQL = text(f"""
+    SELECT
+        n.nspname as schema_name,
+        c.relname as table_name,
+        c.relkind = 'v' as is_view,{_TABLE_SIZE_COLUMNS},
+        obj_description(c.oid, 'pg_class') as comment,
+        c.relkind::text as table_kind,
+        c.relpersistence::text as persistence,
+        c.relispartition as is_partition
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = COALESCE(CAST(:schema_name AS text), current_schema())
+      AND (
+        c.relkind IN ('r', 'p')
+        OR (CAST(:include_views AS boolean) AND c.relkind = 'v')
+      )
+      AND c.relpersistence != 't'
+    ORDER BY is_view, c.relname
+""")
+
+# Everything _TABLE_INFO_SQL returns, for many relations of one schema at once
+_TABLES_INFO_SQL = text(f"""
+    SELECT c.relname as table_name,{_TABLE_SIZE_COLUMNS},
+        obj_description(c.oid, 'pg_class') as comment,
+        c.relkind::text as table_kind,
+        c.relpersistence::text as persistence,
+        c.relispartition as is_partition
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = :schema_name
+      AND c.relname = ANY(CAST(:table_names AS text[]))
+""")
+
+_SAMPLE_SIZING_SQL = text("""
+    SELECT
+        EXISTS (
+            SELECT 1 FROM pg_catalog.pg_extension
+            WHERE extname = 'tsm_system_rows'
+        ) as has_system_rows,
+        c.reltuples::float8 as estimated_rows,
+        c.relkind::text as relkind
+    FROM pg_catalog.pg_class c
+    WHERE c.oid = CAST(CAST(:table_ident AS text) AS regclass)
+""")
+
+# Relation kinds TABLESAMPLE accepts: ordinary tables and materialized views
+_SAMPLEABLE_RELKINDS = frozenset({"r", "m"})
+
+# Rows a Bernoulli sample aims for beyond twice the limit. The sample size
+# varies around its expectation, and the margin keeps the chance of falling
+# short of the limit negligible even for small limits.
+_SAMPLE_MARGIN_ROWS = 100
+
+_COLUMN_COMMENTS_SQL = text("""
+    SELECT
+        a.attname as column_name,
+        col_description(a.attrelid, a.attnum) as comment
+    FROM pg_attribute a
+    WHERE a.attrelid = CAST(CAST(:table_ident AS text) AS regclass)
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+      AND col_description(a.attrelid, a.attnum) IS NOT NULL
+""")
+
+_COLUMN_CATALOG_SQL = text("""
+    SELECT
+        a.attname as column_name,
+        format_type(a.atttypid, NULL) as data_type,
+        t.typcategory::text as type_category,
+        c.reltuples::float8 as estimated_rows,
+        s.n_distinct::float8 as n_distinct,
+        s.most_common_vals::text::text[] as mcv_values,
+        s.most_common_freqs::float8[] as mcv_freqs,
+        s.null_frac::float8 as null_frac,
+        s.histogram_bounds::text::text[] as histogram_bounds,
+        -- reltuples alone is not proof (0 before the first ANALYZE on old
+        -- servers); a heap with no pages is. Views and partitioned parents
+        -- have no storage of their own, so only tables and matviews qualify
+        c.relkind IN ('r', 'm') AND pg_relation_size(c.oid) = 0 as is_empty
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_catalog.pg_type t ON t.oid = a.atttypid
+    LEFT JOIN pg_catalog.pg_stats s
+      ON s.schemaname = n.nspname
+     AND s.tablename = c.relname
+     AND s.attname = a.attname
+     -- Partitioned parents only carry whole-hierarchy statistics
+     AND s.inherited = (c.relkind = 'p')
+    WHERE n.nspname = :schema_name
+      AND c.relname = :table_name
+      AND a.attname = ANY(:column_names)
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+""")
+
+
 class PostgresAdapter(BaseAdapter):
     """PostgreSQL adapter with comprehensive feature support."""
 
-    @property
+    # A failed statement aborts the open transaction
+    errors_abort_transaction = True
+
+    # Tables estimated above this many rows get their most common values from
+    # a TABLESAMPLE scan sized to roughly this many rows
+    _MCV_SAMPLE_ROWS = 100_000
+
+    # Tables estimated above _STATS_SAMPLE_THRESHOLD rows get all their
+    # aggregates from a TABLESAMPLE scan of roughly _STATS_SAMPLE_ROWS rows
+    _STATS_SAMPLE_THRESHOLD = 10_000_000
+    _STATS_SAMPLE_ROWS = 1_000_000
+
+    # pg_type.typcategory code for numeric types
+    _NUMERIC_TYPCATEGORY = "N"
+
+    # Seconds cached pg_class facts stay fresh. Relation kind, persistence and
+    # comment rarely change while a schema is being explored; sizes and row
+    # estimates move with the data, so they expire much sooner
+    _CATALOG_TTL = 60.0
+    _SIZE_TTL = 5.0
+
+    # Tables each of those caches holds at most; the stalest entry is evicted
+    _TABLE_CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
+        super().__init__()
+        # (schema, table) -> (fetched at, values), see _CATALOG_TTL/_SIZE_TTL
+        self._catalog_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        self._size_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+
+    @cached_property
     def capabilities(self) -> DatabaseCapabilities:
         """PostgreSQL supports all features."""
         return DatabaseCapabilities(
@@ -39,93 +603,105 @@ class PostgresAdapter(BaseAdapter):
         self, conn: AsyncConnection, schema_info: SchemaInfo
     ) -> SchemaInfo:
         """Add PostgreSQL-specific schema metadata."""
-        query = text("""
-            SELECT
-                pg_catalog.pg_get_userbyid(n.nspowner) as owner,
-                pg_catalog.obj_description(n.oid, 'pg_namespace') as comment
-            FROM pg_catalog.pg_namespace n
-            WHERE n.nspname = :schema_name
-        """)
-
-        result = await conn.execute(query, {"schema_name": schema_info.name})
-        row = result.fetchone()
+        # Owner, comment and total size come back in one round trip. Table
+        # sizes are summed by pg_class oid (the same relations pg_tables
+        # lists) so no per-table name is rebuilt and re-parsed as a regclass.
+        result = await conn.execute(
+            _SCHEMA_ENRICH_SQL, {"schema_name": schema_info.name}
+        )
+        row = result.mappings().fetchone()
 
         if row:
-            schema_info.owner = row[0]
-            schema_info.comment = row[1]
+            schema_info.owner = row["owner"]
+            schema_info.comment = row["comment"]
+            if row["size_bytes"]:
+                schema_info.size_bytes = row["size_bytes"]
 
-        # Get schema size
-        size_query = text("""
-            SELECT SUM(pg_total_relation_size(quote_ident(schemaname) || '.' || quote_ident(tablename)))::bigint
-            FROM pg_tables
-            WHERE schemaname = :schema_name
-        """)
+        return schema_info
 
-        result = await conn.execute(size_query, {"schema_name": schema_info.name})
-        row = result.fetchone()
-        if row and row[0]:
-            schema_info.size_bytes = int(row[0])
+    async def enrich_schemas_batch(
+        self, conn: AsyncConnection, schemas: list[SchemaInfo]
+    ) -> list[SchemaInfo]:
+        """Add PostgreSQL-specific metadata for many schemas in one query."""
+        if not schemas:
+            return schemas
 
-        return schema_info
+        result = await conn.execute(
+            _SCHEMAS_ENRICH_SQL, {"schema_names": [s.name for s in schemas]}
+        )
+        rows = {row["schema_name"]: row for row in result.mappings()}
+
+        for schema_info in schemas:
+            row = rows.get(schema_info.name)
+            if row:
+                schema_info.owner = row["owner"]
+                schema_info.comment = row["comment"]
+                if row["size_bytes"]:
+                    schema_info.size_bytes = row["size_bytes"]
+
+        return schemas
+
+    async def list_tables(
+        self, conn: AsyncConnection, schema: Optional[str], include_views: bool
+    ) -> list[tuple[str, str]]:
+        """List PostgreSQL tables and views of a schema from pg_class.
+
+        The sizes and catalog facts read alongside are cached, so enriching
+        the listed tables right after needs no further query.
+        """
+        result = await conn.execute(
+            _TABLE_LIST_SQL,
+            {"schema_name": schema, "include_views": include_views},
+        )
+
+        now = time.monotonic()
+        tables = []
+        for row in result.mappings():
+            key = (row["schema_name"], row["table_name"])
+            self._store_table_row(key, row, now, None)
+            tables.append(
+                (row["table_name"], "VIEW" if row["is_view"] else "BASE TABLE")
+            )
+        return tables
+
+    async def get_schema_object_counts(
+        self, conn: AsyncConnection, exclude: frozenset[str]
+    ) -> dict[str, tuple[int, int]]:
+        """Count PostgreSQL tables and views per schema from pg_class."""
+        result = await conn.execute(_SCHEMA_COUNTS_SQL, {"exclude": sorted(exclude)})
+        return {row[0]: (int(row[1]), int(row[2])) for row in result}
 
     async def enrich_table_info(
         self, conn: AsyncConnection, table_info: TableInfo
     ) -> TableInfo:
         """Add PostgreSQL-specific table metadata."""
-        # Build schema-qualified table name for regclass casting
-        # Must use format string, not parameter binding, for regclass
+        # The quoted, schema-qualified name is bound as text and cast to
+        # regclass server-side, so the SQL text is the same for every table
+        # and asyncpg reuses one prepared statement per connection
         schema_name = table_info.schema or "public"
         self._validate_identifier(schema_name, "schema")
         self._validate_identifier(table_info.name, "table")
         table_ident = f'"{schema_name}"."{table_info.name}"'
 
-        # Use format string for regclass casting (parameter binding doesn't work with ::regclass)
-        query = text(f"""
-            SELECT
-                pg_total_relation_size('{table_ident}'::regclass)::bigint as total_size,
-                pg_relation_size('{table_ident}'::regclass)::bigint as table_size,
-                pg_indexes_size('{table_ident}'::regclass)::bigint as indexes_size,
-                (SELECT reltuples::bigint FROM pg_class WHERE oid = '{table_ident}'::regclass::oid) as row_count,
-                obj_description('{table_ident}'::regclass, 'pg_class') as comment
-        """)
+        key = (schema_name, table_info.name)
+        now = time.monotonic()
+        catalog = self._cached(self._catalog_cache, key, self._CATALOG_TTL, now)
+        sizes = self._cached(self._size_cache, key, self._SIZE_TTL, now)
 
+        # pg_class already carries reltuples and the extras, so sizes, comment
+        # and relation kind all come back in one round trip. While the slower
+        # moving catalog facts are cached only the sizes are re-read.
         try:
-            result = await conn.execute(query)
-            row = result.fetchone()
+            if catalog is None or sizes is None:
+                query = _TABLE_SIZE_SQL if catalog else _TABLE_INFO_SQL
+                result = await conn.execute(query, {"table_ident": table_ident})
+                row = result.mappings().fetchone()
 
-            if row:
-                table_info.size_bytes = int(row[1]) if row[1] else None
-                table_info.index_size_bytes = int(row[2]) if row[2] else None
-                table_info.row_count = int(row[3]) if row[3] else None
-                table_info.comment = row[4]
-
-            # Add PostgreSQL-specific extras
-            extras_query = text("""
-                SELECT
-                    c.relkind as table_kind,
-                    c.relpersistence as persistence,
-                    c.relispartition as is_partition
-                FROM pg_class c
-                JOIN pg_namespace n ON n.oid = c.relnamespace
-                WHERE c.relname = :table_name
-                  AND n.nspname = COALESCE(:schema_name, 'public')
-            """)
-
-            result = await conn.execute(
-                extras_query,
-                {"table_name": table_info.name, "schema_name": table_info.schema},
-            )
-            row = result.fetchone()
+                if row:
+                    sizes, catalog = self._store_table_row(key, row, now, catalog)
 
-            if row:
-                # PostgreSQL "char" type comes back as bytes, decode to string
-                table_info.extra_info["relkind"] = (
-                    row[0].decode("utf-8") if isinstance(row[0], bytes) else row[0]
-                )
-                table_info.extra_info["persistence"] = (
-                    row[1].decode("utf-8") if isinstance(row[1], bytes) else row[1]
-                )
-                table_info.extra_info["is_partition"] = row[2]
+            if catalog is not None and sizes is not None:
+                self._apply_table_info(table_info, catalog, sizes)
 
         except Exception as e:
             # Log the error for debugging but don't fail completely
@@ -137,6 +713,127 @@ class PostgresAdapter(BaseAdapter):
 
         return table_info
 
+    async def enrich_tables_batch(
+        self, conn: AsyncConnection, tables: list[TableInfo]
+    ) -> list[TableInfo]:
+        """Add PostgreSQL-specific metadata for many tables in one query.
+
+        Tables whose cache entries are stale are read from pg_class together,
+        one round trip per schema, and the results go through the same caches
+        as enrich_table_info.
+        """
+        now = time.monotonic()
+        stale: dict[str, list[str]] = {}
+        for table_info in tables:
+            schema_name = table_info.schema or "public"
+            self._validate_identifier(schema_name, "schema")
+            self._validate_identifier(table_info.name, "table")
+            key = (schema_name, table_info.name)
+            if (
+                self._cached(self._catalog_cache, key, self._CATALOG_TTL, now) is None
+                or self._cached(self._size_cache, key, self._SIZE_TTL, now) is None
+            ):
+                stale.setdefault(schema_name, []).append(table_info.name)
+
+        try:
+            for schema_name, table_names in stale.items():
+                result = await conn.execute(
+                    _TABLES_INFO_SQL,
+                    {"schema_name": schema_name, "table_names": table_names},
+                )
+                for row in result.mappings():
+                    key = (schema_name, row["table_name"])
+                    self._store_table_row(key, row, now, None)
+
+        except Exception as e:
+            # Fall back to per-table enrichment, which logs its own failures
+            import logging
+
+            logging.getLogger(__name__).warning(
+                f"Failed to batch enrich tables, enriching one at a time: {e}"
+            )
+            return [await self.enrich_table_info(conn, table) for table in tables]
+
+        for table_info in tables:
+            key = (table_info.schema or "public", table_info.name)
+            catalog = self._cached(self._catalog_cache, key, self._CATALOG_TTL, now)
+            sizes = self._cached(self._size_cache, key, self._SIZE_TTL, now)
+            if catalog is not None and sizes is not None:
+                self._apply_table_info(table_info, catalog, sizes)
+
+        return tables
+
+    def _store_table_row(
+        self,
+        key: tuple[str, str],
+        row: Any,
+        now: float,
+        catalog: Optional[dict[str, Any]],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Cache the sizes, and the catalog facts unless already cached."""
+        sizes = {
+            "table_size": row["table_size"],
+            "indexes_size": row["indexes_size"],
+            "row_count": row["row_count"],
+        }
+        self._store(self._size_cache, key, now, sizes)
+        if catalog is None:
+            catalog = {
+                "comment": row["comment"],
+                "table_kind": row["table_kind"],
+                "persistence": row["persistence"],
+                "is_partition": row["is_partition"],
+            }
+            self._store(self._catalog_cache, key, now, catalog)
+        return sizes, catalog
+
+    @staticmethod
+    def _apply_table_info(
+        table_info: TableInfo, catalog: dict[str, Any], sizes: dict[str, Any]
+    ) -> None:
+        """Copy cached sizes and catalog facts onto table_info."""
+        table_info.size_bytes = sizes["table_size"] or None
+        table_info.index_size_bytes = sizes["indexes_size"] or None
+        table_info.row_count = sizes["row_count"] or None
+        table_info.comment = catalog["comment"]
+
+        # Add PostgreSQL-specific extras. "char" columns are cast to
+        # text in SQL; asyncpg would otherwise return them as bytes
+        table_info.extra_info["relkind"] = catalog["table_kind"]
+        table_info.extra_info["persistence"] = catalog["persistence"]
+        table_info.extra_info["is_partition"] = catalog["is_partition"]
+
+    @staticmethod
+    def _cached(
+        cache: dict[tuple[str, str], tuple[float, dict[str, Any]]],
+        key: tuple[str, str],
+        ttl: float,
+        now: float,
+    ) -> Optional[dict[str, Any]]:
+        """Return a cache entry younger than ttl seconds, else None."""
+        entry = cache.get(key)
+        if entry is None or now - entry[0] > ttl:
+            return None
+        return entry[1]
+
+    @classmethod
+    def _store(
+        cls,
+        cache: dict[tuple[str, str], tuple[float, dict[str, Any]]],
+        key: tuple[str, str],
+        now: float,
+        values: dict[str, Any],
+    ) -> None:
+        """Cache values fetched at now, evicting the stalest entry when full.
+
+        Re-inserting a refreshed key moves it to the end, so entries stay in
+        fetch order and the first one is always the stalest.
+        """
+        cache.pop(key, None)
+        if len(cache) >= cls._TABLE_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = (now, values)
+
     async def enrich_column_comments(
         self,
         conn: AsyncConnection,
@@ -150,24 +847,13 @@ class PostgresAdapter(BaseAdapter):
         self._validate_identifier(table_name, "table")
         table_ident = f'"{schema_name}"."{table_name}"'
 
-        # Query column comments from pg_description
-        query = text(f"""
-            SELECT
-                a.attname as column_name,
-                col_description(a.attrelid, a.attnum) as comment
-            FROM pg_attribute a
-            WHERE a.attrelid = '{table_ident}'::regclass
-              AND a.attnum > 0
-              AND NOT a.attisdropped
-              AND col_description(a.attrelid, a.attnum) IS NOT NULL
-        """)
-
         try:
-            result = await conn.execute(query)
-            rows = result.fetchall()
+            result = await conn.execute(
+                _COLUMN_COMMENTS_SQL, {"table_ident": table_ident}
+            )
 
-            # Build lookup dict
-            comments = {row[0]: row[1] for row in rows}
+            # Build lookup dict from (column_name, comment) rows
+            comments = dict(result.tuples().all())
 
             # Update columns with comments
             for col in columns:
@@ -183,121 +869,161 @@ class PostgresAdapter(BaseAdapter):
 
         return columns
 
-    async def get_column_statistics(
+    async def _resolve_columns(
         self,
         conn: AsyncConnection,
         table_name: str,
-        column_name: str,
+        column_names: list[str],
         schema: Optional[str],
-    ) -> ColumnStats:
-        """Get comprehensive PostgreSQL column statistics."""
-        self._validate_identifier(column_name, "column")
-        table_ref = self._build_table_reference(table_name, schema)
+    ) -> tuple[dict[str, _CatalogColumn], float, bool]:
+        """Look up column types, planner statistics and estimated row count.
+
+        Resolves each column's type and pg_type category from the system
+        catalogs, along with any n_distinct and most common values ANALYZE
+        left in pg_stats. This is an indexed lookup that never touches the
+        user table, and doubles as the existence check.
+
+        Returns:
+            Tuple of ({column: catalog facts}, estimated row count, whether
+            the table is known to be empty)
 
-        # First, verify the column exists
+        Raises:
+            ValueError: If any of the columns does not exist
+        """
         schema_name = schema or "public"
-        column_check_query = text("""
-            SELECT column_name, data_type
-            FROM information_schema.columns
-            WHERE table_schema = :schema_name
-            AND table_name = :table_name
-            AND column_name = :column_name
-        """)
-
-        check_result = await conn.execute(
-            column_check_query,
+        result = await conn.execute(
+            _COLUMN_CATALOG_SQL,
             {
                 "schema_name": schema_name,
                 "table_name": table_name,
-                "column_name": column_name,
+                "column_names": list(column_names),
             },
         )
-        column_row = check_result.fetchone()
-
-        if not column_row:
-            raise ValueError(
-                f"Column '{column_name}' does not exist in table '{schema_name}.{table_name}'"
+        rows = result.fetchall()
+
+        column_types = {}
+        for row in rows:
+            is_numeric = row[2] == self._NUMERIC_TYPCATEGORY
+            column_types[row[0]] = _CatalogColumn(
+                data_type=row[1],
+                is_numeric=is_numeric,
+                n_distinct=row[4],
+                mcv_values=row[5],
+                mcv_freqs=row[6],
+                percentiles=self._catalog_percentiles(row) if is_numeric else None,
             )
+        for column_name in column_names:
+            if column_name not in column_types:
+                raise ValueError(
+                    f"Column '{column_name}' does not exist in table '{schema_name}.{table_name}'"
+                )
 
-        # Get the column data type to determine what statistics to compute
-        type_query = text(f"""
-            SELECT pg_typeof("{column_name}")::text as data_type
-            FROM {table_ref}
-            WHERE "{column_name}" IS NOT NULL
-            LIMIT 1
-        """)
+        return column_types, float(rows[0][3] or 0), bool(rows[0][9])
 
+    @staticmethod
+    def _catalog_percentiles(row: Any) -> Optional[tuple[float, ...]]:
+        """Estimate percentiles from a column catalog row, if analyzed."""
+        if not row[8]:
+            return None
         try:
-            type_result = await conn.execute(type_query)
-            type_row = type_result.fetchone()
-            data_type = (
-                type_row[0] if type_row else column_row[1]
-            )  # Use info schema type as fallback
-        except Exception:
-            data_type = column_row[1]  # Use info schema type as fallback
-
-        # Determine if this is a numeric type
-        numeric_types = {
-            "integer",
-            "bigint",
-            "smallint",
-            "numeric",
-            "decimal",
-            "real",
-            "double precision",
-            "float",
-            "float4",
-            "float8",
-            "int",
-            "int2",
-            "int4",
-            "int8",
-            "money",
-        }
-        is_numeric = any(nt in data_type.lower() for nt in numeric_types)
+            bounds = [float(v) for v in row[8]]
+            mcv_values = [float(v) for v in row[5] or ()]
+        except ValueError:
+            # Numeric-category types whose text form is not a plain number
+            return None
+        return _histogram_percentiles(
+            bounds, row[7] or 0.0, mcv_values, list(row[6] or ())
+        )
 
-        # Build query based on data type
-        if is_numeric:
-            # Full numeric statistics with percentiles
-            query = text(f"""
-                SELECT
-                    COUNT(*) as total_rows,
-                    COUNT(*) - COUNT("{column_name}") as null_count,
-                    COUNT(DISTINCT "{column_name}") as distinct_count,
-                    MIN("{column_name}") as min_val,
-                    MAX("{column_name}") as max_val,
-                    '{data_type}' as data_type,
-                    AVG("{column_name}")::float as avg_val,
-                    STDDEV("{column_name}")::float as stddev_val,
-                    PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY "{column_name}") as p25,
-                    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY "{column_name}") as p50,
-                    PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY "{column_name}") as p75,
-                    PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY "{column_name}") as p95,
-                    PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY "{column_name}") as p99
-                FROM {table_ref}
-            """)
-        else:
-            # Basic statistics for non-numeric types
-            query = text(f"""
-                SELECT
-                    COUNT(*) as total_rows,
-                    COUNT(*) - COUNT("{column_name}") as null_count,
-                    COUNT(DISTINCT "{column_name}") as distinct_count,
-                    MIN("{column_name}")::text as min_val,
-                    MAX("{column_name}")::text as max_val,
-                    '{data_type}' as data_type,
-                    NULL::float as avg_val,
-                    NULL::float as stddev_val,
-                    NULL as p25,
-                    NULL as p50,
-                    NULL as p75,
-                    NULL as p95,
-                    NULL as p99
-                FROM {table_ref}
-            """)
+    @staticmethod
+    def _empty_column_stats(column_name: str, catalog: _CatalogColumn) -> ColumnStats:
+        """Statistics for a column of a table with no rows, without a scan."""
+        return ColumnStats(
+            column=column_name,
+            data_type=catalog.data_type,
+            total_rows=0,
+            null_count=0,
+            sample_size=0,
+        )
+
+    def _build_column_stats_query(
+        self,
+        table_ref: str,
+        column_names: list[str],
+        column_types: dict[str, _CatalogColumn],
+        estimated_rows: float,
+    ) -> tuple[TextClause, dict[str, Any], Optional[str], Optional[int]]:
+        """Build the statistics statement for already-resolved columns.
+
+        Distinct counts, most common values and percentiles already in
+        pg_stats are not recomputed. On large tables the remaining
+        most-common-values scans read a block sample, which finds the
+        frequent values without a full GROUP BY over every row. On huge
+        tables the aggregates do too, so scan cost stays flat as the table
+        grows.
+
+        Returns:
+            Tuple of (statement, bind parameters, most-common-values sampling
+            warning or None, estimated table rows if the aggregates are
+            sampled or None)
+        """
+        columns = tuple(
+            _StatsColumn(
+                column=self._quote_identifier(name),
+                is_numeric=column_types[name].is_numeric,
+                exact_distinct=column_types[name].n_distinct is None,
+                scan_mcv=not column_types[name].mcv_values,
+                exact_percentiles=column_types[name].percentiles is None,
+            )
+            for name in column_names
+        )
+
+        params: dict[str, Any] = {}
+        mcv_warning = None
+        population_rows = None
+
+        sample_mcv = (
+            any(column.scan_mcv for column in columns)
+            and estimated_rows > self._MCV_SAMPLE_ROWS
+        )
+        if sample_mcv:
+            sample_percent = self._MCV_SAMPLE_ROWS / estimated_rows * 100
+            params["percent"] = sample_percent
+            params["scale"] = 100 / sample_percent
+            mcv_warning = f"Most common values sampled at {sample_percent:.2f}%"
+
+        sample_stats = estimated_rows > self._STATS_SAMPLE_THRESHOLD
+        if sample_stats:
+            params["stats_percent"] = self._STATS_SAMPLE_ROWS / estimated_rows * 100
+            population_rows = int(estimated_rows)
+
+        query = _column_stats_query(table_ref, columns, sample_mcv, sample_stats)
+        return query, params, mcv_warning, population_rows
+
+    async def get_column_statistics(
+        self,
+        conn: AsyncConnection,
+        table_name: str,
+        column_name: str,
+        schema: Optional[str],
+    ) -> ColumnStats:
+        """Get comprehensive PostgreSQL column statistics."""
+        self._validate_identifier(column_name, "column")
+        table_ref = self._build_table_reference(table_name, schema)
+
+        column_types, estimated_rows, is_empty = await self._resolve_columns(
+            conn, table_name, [column_name], schema
+        )
+        if is_empty:
+            return self._empty_column_stats(column_name, column_types[column_name])
+
+        query, params, warning, population_rows = self._build_column_stats_query(
+            table_ref, [column_name], column_types, estimated_rows
+        )
 
         try:
-            result = await conn.execute(query)
+            # Aggregates and most common values arrive in one round trip
+            result = await conn.execute(query, params)
             row = result.fetchone()
 
             if not row:
@@ -310,51 +1036,14 @@ class PostgresAdapter(BaseAdapter):
                     warning="No data found",
                 )
 
-            # Get most common values (convert to text for consistency)
-            mcv_query = text(f"""
-                SELECT "{column_name}"::text as value, COUNT(*) as count
-                FROM {table_ref}
-                WHERE "{column_name}" IS NOT NULL
-                GROUP BY "{column_name}"
-                ORDER BY count DESC
-                LIMIT 10
-            """)
-
-            mcv_result = await conn.execute(mcv_query)
-            mcv_rows = mcv_result.fetchall()
-            most_common = [{"value": str(r[0]), "count": int(r[1])} for r in mcv_rows]
-
-            # Use orjson to ensure JSON-serializable values
-            import orjson
-
-            def safe_value(val):
-                """Convert value to JSON-safe format."""
-                if val is None:
-                    return None
-                # Try to serialize with orjson, fallback to str
-                try:
-                    orjson.dumps(val)
-                    return val
-                except Exception:
-                    return str(val)
-
-            return ColumnStats(
-                column=column_name,
-                data_type=str(row[5]),
-                total_rows=int(row[0]),
-                null_count=int(row[1]),
-                distinct_count=int(row[2]) if row[2] else None,
-                min_value=safe_value(row[3]),
-                max_value=safe_value(row[4]),
-                avg_value=float(row[6]) if row[6] is not None else None,
-                stddev_value=float(row[7]) if row[7] is not None else None,
-                percentile_25=safe_value(row[8]),
-                median_value=safe_value(row[9]),
-                percentile_75=safe_value(row[10]),
-                percentile_95=safe_value(row[11]),
-                percentile_99=safe_value(row[12]),
-                most_common_values=most_common,
-                sample_size=int(row[0]),
+            return _column_stats_from_row(
+                row,
+                0,
+                1,
+                column_name,
+                column_types[column_name],
+                warning,
+                population_rows,
             )
 
         except Exception as e:
@@ -367,6 +1056,46 @@ class PostgresAdapter(BaseAdapter):
                 warning=f"Statistics unavailable: {str(e)}",
             )
 
+    async def get_multi_column_statistics(
+        self,
+        conn: AsyncConnection,
+        table_name: str,
+        column_names: list[str],
+        schema: Optional[str],
+    ) -> list[ColumnStats]:
+        """Get PostgreSQL statistics for several columns in one table scan."""
+        for column_name in column_names:
+            self._validate_identifier(column_name, "column")
+        table_ref = self._build_table_reference(table_name, schema)
+
+        column_types, estimated_rows, is_empty = await self._resolve_columns(
+            conn, table_name, column_names, schema
+        )
+        if is_empty:
+            return [
+                self._empty_column_stats(name, column_types[name])
+                for name in column_names
+            ]
+
+        query, params, warning, population_rows = self._build_column_stats_query(
+            table_ref, column_names, column_types, estimated_rows
+        )
+        result = await conn.execute(query, params)
+        row = result.one()
+
+        return [
+            _column_stats_from_row(
+                row,
+                i,
+                len(column_names),
+                name,
+                column_types[name],
+                warning,
+                population_rows,
+            )
+            for i, name in enumerate(column_names)
+        ]
+
     async def get_value_distribution(
         self,
         conn: AsyncConnection,
@@ -379,31 +1108,23 @@ class PostgresAdapter(BaseAdapter):
         self._validate_identifier(column_name, "column")
         table_ref = self._build_table_reference(table_name, schema)
 
-        query = text(f"""
-            WITH stats AS (
-                SELECT
-                    COUNT(*) as total_rows,
-                    COUNT(DISTINCT "{column_name}") as unique_values,
-                    COUNT(*) - COUNT("{column_name}") as null_count
-                FROM {table_ref}
-            ),
-            top_values AS (
-                SELECT "{column_name}" as value, COUNT(*) as count
-                FROM {table_ref}
-                WHERE "{column_name}" IS NOT NULL
-                GROUP BY "{column_name}"
-                ORDER BY count DESC
-                LIMIT :limit
+        column_types, _, is_empty = await self._resolve_columns(
+            conn, table_name, [column_name], schema
+        )
+        if is_empty:
+            return Distribution(
+                column=column_name,
+                total_rows=0,
+                unique_values=0,
+                null_count=0,
+                top_values=[],
+                sample_size=0,
             )
-            SELECT
-                s.total_rows,
-                s.unique_values,
-                s.null_count,
-                json_agg(json_build_object('value', t.value::text, 'count', t.count)) as top_values
-            FROM stats s
-            LEFT JOIN top_values t ON true
-            GROUP BY s.total_rows, s.unique_values, s.null_count
-        """)
+        n_distinct = column_types[column_name].n_distinct
+
+        query = _value_distribution_query(
+            table_ref, self._quote_identifier(column_name), n_distinct is None
+        )
 
         result = await conn.execute(query, {"limit": limit})
         row = result.fetchone()
@@ -418,24 +1139,71 @@ class PostgresAdapter(BaseAdapter):
                 sample_size=0,
             )
 
-        top_values_data = json.loads(row[3]) if row[3] else []
+        top_values_data = [
+            {"value": value, "count": count}
+            for value, count in zip(row[3] or (), row[4] or ())
+        ]
+        total_rows = int(row[0])
+        unique_values = (
+            int(row[1])
+            if n_distinct is None
+            else _estimated_distinct(n_distinct, total_rows)
+        )
 
-        return Distribution(
+        return Distribution.model_construct(
             column=column_name,
-            total_rows=int(row[0]),
-            unique_values=int(row[1]),
-            null_count=int(row[2]),
+            total_rows=total_rows,
+            unique_values=unique_values,
+            null_count=total_rows - int(row[2]),
             top_values=top_values_data,
             sample_size=int(row[0]),
         )
 
     async def get_sample_query(
-        self, table_name: str, schema: Optional[str], limit: int
-    ) -> str:
-        """Generate PostgreSQL sampling query with TABLESAMPLE."""
+        self,
+        conn: AsyncConnection,
+        table_name: str,
+        schema: Optional[str],
+        limit: int,
+    ) -> tuple[str, dict[str, Any]]:
+        """Generate PostgreSQL sampling query with TABLESAMPLE.
+
+        A bare LIMIT returns the first rows of the heap, which is a biased
+        sample. tsm_system_rows picks exactly the requested number of rows
+        from random blocks when installed. Otherwise a BERNOULLI row sample
+        sized from reltuples, aiming for twice the limit plus a margin and
+        cut by LIMIT, is used. Views and other relations TABLESAMPLE does
+        not accept, and small or never-analyzed tables, use a plain LIMIT.
+        """
         table_ref = self._build_table_reference(table_name, schema)
-        # Use simple LIMIT for smaller limits, TABLESAMPLE for larger datasets
-        return f"SELECT * FROM {table_ref} LIMIT {limit}"
+        schema_name = schema or "public"
+        self._validate_identifier(schema_name, "schema")
+
+        result = await conn.execute(
+            _SAMPLE_SIZING_SQL, {"table_ident": f'"{schema_name}"."{table_name}"'}
+        )
+        row = result.mappings().one()
+
+        if row["relkind"] not in _SAMPLEABLE_RELKINDS:
+            return f"SELECT * FROM {table_ref} LIMIT :limit", {"limit": limit}
+
+        if row["has_system_rows"]:
+            return (
+                f"SELECT * FROM {table_ref} TABLESAMPLE SYSTEM_ROWS (:limit) LIMIT :limit",
+                {"limit": limit},
+            )
+
+        estimated_rows = row["estimated_rows"] or 0
+        target_rows = 2 * limit + _SAMPLE_MARGIN_ROWS
+        percent = target_rows * 100 / estimated_rows if estimated_rows > 0 else 100
+        if percent >= 100:
+            return f"SELECT * FROM {table_ref} LIMIT :limit", {"limit": limit}
+
+        return (
+            f"SELECT * FROM {table_ref} "
+            "TABLESAMPLE BERNOULLI (CAST(:percent AS float4)) LIMIT :limit",
+            {"percent": percent, "limit": limit},
+        )
 
     async def get_explain_query(self, query: str, analyze: bool) -> str:
         """Generate PostgreSQL EXPLAIN query."""
@@ -449,7 +1217,7 @@ class PostgresAdapter(BaseAdapter):
         """Parse PostgreSQL EXPLAIN JSON output."""
         try:
             # Parse the JSON plan
-            plan_data = json.loads(plan_text)
+            plan_data = orjson.loads(plan_text)
 
             if isinstance(plan_data, list) and len(plan_data) > 0:
                 # Get the full plan structure
@@ -473,7 +1241,7 @@ class PostgresAdapter(BaseAdapter):
                     result["actual_rows"] = plan.get("Actual Rows")
 
                 # Add warnings based on plan analysis
-                if "Seq Scan" in str(plan):
+                if self._has_seq_scan(plan):
                     result["warnings"].append(
                         "Sequential scan detected - may be slow on large tables"
                     )
@@ -483,7 +1251,7 @@ class PostgresAdapter(BaseAdapter):
 
                 return result
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
             # If JSON parsing fails, treat as text format
             return {
                 "json": None,
@@ -500,6 +1268,17 @@ class PostgresAdapter(BaseAdapter):
             "recommendations": [],
         }
 
+    @staticmethod
+    def _has_seq_scan(plan: dict[str, Any]) -> bool:
+        """Check whether any node in the plan tree is a sequential scan."""
+        stack = [plan]
+        while stack:
+            node = stack.pop()
+            if node.get("Node Type") == "Seq Scan":
+                return True
+            stack.extend(node.get("Plans", ()))
+        return False
+
     def _format_plan_text(self, plan: dict[str, Any], indent: int = 0) -> str:
         """Format JSON plan as human-readable text."""
         lines = []
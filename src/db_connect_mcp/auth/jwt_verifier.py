@@ -115,7 +115,7 @@ class JWTTokenVerifier:
             jwks_client = await self._get_jwks_client()
 
             # Get the signing key for this token (runs in thread pool for I/O)
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             signing_key = await loop.run_in_executor(
                 None, jwks_client.get_signing_key_from_jwt, token
             )
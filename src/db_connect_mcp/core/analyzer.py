@@ -1,6 +1,8 @@
 """Column statistics and distribution analysis."""
 
-from typing import TYPE_CHECKING, Optional
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Optional
 
 
 from db_connect_mcp.core.connection import DatabaseConnection
@@ -9,6 +11,8 @@ from db_connect_mcp.models.statistics import ColumnStats, Distribution
 if TYPE_CHECKING:
     from db_connect_mcp.adapters.base import BaseAdapter
 
+logger = logging.getLogger(__name__)
+
 
 class StatisticsAnalyzer:
     """Column statistics and value distribution analysis."""
@@ -93,22 +97,74 @@ class StatisticsAnalyzer:
         Returns:
             List of column statistics
         """
-        results = []
-
-        for column_name in column_names:
+        if not column_names:
+            return []
+
+        # Prefer a single table scan covering every column. Adapters without
+        # one raise NotImplementedError; any other failure (e.g. one column
+        # type that cannot be aggregated) falls back to per-column analysis
+        # so the remaining columns still get statistics.
+        try:
+            async with self.connection.get_connection() as conn:
+                return await self.adapter.get_multi_column_statistics(
+                    conn, table_name, column_names, schema
+                )
+        except NotImplementedError:
+            pass
+        except Exception as e:
+            logger.debug(f"Single-scan statistics failed for {table_name}: {e}")
+
+        # Columns are independent, so analyze them concurrently, capped at
+        # what the pool can hand out. Each worker keeps one pooled connection
+        # for every column it takes, saving a checkout (ping, session SETs,
+        # reset) per column, unless a failed statement would leave that
+        # connection unusable for the next column.
+        reuse = not self.adapter.errors_abort_transaction
+        pending = iter(enumerate(column_names))
+        results: dict[int, ColumnStats] = {}
+        errors: list[Exception] = []
+
+        async def analyze(conn: Any, column_name: str) -> ColumnStats:
             try:
-                stats = await self.analyze_column(table_name, column_name, schema)
-                results.append(stats)
-            except Exception as e:
-                # Create stats with error message
-                stats = ColumnStats(
-                    column=column_name,
-                    data_type="unknown",
-                    total_rows=0,
-                    null_count=0,
-                    sample_size=0,
-                    warning=f"Failed to analyze: {str(e)}",
+                if conn is None:
+                    return await self.analyze_column(table_name, column_name, schema)
+                return await self.adapter.get_column_statistics(
+                    conn, table_name, column_name, schema
                 )
-                results.append(stats)
+            except Exception as e:
+                return self._failed_stats(column_name, e)
+
+        async def worker() -> None:
+            if not reuse:
+                for index, column_name in pending:
+                    results[index] = await analyze(None, column_name)
+                return
 
-        return results
+            try:
+                async with self.connection.get_connection() as conn:
+                    for index, column_name in pending:
+                        results[index] = await analyze(conn, column_name)
+            except Exception as e:
+                # No connection for this worker; the others take the
+                # remaining columns
+                errors.append(e)
+
+        workers = min(self.connection.max_connections, len(column_names))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        return [
+            results[i] if i in results else self._failed_stats(name, errors[-1])
+            for i, name in enumerate(column_names)
+        ]
+
+    @staticmethod
+    def _failed_stats(column_name: str, error: Exception) -> ColumnStats:
+        """Create stats with error message."""
+        return ColumnStats(
+            column=column_name,
+            data_type="unknown",
+            total_rows=0,
+            null_count=0,
+            sample_size=0,
+            warning=f"Failed to analyze: {str(error)}",
+        )
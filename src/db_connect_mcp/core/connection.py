@@ -2,10 +2,13 @@
 
 import asyncio
 import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, AsyncGenerator, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Optional, TypeVar, Union
 
-from sqlalchemy import text, create_engine, Engine, Connection
+from sqlalchemy import TextClause, text, create_engine, Engine, Connection
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 from db_connect_mcp.models.config import DatabaseConfig
@@ -15,9 +18,73 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_F = TypeVar("_F", bound=Callable)
+
+# Dialects whose drivers only offer a sync API; clickhouse-connect registers
+# 'clickhousedb' as its SQLAlchemy dialect name
+_SYNC_ONLY_DIALECTS = frozenset({"clickhouse", "clickhousedb"})
+
+# Session setup statements run on every checkout, built once. ClickHouse has
+# no session read-only mode; it is enforced at user/permission level.
+_READONLY_SQL = {
+    "postgresql": text("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"),
+    "mysql": text("SET SESSION TRANSACTION READ ONLY"),
+}
+
+# Probe statements, shared so each reuses one compiled form (and, on
+# asyncpg, one prepared statement per connection)
+_SELECT_ONE_SQL = text("SELECT 1")
+_VERSION_SQL = text("SELECT version()")
+_MYSQL_VERSION_SQL = text("SELECT VERSION()")
+
+
+@lru_cache(maxsize=16)
+def _timeout_statement(dialect: str, timeout: int) -> Optional[TextClause]:
+    """Build the statement setting a per-session query timeout in seconds.
+
+    SET cannot take bind parameters on PostgreSQL, so the value is part of
+    the SQL text; the config timeout is fixed, so this is built once.
+    """
+    timeout_ms = timeout * 1000
+    if dialect == "postgresql":
+        return text(f"SET statement_timeout = {timeout_ms}")
+    if dialect == "mysql":
+        return text(f"SET SESSION max_execution_time = {timeout_ms}")
+    if dialect == "clickhouse":
+        return text(f"SET max_execution_time = {timeout}")
+    return None
+
+
+def uses_raw_connection(fn: _F) -> _F:
+    """Mark a run_sync callback as needing the raw sync connection.
+
+    SQLAlchemy's inspect() only accepts real Connection objects, so
+    reflection callbacks must not receive a SyncConnectionWrapper.
+    """
+    setattr(fn, "_raw_connection", True)
+    return fn
+
+
+class _TextConnection(Connection):
+    """Sync connection that accepts raw SQL strings.
+
+    Installed as the sync engine's connection class, so every checkout
+    already wraps strings in text() instead of being patched per checkout.
+    """
+
+    def execute(self, statement, *args, **kwargs):  # type: ignore[override]
+        """Execute statement, wrapping strings in text()."""
+        if isinstance(statement, str):
+            statement = text(statement)
+        return super().execute(statement, *args, **kwargs)
+
 
 class SyncConnectionWrapper:
-    """Wrapper for sync connections to handle text() wrapping."""
+    """Wrapper for sync connections handed to non-inspection run_sync calls.
+
+    Statements go straight to the wrapped connection; raw SQL strings are
+    wrapped in text() once, by _TextConnection, rather than at every layer.
+    """
 
     def __init__(self, sync_conn: Connection):
         """Initialize with a sync connection."""
@@ -25,46 +92,47 @@ class SyncConnectionWrapper:
         # Copy important attributes for SQLAlchemy inspection
         self.dialect = sync_conn.dialect
         self.engine = sync_conn.engine
-        self.connection = (
-            sync_conn.connection if hasattr(sync_conn, "connection") else sync_conn
-        )
-        self.info = sync_conn.info if hasattr(sync_conn, "info") else {}
+        self.connection = getattr(sync_conn, "connection", sync_conn)
+        self.info = getattr(sync_conn, "info", {})
+        # Bind the commonly used methods up front so they resolve as instance
+        # attributes instead of going through __getattr__ on every access
+        self.begin = sync_conn.begin
+        self.commit = sync_conn.commit
+        self.rollback = sync_conn.rollback
+        self.execution_options = sync_conn.execution_options
 
     def execute(self, statement, parameters=None):
-        """Execute statement, wrapping strings in text()."""
-        from sqlalchemy import text
-
-        # Wrap string statements in text() for proper execution
-        if isinstance(statement, str):
-            statement = text(statement)
-
+        """Execute statement on the wrapped connection."""
         if parameters:
             return self.sync_conn.execute(statement, parameters)
         else:
             return self.sync_conn.execute(statement)
 
     def __getattr__(self, name):
-        """Forward other attributes to the wrapped connection."""
+        """Forward any attribute not bound in __init__ to the wrapped connection."""
         return getattr(self.sync_conn, name)
 
 
 class AsyncConnectionWrapper:
     """Wrapper to make sync connections work in async context."""
 
-    def __init__(self, sync_conn: Connection):
-        """Initialize with a sync connection."""
+    def __init__(self, sync_conn: Connection, executor: Optional[Executor] = None):
+        """Initialize with a sync connection.
+
+        Args:
+            sync_conn: Synchronous connection to wrap
+            executor: Executor for blocking calls, or None for the loop default
+        """
         self.sync_conn = sync_conn
-        self._executor = None
+        self._executor = executor
 
     async def execute(self, statement, parameters=None):
-        """Execute statement in thread pool."""
-        from sqlalchemy import text
-
-        # Wrap string statements in text() for proper execution
-        if isinstance(statement, str):
-            statement = text(statement)
+        """Execute statement in thread pool.
 
-        loop = asyncio.get_event_loop()
+        Raw SQL strings are accepted by the engine's _TextConnection, so they
+        are not wrapped here.
+        """
+        loop = asyncio.get_running_loop()
         if parameters:
             result = await loop.run_in_executor(
                 self._executor, self.sync_conn.execute, statement, parameters
@@ -80,20 +148,10 @@ class AsyncConnectionWrapper:
 
         This mimics the SQLAlchemy AsyncConnection.run_sync method.
         """
-        loop = asyncio.get_event_loop()
-        # For inspection operations, pass the raw connection
-        # For execute operations, use the wrapper
-        # Check if this is likely an inspection call
-
-        fn_name = fn.__name__ if hasattr(fn, "__name__") else str(fn)
-
-        # If it's a function that needs inspection, pass the raw connection
-        if (
-            "inspect" in fn_name.lower()
-            or "get_schema" in fn_name.lower()
-            or "get_table" in fn_name.lower()
-            or "describe" in fn_name.lower()
-        ):
+        loop = asyncio.get_running_loop()
+        # Callbacks marked with @uses_raw_connection get the raw connection
+        # (e.g. for inspect()); all others get the wrapper
+        if getattr(fn, "_raw_connection", False):
             result = await loop.run_in_executor(
                 self._executor, fn, self.sync_conn, *args, **kwargs
             )
@@ -107,12 +165,12 @@ class AsyncConnectionWrapper:
 
     async def commit(self):
         """Commit transaction in thread pool."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(self._executor, self.sync_conn.commit)
 
     async def rollback(self):
         """Rollback transaction in thread pool."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(self._executor, self.sync_conn.rollback)
 
     def close(self):
@@ -137,12 +195,14 @@ class DatabaseConnection:
         self._dialect = config.dialect
         self._driver = config.driver
         # Check if this is ClickHouse (sync only)
-        # clickhouse-connect uses 'clickhousedb' as the dialect name in SQLAlchemy
-        self._is_sync_only = (
-            self._dialect == "clickhouse"
-            or self._dialect == "clickhousedb"
-            or (self._dialect == "clickhouse" and self._driver == "connect")
-        )
+        self._is_sync_only = self._dialect in _SYNC_ONLY_DIALECTS
+
+        # Server version, fixed for the lifetime of the engine
+        self._version: Optional[str] = None
+
+        # Threads for the blocking calls of sync-only drivers, so they neither
+        # queue behind nor starve other users of the loop's default executor
+        self._sync_executor: Optional[ThreadPoolExecutor] = None
 
         # SSH tunnel support
         self._tunnel_manager: Optional["SSHTunnelManager"] = None
@@ -163,21 +223,34 @@ class DatabaseConnection:
         # Handle ClickHouse with sync-only driver
         if self._is_sync_only:
             # Create synchronous engine for ClickHouse
-            self.sync_engine = create_engine(
+            sync_engine = create_engine(
                 effective_url,
                 pool_size=self.config.pool_size,
                 max_overflow=self.config.max_overflow,
                 pool_timeout=self.config.pool_timeout,
+                pool_recycle=self.config.pool_recycle,
+                pool_use_lifo=self.config.pool_use_lifo,
                 pool_pre_ping=True,
                 echo=self.config.echo_sql,
             )
+            sync_engine._connection_cls = _TextConnection
+            self.sync_engine = sync_engine
+            # One thread per pooled connection, overflow included
+            self._sync_executor = ThreadPoolExecutor(
+                max_workers=self.max_connections,
+                thread_name_prefix="clickhouse-io",
+            )
             return
 
         # Extract SSL configuration from URL for asyncpg
         connect_args = {}
-        if self._dialect == "postgresql" and self._driver == "asyncpg":
-            from sqlalchemy.engine.url import make_url
-
+        # The substring test skips parsing URLs without SSL options, the
+        # common case; both sslmode and ssl contain it
+        if (
+            self._dialect == "postgresql"
+            and self._driver == "asyncpg"
+            and "ssl" in effective_url
+        ):
             url_obj = make_url(effective_url)
 
             # Check for SSL-related query parameters
@@ -209,6 +282,8 @@ class DatabaseConnection:
             pool_size=self.config.pool_size,
             max_overflow=self.config.max_overflow,
             pool_timeout=self.config.pool_timeout,
+            pool_recycle=self.config.pool_recycle,
+            pool_use_lifo=self.config.pool_use_lifo,
             pool_pre_ping=True,  # Verify connections before using
             echo=self.config.echo_sql,
             connect_args=connect_args if connect_args else {},
@@ -222,7 +297,6 @@ class DatabaseConnection:
             rewrite_database_url,
         )
         from db_connect_mcp.models.config import SSHTunnelConfig
-        from sqlalchemy.engine.url import make_url
 
         ssh_tunnel_config = self.config.ssh_tunnel
         if ssh_tunnel_config is None:
@@ -280,6 +354,10 @@ class DatabaseConnection:
             if self.sync_engine is not None:
                 self.sync_engine.dispose()
                 self.sync_engine = None
+            if self._sync_executor is not None:
+                self._sync_executor.shutdown(wait=False)
+                self._sync_executor = None
+            self._version = None
         finally:
             # Always stop SSH tunnel, even if engine dispose fails
             if self._tunnel_manager is not None:
@@ -307,23 +385,11 @@ class DatabaseConnection:
                     "DatabaseConnection not initialized. Call initialize() first."
                 )
 
-            # Get sync connection
+            # Get sync connection; _TextConnection accepts raw SQL strings
             sync_conn = self.sync_engine.connect()
 
-            # Monkey-patch the execute method to handle raw SQL strings
-            original_execute = sync_conn.execute
-
-            def patched_execute(statement, *args, **kwargs):
-                from sqlalchemy import text
-
-                if isinstance(statement, str):
-                    statement = text(statement)
-                return original_execute(statement, *args, **kwargs)
-
-            sync_conn.execute = patched_execute
-
             # Wrap it for async
-            wrapper = AsyncConnectionWrapper(sync_conn)
+            wrapper = AsyncConnectionWrapper(sync_conn, self._sync_executor)
 
             try:
                 # Set read-only mode if configured (sync)
@@ -359,16 +425,9 @@ class DatabaseConnection:
 
     async def _set_readonly(self, conn: AsyncConnection) -> None:
         """Set connection to read-only mode based on database dialect."""
-        if self._dialect == "postgresql":
-            await conn.execute(
-                text("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
-            )
-        elif self._dialect == "mysql":
-            await conn.execute(text("SET SESSION TRANSACTION READ ONLY"))
-        elif self._dialect == "clickhouse":
-            # ClickHouse doesn't have traditional read-only mode
-            # Read-only is enforced at user/permission level
-            pass
+        statement = _READONLY_SQL.get(self._dialect)
+        if statement is not None:
+            await conn.execute(statement)
 
     async def _set_readonly_wrapper(self, wrapper: AsyncConnectionWrapper) -> None:
         """Set connection to read-only mode for wrapped sync connections."""
@@ -378,21 +437,17 @@ class DatabaseConnection:
 
     async def _set_timeout(self, conn: AsyncConnection, timeout: int) -> None:
         """Set statement timeout based on database dialect."""
-        timeout_ms = timeout * 1000
-
-        if self._dialect == "postgresql":
-            await conn.execute(text(f"SET statement_timeout = {timeout_ms}"))
-        elif self._dialect == "mysql":
-            await conn.execute(text(f"SET SESSION max_execution_time = {timeout_ms}"))
-        elif self._dialect == "clickhouse":
-            await conn.execute(text(f"SET max_execution_time = {timeout}"))
+        statement = _timeout_statement(self._dialect, timeout)
+        if statement is not None:
+            await conn.execute(statement)
 
     async def _set_timeout_wrapper(
         self, wrapper: AsyncConnectionWrapper, timeout: int
     ) -> None:
         """Set statement timeout for wrapped sync connections."""
-        if self._dialect == "clickhouse":
-            await wrapper.execute(text(f"SET max_execution_time = {timeout}"))
+        statement = _timeout_statement(self._dialect, timeout)
+        if statement is not None:
+            await wrapper.execute(statement)
 
     @property
     def dialect(self) -> str:
@@ -409,6 +464,11 @@ class DatabaseConnection:
         """Check if engine is initialized."""
         return self.engine is not None or self.sync_engine is not None
 
+    @property
+    def max_connections(self) -> int:
+        """Maximum number of connections the pool hands out at once."""
+        return self.config.pool_size + self.config.max_overflow
+
     @property
     def is_tunneled(self) -> bool:
         """Check if connection uses SSH tunnel."""
@@ -423,7 +483,7 @@ class DatabaseConnection:
         """
         try:
             async with self.get_connection() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(_SELECT_ONE_SQL)
             return True
         except Exception:
             return False
@@ -432,21 +492,23 @@ class DatabaseConnection:
         """
         Get database version string.
 
+        The version is queried once and cached until dispose().
+
         Returns:
             Database version string
         """
-        version_query = {
-            "postgresql": "SELECT version()",
-            "mysql": "SELECT VERSION()",
-            "clickhouse": "SELECT version()",
-        }
+        if self._version is not None:
+            return self._version
 
-        query = version_query.get(self._dialect, "SELECT version()")
+        query = _MYSQL_VERSION_SQL if self._dialect == "mysql" else _VERSION_SQL
 
         async with self.get_connection() as conn:
-            result = await conn.execute(text(query))
+            result = await conn.execute(query)
             row = result.fetchone()
-            return str(row[0]) if row else "Unknown"
+            if not row:
+                return "Unknown"
+            self._version = str(row[0])
+            return self._version
 
     async def __aenter__(self) -> "DatabaseConnection":
         """Async context manager entry."""
@@ -1,12 +1,16 @@
 """Safe query execution with validation."""
 
+import base64
 import datetime
 import re
 import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Optional
 
 import orjson
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 from db_connect_mcp.core.connection import DatabaseConnection
 from db_connect_mcp.models.query import ExplainPlan, QueryResult
@@ -14,6 +18,159 @@ from db_connect_mcp.models.query import ExplainPlan, QueryResult
 if TYPE_CHECKING:
     from db_connect_mcp.adapters.base import BaseAdapter
 
+# Validation patterns, compiled once rather than on every query
+_COMMENT_LINE_RE = re.compile(r"--[^\n]*")
+_FIRST_KEYWORD_RE = re.compile(r"\s*(\w+)")
+_LIMIT_RE = re.compile(r"\bLIMIT\s+(?:\d+|:\w+)", re.IGNORECASE)
+# Word boundaries avoid false positives (e.g. "DESCRIBE" or "created_at")
+_DANGEROUS_RE = re.compile(
+    r"\b(DROP|DELETE|INSERT|UPDATE|TRUNCATE|ALTER|CREATE|GRANT|REVOKE)\b",
+    re.IGNORECASE,
+)
+
+
+def _strip_block_comments(query: str) -> str:
+    """Remove /* ... */ comments in one left-to-right pass.
+
+    Equivalent to substituting the lazy DOTALL comment pattern, which retries
+    from every later ``/*`` once a comment turns out to be unterminated and
+    so goes quadratic on inputs like ``"/*" * n``. An unterminated comment is
+    left in place, as the pattern would.
+    """
+    pieces = []
+    pos = 0
+    while True:
+        start = query.find("/*", pos)
+        if start == -1:
+            break
+        end = query.find("*/", start + 2)
+        if end == -1:
+            break
+        pieces.append(query[pos:start])
+        pos = end + 2
+    if not pieces:
+        return query
+    pieces.append(query[pos:])
+    return "".join(pieces)
+
+
+# Validation and LIMIT handling are pure functions of the query text, and
+# clients tend to re-issue the same queries, so results are memoized
+@lru_cache(maxsize=1024)
+def _query_error(query: str, allowed: frozenset[str]) -> Optional[str]:
+    """Return why query is not an allowed read-only query, or None if it is."""
+    # Remove comments. Patterns are case-insensitive, so only the first
+    # keyword is upper-cased rather than a copy of the whole query
+    normalized = _COMMENT_LINE_RE.sub("", query)
+    normalized = _strip_block_comments(normalized)
+
+    # Get first keyword
+    match = _FIRST_KEYWORD_RE.match(normalized)
+    first_keyword = match.group(1).upper() if match else ""
+
+    if first_keyword not in allowed:
+        return f"Only {', '.join(allowed)} queries are allowed. Got: {first_keyword}"
+
+    # Check for dangerous keywords anywhere in query
+    match = _DANGEROUS_RE.search(normalized)
+    if match:
+        return (
+            f"Query contains dangerous keyword: {match.group(1).upper()}. "
+            f"Only read-only queries are allowed."
+        )
+    return None
+
+
+def _add_limit_clause(query: str, limit: int) -> str:
+    """Append a LIMIT clause, dropping any trailing semicolon."""
+    return f"{query.rstrip().rstrip(';')} LIMIT {limit}"
+
+
+@lru_cache(maxsize=1024)
+def _limited_query(query: str, limit: int) -> str:
+    """Return query with LIMIT appended unless it already has one."""
+    if _LIMIT_RE.search(query):
+        return query
+    return _add_limit_clause(query, limit)
+
+
+def _row_json_default(obj: Any) -> Any:
+    """Convert a result value orjson cannot encode natively.
+
+    Date and time values only arrive here under ``OPT_PASSTHROUGH_DATETIME``
+    and are rendered with ``isoformat()``, as orjson itself renders them.
+    Bytes become base64 and anything else its ``str()``.
+    """
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode("utf-8")
+    return str(obj)
+
+
+# Default cap, in bytes, on the compact encoding of the rows in one
+# execute_query result. It bounds the memory a single result can take; the
+# server's MAX_RESPONSE_* limits count characters of the final indented
+# response and are enforced separately.
+MAX_RESULT_BYTES = 16 * 1024 * 1024
+
+# Rows fetched per round trip when streaming a result from a server-side cursor
+_FETCH_BATCH_ROWS = 1000
+
+
+def _encode_rows(rows: Any) -> bytes:
+    """Encode result rows, or a single row, with orjson.
+
+    Conversion happens inside the encoder, with no Python pass over each
+    cell. orjson rejects timezone-aware ``time`` values without consulting
+    the default hook, so only then are dates and times routed through it.
+    """
+    try:
+        return orjson.dumps(rows, default=_row_json_default)
+    except orjson.JSONEncodeError:
+        return orjson.dumps(
+            rows,
+            default=_row_json_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+
+def _json_safe_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Round-trip result rows through orjson so every value is JSON-safe."""
+    return orjson.loads(_encode_rows(rows))
+
+
+async def _iterate(rows: Iterable[Any]) -> AsyncIterator[Any]:
+    """Yield already-fetched rows through the async iteration protocol."""
+    for row in rows:
+        yield row
+
+
+async def _json_safe_rows_capped(
+    rows: AsyncIterable[dict[str, Any]], max_bytes: int
+) -> tuple[list[dict[str, Any]], bool]:
+    """Like _json_safe_rows, keeping only the leading rows that fit max_bytes.
+
+    Rows are encoded one at a time as they are drawn from ``rows``, and
+    iteration stops at the first row that would take the encoded size past
+    the cap, so rows beyond it are never built or encoded. When ``rows``
+    reads from a server-side cursor they are not fetched either.
+
+    Returns:
+        Tuple of (JSON-safe rows, whether any rows were dropped)
+    """
+    pieces: list[bytes] = []
+    size = 1  # the enclosing brackets, less the comma the first row skips
+    over_size = False
+    async for row in rows:
+        piece = _encode_rows(row)
+        size += len(piece) + 1
+        if size > max_bytes:
+            over_size = True
+            break
+        pieces.append(piece)
+    return orjson.loads(b"[" + b",".join(pieces) + b"]"), over_size
+
 
 def json_default(obj: Any) -> Any:
     """
@@ -33,8 +190,6 @@ def json_default(obj: Any) -> Any:
         return obj.total_seconds()
     elif isinstance(obj, bytes):
         # Convert bytes to base64 string for JSON serialization
-        import base64
-
         return base64.b64encode(obj).decode("utf-8")
     # Fallback to string representation
     return str(obj)
@@ -44,18 +199,27 @@ class QueryExecutor:
     """Safe query execution with validation and limits."""
 
     # Allowed query types (read-only operations)
-    ALLOWED_QUERY_TYPES = {"SELECT", "WITH", "SHOW", "DESCRIBE", "EXPLAIN"}
+    ALLOWED_QUERY_TYPES = frozenset({"SELECT", "WITH", "SHOW", "DESCRIBE", "EXPLAIN"})
 
-    def __init__(self, connection: DatabaseConnection, adapter: "BaseAdapter"):
+    def __init__(
+        self,
+        connection: DatabaseConnection,
+        adapter: "BaseAdapter",
+        max_result_bytes: int = MAX_RESULT_BYTES,
+    ):
         """
         Initialize query executor.
 
         Args:
             connection: Database connection manager
             adapter: Database-specific adapter
+            max_result_bytes: Cap on the encoded size of execute_query
+                result rows; rows past it are dropped and the result marked
+                truncated
         """
         self.connection = connection
         self.adapter = adapter
+        self.max_result_bytes = max_result_bytes
 
     async def execute_query(
         self,
@@ -77,76 +241,88 @@ class QueryExecutor:
         Raises:
             ValueError: If query is not a safe read-only query
         """
+        modified_query = self._prepare_query(query, limit)
+
+        async with self.connection.get_connection() as conn:
+            return await self._run_query(
+                conn, modified_query, params, limit, self.max_result_bytes
+            )
+
+    def _prepare_query(self, query: str, limit: Optional[int]) -> str:
+        """Validate a read-only query and add LIMIT if not present."""
         # Validate query is safe
         self._validate_query(query)
 
         # Add LIMIT if not present and limit is specified
-        modified_query = query
-        if limit is not None and not self._has_limit(query):
-            modified_query = self._add_limit(query, limit)
+        if limit is None:
+            return query
+        return _limited_query(query, limit)
 
+    async def _run_query(
+        self,
+        conn: Any,
+        modified_query: str,
+        params: Optional[dict[str, Any]],
+        limit: Optional[int],
+        max_bytes: Optional[int] = None,
+    ) -> QueryResult:
+        """Execute a prepared query on a checked-out connection.
+
+        Rows go to orjson as plain dicts; values it cannot encode natively
+        are converted inside the encoder by _row_json_default. With
+        ``max_bytes`` the rows are read from a server-side cursor where the
+        connection supports one, and reading stops once their encoded size
+        passes the cap. The sync wrapper used for ClickHouse has no such
+        cursor, so its driver buffers the whole result first.
+        """
         start_time = time.time()
+        statement = text(modified_query)
 
-        async with self.connection.get_connection() as conn:
-            result = await conn.execute(text(modified_query), params or {})
-            rows_data = result.fetchall()
-
-            # Convert to list of dicts
+        if max_bytes is None:
+            result = await conn.execute(statement, params or {})
+            columns = list(result.keys())
+            rows = _json_safe_rows([dict(zip(columns, row)) for row in result])
+            over_size = False
+        elif isinstance(conn, AsyncConnection):
+            stream = await conn.stream(
+                statement,
+                params or {},
+                execution_options={"yield_per": _FETCH_BATCH_ROWS},
+            )
+            try:
+                columns = list(stream.keys())
+                rows, over_size = await _json_safe_rows_capped(
+                    (dict(zip(columns, row)) async for row in stream), max_bytes
+                )
+            finally:
+                await stream.close()
+        else:
+            result = await conn.execute(statement, params or {})
             columns = list(result.keys())
-            rows = [dict(zip(columns, row)) for row in rows_data]
-
-            # Pre-process rows to handle timezone-aware datetimes and bytes
-            # orjson doesn't support timezone-aware datetimes or bytes even with a default handler
-            import base64
-
-            processed_rows = []
-            for row in rows:
-                processed_row = {}
-                for key, value in row.items():
-                    # Convert timezone-aware datetime/time to ISO string
-                    if isinstance(value, datetime.datetime):
-                        # datetime.datetime has tzinfo
-                        if value.tzinfo is not None:
-                            processed_row[key] = value.isoformat()
-                        else:
-                            # Let orjson handle naive datetime objects
-                            processed_row[key] = value
-                    elif isinstance(value, datetime.time):
-                        # datetime.time has tzinfo
-                        if value.tzinfo is not None:
-                            processed_row[key] = value.isoformat()
-                        else:
-                            # Let orjson handle naive time objects
-                            processed_row[key] = value
-                    elif isinstance(value, datetime.date):
-                        # datetime.date doesn't have tzinfo, let orjson handle it
-                        processed_row[key] = value
-                    elif isinstance(value, bytes):
-                        # Convert bytes to base64 string
-                        processed_row[key] = base64.b64encode(value).decode("utf-8")
-                    else:
-                        processed_row[key] = value
-                processed_rows.append(processed_row)
-
-            # Now use orjson with fallback for remaining types
-            json_bytes = orjson.dumps(processed_rows, default=str)
-            rows = orjson.loads(json_bytes)
-
-            execution_time = (time.time() - start_time) * 1000  # Convert to ms
-
-            # Check if results were truncated
-            truncated = limit is not None and len(rows) == limit
-
-            return QueryResult(
-                query=modified_query,
-                rows=rows,
-                row_count=len(rows),
-                columns=columns,
-                execution_time_ms=execution_time,
-                truncated=truncated,
-                warning="Results truncated to limit" if truncated else None,
+            rows, over_size = await _json_safe_rows_capped(
+                _iterate(dict(zip(columns, row)) for row in result), max_bytes
             )
 
+        execution_time = (time.time() - start_time) * 1000  # Convert to ms
+
+        # Check if results were truncated
+        if over_size:
+            warning = f"Results truncated to {max_bytes} bytes"
+        elif limit is not None and len(rows) == limit:
+            warning = "Results truncated to limit"
+        else:
+            warning = None
+
+        return QueryResult(
+            query=modified_query,
+            rows=rows,
+            row_count=len(rows),
+            columns=columns,
+            execution_time_ms=execution_time,
+            truncated=warning is not None,
+            warning=warning,
+        )
+
     async def sample_data(
         self,
         table_name: str,
@@ -164,10 +340,16 @@ class QueryExecutor:
         Returns:
             Sample data query result
         """
-        # Use adapter for database-specific efficient sampling
-        query = await self.adapter.get_sample_query(table_name, schema, limit)
-
-        return await self.execute_query(query, limit=limit)
+        async with self.connection.get_connection() as conn:
+            # Use adapter for database-specific efficient sampling; the
+            # sample runs on the connection used to size it. Adapter SQL is
+            # built from validated identifiers and always carries its own
+            # LIMIT, so it skips query validation and LIMIT rewriting. The
+            # byte cap is left off: the server shortens wide cells instead
+            query, params = await self.adapter.get_sample_query(
+                conn, table_name, schema, limit
+            )
+            return await self._run_query(conn, query, params, limit)
 
     async def explain_query(self, query: str, analyze: bool = False) -> ExplainPlan:
         """
@@ -239,55 +421,17 @@ class QueryExecutor:
         Raises:
             ValueError: If query is not allowed
         """
-        # Normalize query
-        normalized = query.strip().upper()
-
-        # Remove comments
-        normalized = re.sub(r"--[^\n]*", "", normalized)
-        normalized = re.sub(r"/\*.*?\*/", "", normalized, flags=re.DOTALL)
-
-        # Get first keyword
-        first_keyword = normalized.split()[0] if normalized.split() else ""
-
-        if first_keyword not in self.ALLOWED_QUERY_TYPES:
-            raise ValueError(
-                f"Only {', '.join(self.ALLOWED_QUERY_TYPES)} queries are allowed. "
-                f"Got: {first_keyword}"
-            )
-
-        # Check for dangerous keywords anywhere in query
-        dangerous_keywords = {
-            "DROP",
-            "DELETE",
-            "INSERT",
-            "UPDATE",
-            "TRUNCATE",
-            "ALTER",
-            "CREATE",
-            "GRANT",
-            "REVOKE",
-        }
-
-        for keyword in dangerous_keywords:
-            # Use word boundaries to avoid false positives (e.g., "DESCRIBE")
-            if re.search(rf"\b{keyword}\b", normalized):
-                raise ValueError(
-                    f"Query contains dangerous keyword: {keyword}. "
-                    f"Only read-only queries are allowed."
-                )
+        error = _query_error(query, self.ALLOWED_QUERY_TYPES)
+        if error is not None:
+            raise ValueError(error)
 
     def _has_limit(self, query: str) -> bool:
-        """Check if query already has a LIMIT clause."""
-        normalized = query.strip().upper()
-        return bool(re.search(r"\bLIMIT\s+\d+", normalized))
+        """Check if query already has a LIMIT clause (literal or bind parameter)."""
+        return bool(_LIMIT_RE.search(query))
 
     def _add_limit(self, query: str, limit: int) -> str:
         """Add LIMIT clause to query if not present."""
-        # Remove trailing semicolon if present
-        query = query.rstrip().rstrip(";")
-
-        # Add LIMIT
-        return f"{query} LIMIT {limit}"
+        return _add_limit_clause(query, limit)
 
     async def test_query_syntax(self, query: str) -> tuple[bool, Optional[str]]:
         """
@@ -1,10 +1,17 @@
 """Metadata inspection using SQLAlchemy reflection."""
 
-from typing import TYPE_CHECKING, Any, Optional, cast
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, cast
 
 from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine.reflection import Inspector, ObjectKind, ObjectScope
+from sqlalchemy.exc import NoSuchTableError
 
-from db_connect_mcp.core.connection import DatabaseConnection
+from db_connect_mcp.core.connection import DatabaseConnection, uses_raw_connection
 from db_connect_mcp.models.database import SchemaInfo
 from db_connect_mcp.models.table import (
     ColumnInfo,
@@ -17,10 +24,74 @@ from db_connect_mcp.models.table import (
 if TYPE_CHECKING:
     from db_connect_mcp.adapters.base import BaseAdapter
 
+_T = TypeVar("_T")
+
+# Schemas holding database internals rather than user tables, read-only so
+# instances can share the frozensets
+_SYSTEM_SCHEMAS_BY_DIALECT: Mapping[str, frozenset[str]] = MappingProxyType(
+    {
+        "postgresql": frozenset({"information_schema", "pg_catalog", "pg_toast"}),
+        "mysql": frozenset(
+            {"information_schema", "mysql", "performance_schema", "sys"}
+        ),
+        "clickhouse": frozenset({"information_schema", "INFORMATION_SCHEMA", "system"}),
+    }
+)
+
+# Rendered names of reflected column types. str() compiles the type, and
+# reflection creates a new type object per column, so names are memoized by
+# type class and constructor arguments instead of by object
+_TYPE_NAMES: dict[tuple[Any, ...], str] = {}
+_TYPE_NAMES_MAX = 1024
+
+# Stand-in for a reflected foreign key without an "options" entry
+_EMPTY_OPTIONS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _type_name(type_: Any) -> str:
+    """Render a reflected SQLAlchemy type, e.g. ``VARCHAR(255)``."""
+    try:
+        key = (type(type_), tuple(vars(type_).items()))
+        name = _TYPE_NAMES.get(key)
+    except TypeError:
+        # Unhashable arguments, such as the value list of an ENUM
+        return str(type_)
+
+    if name is None:
+        name = str(type_)
+        if len(_TYPE_NAMES) < _TYPE_NAMES_MAX:
+            _TYPE_NAMES[key] = name
+    return name
+
+
+class _ReflectionCache(dict):
+    """SQLAlchemy info_cache holding at most maxsize entries.
+
+    Reflection only reads entries with get() and adds them with item
+    assignment, so evicting the oldest entry on insert bounds the cache.
+    Sync-only dialects reflect on worker threads, hence the lock.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            if key not in self and len(self) >= self.maxsize:
+                del self[next(iter(self))]
+            super().__setitem__(key, value)
+
 
 class MetadataInspector:
     """Database metadata inspection using SQLAlchemy Inspector."""
 
+    # Reflection results shared across calls, bounded in size and dropped
+    # wholesale after _REFLECTION_TTL seconds so outside DDL shows up
+    _REFLECTION_CACHE_SIZE = 4096
+    _REFLECTION_TTL = 60.0
+
     def __init__(self, connection: DatabaseConnection, adapter: "BaseAdapter"):
         """
         Initialize metadata inspector.
@@ -31,6 +102,69 @@ class MetadataInspector:
         """
         self.connection = connection
         self.adapter = adapter
+        self._system_schemas = _SYSTEM_SCHEMAS_BY_DIALECT.get(
+            connection.dialect, frozenset()
+        )
+        self._info_cache = _ReflectionCache(self._REFLECTION_CACHE_SIZE)
+        self._info_cache_time = time.monotonic()
+        # (schema, table) -> (fetched at, reflected foreign keys), shared by
+        # describe_table and get_relationships, see _REFLECTION_TTL
+        self._fk_cache: dict[tuple[Optional[str], str], tuple[float, list[Any]]] = {}
+        # Whether the dialect reflects check constraints; None until tried
+        self._check_constraints_supported: Optional[bool] = None
+        # Lookups still running, keyed by request, shared by identical callers
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+
+    def invalidate_cache(self) -> None:
+        """Forget cached reflection results, e.g. after DDL."""
+        self._info_cache.clear()
+        self._info_cache_time = time.monotonic()
+        self._fk_cache.clear()
+
+    def _cached_foreign_keys(
+        self, key: tuple[Optional[str], str]
+    ) -> Optional[list[Any]]:
+        """Return foreign keys reflected within _REFLECTION_TTL, else None."""
+        entry = self._fk_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > self._REFLECTION_TTL:
+            return None
+        return entry[1]
+
+    async def _coalesce(
+        self, key: tuple[Any, ...], fetch: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """
+        Await fetch(), joining an identical lookup that is already running.
+
+        Concurrent callers with the same key share one database round trip.
+        Each caller is shielded, so cancelling one does not cancel the rest.
+
+        Args:
+            key: Identifies the lookup, e.g. ("table", schema, name)
+            fetch: Starts the lookup when none is running for key
+
+        Returns:
+            The lookup result
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def forget(done: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(forget)
+        return cast(_T, await asyncio.shield(task))
+
+    def _inspect(self, sync_conn: Any) -> Inspector:
+        """Create an inspector that shares the long-lived reflection cache."""
+        if time.monotonic() - self._info_cache_time > self._REFLECTION_TTL:
+            self.invalidate_cache()
+        inspector = sa_inspect(sync_conn)
+        inspector.info_cache = self._info_cache
+        return inspector
 
     async def get_schemas(self) -> list[SchemaInfo]:
         """
@@ -39,47 +173,43 @@ class MetadataInspector:
         Returns:
             List of schema information objects
         """
-        async with self.connection.get_connection() as conn:
-            # Use run_sync to execute synchronous reflection methods
-            def get_schema_data(sync_conn):
-                inspector = sa_inspect(sync_conn)
-                all_schemas = inspector.get_schema_names()
-
-                schema_data = []
-                for schema in all_schemas:
-                    if self._is_system_schema(schema):
-                        continue
-
-                    table_count = len(inspector.get_table_names(schema=schema))
-                    view_count = None
-                    if self.adapter.capabilities.views:
-                        view_count = len(inspector.get_view_names(schema=schema))
-
-                    schema_data.append(
-                        {
-                            "name": schema,
-                            "table_count": table_count,
-                            "view_count": view_count,
-                        }
-                    )
-                return schema_data
+        return list(await self._coalesce(("schemas",), self._fetch_schemas))
 
-            schemas_data = await conn.run_sync(get_schema_data)
-            result = []
-
-            for data in schemas_data:
-                schema_info = SchemaInfo(
+    async def _fetch_schemas(self) -> list[SchemaInfo]:
+        """List all schemas, see get_schemas."""
+        async with self.connection.get_connection() as conn:
+            try:
+                # One catalog query counts the tables and views of every
+                # schema; system schemas are excluded server-side and
+                # _is_system_schema catches any the query cannot name
+                counts = await self.adapter.get_schema_object_counts(
+                    conn, self._system_schemas
+                )
+                views_ok = self.adapter.capabilities.views
+                schemas_data = [
+                    {
+                        "name": schema,
+                        "table_count": table_count,
+                        "view_count": view_count if views_ok else None,
+                    }
+                    for schema, (table_count, view_count) in counts.items()
+                    if not self._is_system_schema(schema)
+                ]
+            except NotImplementedError:
+                schemas_data = await conn.run_sync(self._reflect_schema_data)
+
+            schemas = [
+                SchemaInfo(
                     name=data["name"],
                     owner=None,  # Will be filled by adapter if available
                     table_count=data["table_count"],
                     view_count=data["view_count"],
                 )
+                for data in schemas_data
+            ]
 
-                # Let adapter enrich with database-specific info
-                schema_info = await self.adapter.enrich_schema_info(conn, schema_info)
-                result.append(schema_info)
-
-            return result
+            # Let adapter provide owners and sizes for all schemas at once
+            return await self.adapter.enrich_schemas_batch(conn, schemas)
 
     async def get_tables(
         self, schema: Optional[str] = None, include_views: bool = True
@@ -94,40 +224,53 @@ class MetadataInspector:
         Returns:
             List of basic table information
         """
-        async with self.connection.get_connection() as conn:
-            # Use run_sync to execute synchronous reflection methods
-            def get_table_data(sync_conn):
-                inspector = sa_inspect(sync_conn)
-
-                # Get table names
-                table_names = inspector.get_table_names(schema=schema)
-                table_data = []
-
-                for table_name in table_names:
-                    table_data.append({"name": table_name, "type": "BASE TABLE"})
-
-                # Get views if requested and supported
-                if include_views and self.adapter.capabilities.views:
-                    view_names = inspector.get_view_names(schema=schema)
-                    for view_name in view_names:
-                        table_data.append({"name": view_name, "type": "VIEW"})
-
-                return table_data
-
-            tables_data = await conn.run_sync(get_table_data)
-            tables = []
+        include_views = include_views and self.adapter.capabilities.views
+        tables = await self._coalesce(
+            ("tables", schema, include_views),
+            lambda: self._fetch_tables(schema, include_views),
+        )
+        return list(tables)
 
-            for data in tables_data:
-                table_info = TableInfo(
-                    name=data["name"],
-                    schema=schema,
-                    table_type=data["type"],
+    async def _fetch_tables(
+        self, schema: Optional[str], include_views: bool
+    ) -> list[TableInfo]:
+        """List the tables of a schema, see get_tables."""
+        async with self.connection.get_connection() as conn:
+            try:
+                # One catalog query lists both tables and views
+                tables_data = await self.adapter.list_tables(
+                    conn, schema, include_views
                 )
-                # Let adapter provide size and row count efficiently
-                table_info = await self.adapter.enrich_table_info(conn, table_info)
-                tables.append(table_info)
+            except NotImplementedError:
+                # Use run_sync to execute synchronous reflection methods
+                @uses_raw_connection
+                def get_table_data(sync_conn):
+                    inspector = self._inspect(sync_conn)
+
+                    # Get table names
+                    table_data = [
+                        (table_name, "BASE TABLE")
+                        for table_name in inspector.get_table_names(schema=schema)
+                    ]
+
+                    # Get views if requested and supported
+                    if include_views:
+                        table_data.extend(
+                            (view_name, "VIEW")
+                            for view_name in inspector.get_view_names(schema=schema)
+                        )
+
+                    return table_data
+
+                tables_data = await conn.run_sync(get_table_data)
+
+            tables = [
+                TableInfo(name=name, schema=schema, table_type=table_type)
+                for name, table_type in tables_data
+            ]
 
-            return tables
+            # Let adapter provide sizes and row counts for all tables at once
+            return await self.adapter.enrich_tables_batch(conn, tables)
 
     async def describe_table(
         self, table_name: str, schema: Optional[str] = None
@@ -142,127 +285,58 @@ class MetadataInspector:
         Returns:
             Comprehensive table information
         """
-        async with self.connection.get_connection() as conn:
-            # Use run_sync to execute all synchronous reflection methods
-            def get_table_details(sync_conn):
-                inspector = sa_inspect(sync_conn)
-
-                # Gather all table metadata
-                result = {
-                    "columns": inspector.get_columns(table_name, schema=schema),
-                    "pk_constraint": inspector.get_pk_constraint(
-                        table_name, schema=schema
-                    ),
-                    "indexes": [],
-                    "foreign_keys": [],
-                    "unique_constraints": inspector.get_unique_constraints(
-                        table_name, schema=schema
-                    ),
-                    "check_constraints": [],
-                }
-
-                # Get indexes if supported
-                if self.adapter.capabilities.indexes:
-                    result["indexes"] = inspector.get_indexes(table_name, schema=schema)
-
-                # Get foreign keys if supported
-                if self.adapter.capabilities.foreign_keys:
-                    result["foreign_keys"] = inspector.get_foreign_keys(
-                        table_name, schema=schema
-                    )
-
-                # Try to get check constraints
-                try:
-                    result["check_constraints"] = inspector.get_check_constraints(
-                        table_name, schema=schema
-                    )
-                except NotImplementedError:
-                    pass
-
-                return result
-
-            table_data = await conn.run_sync(get_table_details)
+        (table_info,) = await self._coalesce(
+            ("table", schema, table_name),
+            lambda: self.describe_tables([table_name], schema),
+        )
+        return table_info
 
-            # Basic info
-            table_info = TableInfo(
-                name=table_name,
-                schema=schema,
-                table_type="BASE TABLE",  # Will be updated if it's a view
-            )
+    async def describe_tables(
+        self, table_names: list[str], schema: Optional[str] = None
+    ) -> list[TableInfo]:
+        """
+        Get comprehensive descriptions of several tables in one schema.
 
-            # Columns
-            table_info.columns = [
-                self._column_from_sa(cast(dict[str, Any], col_data))
-                for col_data in table_data["columns"]
-            ]
+        All tables are reflected together in a single run_sync, one catalog
+        query per metadata kind on dialects with batched reflection, and
+        enriched through the adapter's batch hook.
 
-            # Primary key
-            pk_constraint = table_data["pk_constraint"]
-            if pk_constraint and pk_constraint.get("constrained_columns"):
-                pk_cols = pk_constraint["constrained_columns"]
-                for col in table_info.columns:
-                    if col.name in pk_cols:
-                        col.primary_key = True
-
-            # Indexes
-            for idx_data in table_data["indexes"]:
-                index = self._index_from_sa(cast(dict[str, Any], idx_data))
-                table_info.indexes.append(index)
-
-                # Mark indexed columns
-                for col_name in index.columns:
-                    col = table_info.get_column(col_name)
-                    if col:
-                        col.indexed = True
+        Args:
+            table_names: Table names
+            schema: Schema name (None for default)
 
-            # Foreign keys
-            for fk in table_data["foreign_keys"]:
-                constraint = self._fk_constraint_from_sa(cast(dict[str, Any], fk))
-                table_info.constraints.append(constraint)
+        Returns:
+            Comprehensive table information, in the same order as table_names
 
-                # Mark FK columns
-                for col_name in constraint.columns:
-                    col = table_info.get_column(col_name)
-                    if col and constraint.referenced_table:
-                        ref_cols = ",".join(constraint.referenced_columns or [])
-                        col.foreign_key = f"{constraint.referenced_table}.{ref_cols}"
-
-            # Unique constraints
-            for uniq in table_data["unique_constraints"]:
-                constraint = ConstraintInfo(
-                    name=uniq["name"],
-                    constraint_type="UNIQUE",
-                    columns=uniq["column_names"],
+        Raises:
+            NoSuchTableError: If any of the tables does not exist
+        """
+        async with self.connection.get_connection() as conn:
+            # Use run_sync to execute all synchronous reflection methods
+            @uses_raw_connection
+            def get_tables_details(sync_conn):
+                return self._reflect_tables(
+                    self._inspect(sync_conn), table_names, schema
                 )
-                table_info.constraints.append(constraint)
 
-                # Mark unique columns
-                for col_name in constraint.columns:
-                    col = table_info.get_column(col_name)
-                    if col:
-                        col.unique = True
-
-            # Check constraints
-            for check in table_data["check_constraints"]:
-                constraint = ConstraintInfo(
-                    name=check["name"],
-                    constraint_type="CHECK",
-                    columns=[],  # Check constraints don't always map to specific columns
-                    definition=check.get("sqltext"),
-                )
-                table_info.constraints.append(constraint)
+            tables_data = await conn.run_sync(get_tables_details)
+            tables = [
+                self._table_from_reflection(name, schema, tables_data[name])
+                for name in table_names
+            ]
 
             # Let adapter enrich with database-specific info
-            table_info = await self.adapter.enrich_table_info(conn, table_info)
+            tables = await self.adapter.enrich_tables_batch(conn, tables)
 
             # Enrich column comments from database metadata
             # This provides more reliable comment retrieval than SQLAlchemy reflection
             if self.adapter.capabilities.comments:
-                table_info.columns = await self.adapter.enrich_column_comments(
-                    conn, table_name, schema, table_info.columns
-                )
+                for table_info in tables:
+                    table_info.columns = await self.adapter.enrich_column_comments(
+                        conn, table_info.name, schema, table_info.columns
+                    )
 
-            return table_info
+            return tables
 
     async def get_relationships(
         self, table_name: str, schema: Optional[str] = None
@@ -280,39 +354,254 @@ class MetadataInspector:
         if not self.adapter.capabilities.foreign_keys:
             return []
 
+        # describe_table may already have reflected these foreign keys
+        key = (schema, table_name)
+        fk_data = self._cached_foreign_keys(key)
+        if fk_data is None:
+            fk_data = await self._coalesce(
+                ("foreign_keys", schema, table_name),
+                lambda: self._fetch_foreign_keys(table_name, schema),
+            )
+
+        relationships = []
+
+        for fk in fk_data:
+            fk_dict = cast(dict[str, Any], fk)
+            constraint_name = fk_dict.get("name") or f"fk_{table_name}_auto"
+            options = fk_dict.get("options") or _EMPTY_OPTIONS
+            rel = RelationshipInfo(
+                from_table=table_name,
+                from_schema=schema,
+                from_columns=fk_dict["constrained_columns"],
+                to_table=fk_dict["referred_table"],
+                to_schema=fk_dict.get("referred_schema"),
+                to_columns=fk_dict["referred_columns"],
+                constraint_name=constraint_name,
+                on_delete=options.get("ondelete"),
+                on_update=options.get("onupdate"),
+            )
+            relationships.append(rel)
+
+        return relationships
+
+    async def _fetch_foreign_keys(
+        self, table_name: str, schema: Optional[str]
+    ) -> list[Any]:
+        """Reflect the foreign keys of a table and cache them."""
         async with self.connection.get_connection() as conn:
             # Use run_sync to execute synchronous reflection methods
+            @uses_raw_connection
             def get_fk_data(sync_conn):
-                inspector = sa_inspect(sync_conn)
+                inspector = self._inspect(sync_conn)
                 return inspector.get_foreign_keys(table_name, schema=schema)
 
             fk_data = await conn.run_sync(get_fk_data)
-            relationships = []
-
-            for fk in fk_data:
-                fk_dict = cast(dict[str, Any], fk)
-                constraint_name = fk_dict.get("name") or f"fk_{table_name}_auto"
-                rel = RelationshipInfo(
-                    from_table=table_name,
-                    from_schema=schema,
-                    from_columns=fk_dict["constrained_columns"],
-                    to_table=fk_dict["referred_table"],
-                    to_schema=fk_dict.get("referred_schema"),
-                    to_columns=fk_dict["referred_columns"],
-                    constraint_name=constraint_name,
-                    on_delete=fk_dict.get("options", {}).get("ondelete"),
-                    on_update=fk_dict.get("options", {}).get("onupdate"),
+        self._fk_cache[(schema, table_name)] = (time.monotonic(), fk_data)
+        return fk_data
+
+    @uses_raw_connection
+    def _reflect_schema_data(self, sync_conn: Any) -> list[dict[str, Any]]:
+        """Reflect the table and view counts of each non-system schema."""
+        inspector = self._inspect(sync_conn)
+        all_schemas = inspector.get_schema_names()
+        views_ok = self.adapter.capabilities.views
+
+        schema_data = []
+        for schema in all_schemas:
+            if self._is_system_schema(schema):
+                continue
+
+            table_count = len(inspector.get_table_names(schema=schema))
+            view_count = None
+            if views_ok:
+                view_count = len(inspector.get_view_names(schema=schema))
+
+            schema_data.append(
+                {
+                    "name": schema,
+                    "table_count": table_count,
+                    "view_count": view_count,
+                }
+            )
+        return schema_data
+
+    def _reflect_tables(
+        self, inspector: Inspector, table_names: list[str], schema: Optional[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Reflect columns, keys, indexes and constraints of several tables.
+
+        Uses the get_multi_* reflection API filtered to the tables, which
+        dialects such as PostgreSQL answer with one catalog query per kind.
+        Dialects without a batched implementation fall back to per-table
+        queries inside SQLAlchemy.
+
+        Args:
+            inspector: SQLAlchemy inspector bound to a sync connection
+            table_names: Table names
+            schema: Schema name (None for default)
+
+        Returns:
+            Reflected metadata keyed by kind, per table name
+
+        Raises:
+            NoSuchTableError: If any of the tables does not exist
+        """
+        capabilities = self.adapter.capabilities
+        # Match any table, view or temporary table, like the per-table calls
+        options: dict[str, Any] = {
+            "filter_names": table_names,
+            "kind": ObjectKind.ANY,
+            "scope": ObjectScope.ANY,
+        }
+
+        columns = inspector.get_multi_columns(schema=schema, **options)
+        for table_name in table_names:
+            if (schema, table_name) not in columns:
+                raise NoSuchTableError(table_name)
+
+        pk_constraints = inspector.get_multi_pk_constraint(schema=schema, **options)
+        unique_constraints = inspector.get_multi_unique_constraints(
+            schema=schema, **options
+        )
+
+        # Get indexes if supported
+        indexes = {}
+        if capabilities.indexes:
+            indexes = inspector.get_multi_indexes(schema=schema, **options)
+
+        # Get foreign keys if supported, sharing them with get_relationships
+        foreign_keys: dict[str, list[Any]] = {}
+        if capabilities.foreign_keys:
+            uncached = []
+            for table_name in table_names:
+                cached = self._cached_foreign_keys((schema, table_name))
+                if cached is None:
+                    uncached.append(table_name)
+                else:
+                    foreign_keys[table_name] = cached
+            if uncached:
+                reflected = inspector.get_multi_foreign_keys(
+                    schema=schema, **{**options, "filter_names": uncached}
                 )
-                relationships.append(rel)
+                now = time.monotonic()
+                for table_name in uncached:
+                    key = (schema, table_name)
+                    foreign_keys[table_name] = reflected.get(key, [])
+                    self._fk_cache[key] = (now, foreign_keys[table_name])
+
+        # Try to get check constraints, unless the dialect already said no
+        check_constraints = {}
+        if self._check_constraints_supported is not False:
+            try:
+                check_constraints = inspector.get_multi_check_constraints(
+                    schema=schema, **options
+                )
+                self._check_constraints_supported = True
+            except NotImplementedError:
+                self._check_constraints_supported = False
+
+        result = {}
+        for table_name in table_names:
+            key = (schema, table_name)
+            result[table_name] = {
+                "columns": columns[key],
+                "pk_constraint": pk_constraints.get(key),
+                "indexes": indexes.get(key, []),
+                "foreign_keys": foreign_keys.get(table_name, []),
+                "unique_constraints": unique_constraints.get(key, []),
+                "check_constraints": check_constraints.get(key, []),
+            }
+        return result
+
+    def _table_from_reflection(
+        self, table_name: str, schema: Optional[str], table_data: dict[str, Any]
+    ) -> TableInfo:
+        """Assemble TableInfo from the metadata reflected by _reflect_tables."""
+        # Basic info
+        table_info = TableInfo(
+            name=table_name,
+            schema=schema,
+            table_type="BASE TABLE",  # Will be updated if it's a view
+        )
 
-            return relationships
+        # Columns
+        table_info.columns = [
+            self._column_from_sa(cast(dict[str, Any], col_data))
+            for col_data in table_data["columns"]
+        ]
+        # Index columns by name once for the constraint loops below
+        col_by_name = {col.name: col for col in table_info.columns}
+
+        # Primary key
+        pk_constraint = table_data["pk_constraint"]
+        if pk_constraint and pk_constraint.get("constrained_columns"):
+            for col_name in pk_constraint["constrained_columns"]:
+                col = col_by_name.get(col_name)
+                if col:
+                    col.primary_key = True
+
+        # Indexes
+        for idx_data in table_data["indexes"]:
+            index = self._index_from_sa(cast(dict[str, Any], idx_data))
+            table_info.indexes.append(index)
+
+            # Mark indexed columns
+            for col_name in index.columns:
+                col = col_by_name.get(col_name)
+                if col:
+                    col.indexed = True
+
+        # Foreign keys
+        for fk in table_data["foreign_keys"]:
+            constraint = self._fk_constraint_from_sa(cast(dict[str, Any], fk))
+            table_info.constraints.append(constraint)
+
+            # Mark FK columns
+            if constraint.referenced_table:
+                ref_cols = ",".join(constraint.referenced_columns or [])
+                foreign_key = f"{constraint.referenced_table}.{ref_cols}"
+                for col_name in constraint.columns:
+                    col = col_by_name.get(col_name)
+                    if col:
+                        col.foreign_key = foreign_key
+
+        # Unique constraints
+        for uniq in table_data["unique_constraints"]:
+            constraint = ConstraintInfo.model_construct(
+                name=uniq["name"],
+                constraint_type="UNIQUE",
+                columns=uniq["column_names"],
+            )
+            table_info.constraints.append(constraint)
+
+            # Mark unique columns
+            for col_name in constraint.columns:
+                col = col_by_name.get(col_name)
+                if col:
+                    col.unique = True
+
+        # Check constraints
+        for check in table_data["check_constraints"]:
+            constraint = ConstraintInfo.model_construct(
+                name=check["name"],
+                constraint_type="CHECK",
+                columns=[],  # Check constraints don't always map to specific columns
+                definition=check.get("sqltext"),
+            )
+            table_info.constraints.append(constraint)
+
+        return table_info
 
+    # The _*_from_sa helpers and the constraints built in _table_from_reflection
+    # take reflected values whose types SQLAlchemy already guarantees,
+    # coercing the rest, so they skip Pydantic validation with model_construct
     def _column_from_sa(self, col_data: dict) -> ColumnInfo:
         """Convert SQLAlchemy column data to ColumnInfo."""
-        return ColumnInfo(
+        return ColumnInfo.model_construct(
             name=col_data["name"],
-            data_type=str(col_data["type"]),
-            nullable=col_data["nullable"],
+            data_type=_type_name(col_data["type"]),
+            nullable=bool(col_data["nullable"]),
             default=str(col_data["default"]) if col_data.get("default") else None,
             primary_key=False,  # Will be set later
             foreign_key=None,  # Will be set later
@@ -337,16 +626,16 @@ class MetadataInspector:
         else:
             columns = [c for c in column_names if c is not None]
 
-        return IndexInfo(
+        return IndexInfo.model_construct(
             name=idx_data["name"],
             columns=columns,
-            unique=idx_data.get("unique", False),
+            unique=bool(idx_data.get("unique", False)),
             index_type=idx_data.get("type"),
         )
 
     def _fk_constraint_from_sa(self, fk_data: dict) -> ConstraintInfo:
         """Convert SQLAlchemy FK data to ConstraintInfo."""
-        return ConstraintInfo(
+        return ConstraintInfo.model_construct(
             name=fk_data["name"],
             constraint_type="FOREIGN KEY",
             columns=fk_data["constrained_columns"],
@@ -356,20 +645,14 @@ class MetadataInspector:
 
     def _is_system_schema(self, schema: str) -> bool:
         """Check if schema is a system schema to skip."""
-        system_schemas = {
-            "postgresql": {"information_schema", "pg_catalog", "pg_toast"},
-            "mysql": {"information_schema", "mysql", "performance_schema", "sys"},
-            "clickhouse": {"information_schema", "INFORMATION_SCHEMA", "system"},
-        }
-
-        dialect = self.connection.dialect
-
         # Check exact matches first
-        if schema in system_schemas.get(dialect, set()):
+        if schema in self._system_schemas:
             return True
 
         # For PostgreSQL, also filter TimescaleDB internal schemas
-        if dialect == "postgresql" and schema.startswith("_timescaledb"):
+        if self.connection.dialect == "postgresql" and schema.startswith(
+            "_timescaledb"
+        ):
             return True
 
         return False
@@ -12,6 +12,7 @@ ClickHouse), and benefits from the inspector's existing system-schema
 filtering and adapter-driven enrichment.
 """
 
+import asyncio
 import logging
 import re
 from typing import TYPE_CHECKING, Optional
@@ -39,6 +40,10 @@ logger = logging.getLogger(__name__)
 # users who don't pass ``schema``/``table`` filters.
 MAX_TABLES_TO_DESCRIBE = 200
 
+# Tables described at once during column/index search. Each describe holds a
+# pooled connection, so fewer run at once when the pool is smaller.
+DESCRIBE_CONCURRENCY = 5
+
 # Lower bound and upper bound for the result limit, matching dbhub.
 MIN_LIMIT = 1
 MAX_LIMIT = 1000
@@ -173,6 +178,20 @@ class ObjectSearcher:
 
         # ----- Walk schemas / tables -----
         described_count = 0
+        describe_slots = asyncio.Semaphore(
+            min(DESCRIBE_CONCURRENCY, self.inspector.connection.max_connections)
+        )
+
+        async def describe(t: TableInfo, sch: str) -> Optional[TableInfo]:
+            async with describe_slots:
+                try:
+                    return await self.inspector.describe_table(t.name, sch)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to describe table %r in schema %r: %s", t.name, sch, e
+                    )
+                    return None
+
         for sch in target_schema_names:
             try:
                 tables_in_schema = await self.inspector.get_tables(
@@ -201,18 +220,19 @@ class ObjectSearcher:
             if not wants_describe:
                 continue
 
-            for t in tables_in_schema:
-                if described_count >= MAX_TABLES_TO_DESCRIBE:
-                    early_termination = True
-                    break
-                described_count += 1
+            # Past the cap, keep matching table/view names but stop describing
+            to_describe = tables_in_schema[: MAX_TABLES_TO_DESCRIBE - described_count]
+            if len(to_describe) < len(tables_in_schema):
+                early_termination = True
+            if not to_describe:
+                continue
+            described_count += len(to_describe)
 
-                try:
-                    info = await self.inspector.describe_table(t.name, sch)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to describe table %r in schema %r: %s", t.name, sch, e
-                    )
+            # Tables are independent, so describe them concurrently
+            infos = await asyncio.gather(*(describe(t, sch) for t in to_describe))
+
+            for info in infos:
+                if info is None:
                     continue
 
                 if wants_column:
@@ -229,9 +249,6 @@ class ObjectSearcher:
                                 self._index_to_result(idx, info, detail_level)
                             )
 
-            if early_termination:
-                break
-
         if early_termination:
             notes.append(
                 f"Hit per-call cap of {MAX_TABLES_TO_DESCRIBE} described tables. "
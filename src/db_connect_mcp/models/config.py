@@ -152,6 +152,22 @@ class DatabaseConfig(BaseModel):
         le=300,
         description="Pool checkout timeout in seconds",
     )
+    pool_recycle: int = Field(
+        default=1800,
+        ge=-1,
+        le=86400,
+        description=(
+            "Replace pooled connections older than this many seconds, before "
+            "server-side idle timeouts close them (-1 disables)"
+        ),
+    )
+    pool_use_lifo: bool = Field(
+        default=True,
+        description=(
+            "Reuse the most recently returned connection first, keeping a warm "
+            "working set instead of cycling through every pooled connection"
+        ),
+    )
     read_only: bool = Field(
         default=True,
         description="Enforce read-only connections",
@@ -162,6 +178,14 @@ class DatabaseConfig(BaseModel):
         le=3600,
         description="Statement execution timeout in seconds",
     )
+    max_result_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=1024,
+        description=(
+            "Cap on the encoded size of execute_query result rows; rows past "
+            "it are dropped and the result is marked truncated"
+        ),
+    )
     echo_sql: bool = Field(
         default=False,
         description="Echo SQL statements to stdout",
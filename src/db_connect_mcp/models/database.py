@@ -5,6 +5,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 from db_connect_mcp.models.capabilities import DatabaseCapabilities
+from db_connect_mcp.models.formatting import format_size
 
 
 class SchemaInfo(BaseModel):
@@ -23,12 +24,7 @@ class SchemaInfo(BaseModel):
         if self.size_bytes is None:
             return None
 
-        size = float(self.size_bytes)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        return format_size(self.size_bytes)
 
 
 class DatabaseInfo(BaseModel):
@@ -62,12 +58,7 @@ class DatabaseInfo(BaseModel):
         if self.size_bytes is None:
             return None
 
-        size = float(self.size_bytes)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        return format_size(self.size_bytes)
 
     def get_feature_summary(self) -> str:
         """Get a summary of supported features."""
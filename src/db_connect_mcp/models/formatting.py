@@ -0,0 +1,22 @@
+"""Formatting helpers shared by the metadata models."""
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def format_size(size_bytes: int, max_unit: str = "PB") -> str:
+    """Format a byte count with a binary unit, e.g. ``"1.50 KB"``.
+
+    The unit is picked from the position of the highest set bit instead of
+    dividing by 1024 once per step; powers of two divide exactly, so the
+    result matches the step-by-step division.
+
+    Args:
+        size_bytes: Size in bytes
+        max_unit: Largest unit to use; bigger sizes are shown in this unit
+
+    Returns:
+        Size with two decimals and its unit
+    """
+    last = _SIZE_UNITS.index(max_unit)
+    index = min((size_bytes.bit_length() - 1) // 10, last) if size_bytes > 0 else 0
+    return f"{size_bytes / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
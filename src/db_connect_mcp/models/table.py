@@ -5,6 +5,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from db_connect_mcp.models.formatting import format_size
+
 # Suppress the specific warning about field 'schema' shadowing
 warnings.filterwarnings(
     "ignore",
@@ -69,12 +71,7 @@ class IndexInfo(BaseModel):
         if self.size_bytes is None:
             return None
 
-        size = float(self.size_bytes)
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} TB"
+        return format_size(self.size_bytes, max_unit="TB")
 
 
 class ConstraintInfo(BaseModel):
@@ -155,12 +152,7 @@ class TableInfo(BaseModel):
         if self.size_bytes is None:
             return None
 
-        size = float(self.size_bytes)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        return format_size(self.size_bytes)
 
     @property
     def total_size_bytes(self) -> Optional[int]:
@@ -176,12 +168,7 @@ class TableInfo(BaseModel):
         if total is None:
             return None
 
-        size = float(total)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        return format_size(total)
 
     @property
     def primary_key_columns(self) -> list[str]:
@@ -9,8 +9,10 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Optional, cast
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional, TypedDict, cast
 
+import orjson
 from dotenv import load_dotenv
 from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
@@ -24,6 +26,8 @@ from mcp.types import (
     TextContent,
     Tool,
 )
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.engine.url import URL, make_url
 
 from db_connect_mcp.adapters import create_adapter
 from db_connect_mcp.core import (
@@ -34,7 +38,9 @@ from db_connect_mcp.core import (
     StatisticsAnalyzer,
 )
 from db_connect_mcp.models.config import DatabaseConfig, SSHTunnelConfig
+from db_connect_mcp.models.database import DatabaseInfo, SchemaInfo
 from db_connect_mcp.models.search import SearchDetailLevel, SearchObjectType
+from db_connect_mcp.models.table import RelationshipInfo, TableInfo
 
 # Load environment variables
 load_dotenv()
@@ -43,6 +49,9 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Coroutine implementing one MCP tool, called with the tool arguments
+ToolHandler = Callable[[dict[str, Any]], Awaitable[list[TextContent]]]
+
 
 # Response size limits (in characters) for MCP tool responses
 # These limits prevent context window exhaustion while preserving useful information
@@ -58,6 +67,90 @@ MAX_RESPONSE_EXPLAIN_QUERY = 100000  # Query execution plans
 MAX_RESPONSE_EXECUTE_QUERY = 100000  # Query results (up to 1000 rows)
 MAX_RESPONSE_SEARCH_OBJECTS = 100000  # Cross-cutting object search results
 
+# Serializers for list responses, encoding a whole list in one pass
+_SCHEMA_LIST = TypeAdapter(list[SchemaInfo])
+_TABLE_LIST = TypeAdapter(list[TableInfo])
+_RELATIONSHIP_LIST = TypeAdapter(list[RelationshipInfo])
+
+# Input schema shared by the tools that take no arguments
+_EMPTY_INPUT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": [],
+}
+
+# Result sets with more rows than this are serialized in a worker thread
+OFFLOAD_DUMP_MIN_ROWS = 200
+
+
+def _dump_json(data: Any) -> str:
+    """
+    Serialize a tool response as indented JSON.
+
+    Pydantic models are encoded directly by pydantic-core, without building
+    an intermediate dict. Other data goes through orjson, falling back to the
+    standard library encoder for values orjson rejects, such as integers
+    wider than 64 bits.
+
+    Args:
+        data: A pydantic model, or JSON-compatible data such as the output of
+            ``model_dump(mode="json")``
+
+    Returns:
+        JSON string indented by two spaces
+    """
+    if isinstance(data, BaseModel):
+        return data.model_dump_json(indent=2)
+    try:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(data, indent=2)
+
+
+def _sanitize_url(url: str) -> str:
+    """
+    Replace the credentials of a database URL with a placeholder.
+
+    Args:
+        url: Database connection URL
+
+    Returns:
+        The URL with any username and password shown as ``<credentials>``
+    """
+    parsed = make_url(url)
+    if parsed.username is None and parsed.password is None:
+        return url
+    bare = URL.create(
+        parsed.drivername,
+        host=parsed.host,
+        port=parsed.port,
+        database=parsed.database,
+        query=parsed.query,
+    ).render_as_string()
+    scheme, rest = bare.split("://", 1)
+    return f"{scheme}://<credentials>@{rest}"
+
+
+async def _dump_json_rows(data: Any, row_count: int) -> str:
+    """
+    Serialize a response holding result rows, off the event loop if large.
+
+    Encoding a result set of many rows is long enough to stall other tool
+    calls, so above OFFLOAD_DUMP_MIN_ROWS rows it runs in a worker thread.
+
+    Args:
+        data: Response data, see _dump_json
+        row_count: Number of result rows in data
+
+    Returns:
+        JSON string indented by two spaces
+    """
+    if row_count > OFFLOAD_DUMP_MIN_ROWS:
+        return await asyncio.to_thread(_dump_json, data)
+    return _dump_json(data)
+
 
 def truncate_json_response(data: str, max_length: int) -> str:
     """
@@ -75,14 +168,13 @@ def truncate_json_response(data: str, max_length: int) -> str:
 
     # If response is too large, return an error message instead
     # This ensures we always return valid JSON
-    return json.dumps(
+    return _dump_json(
         {
             "error": "Response too large",
             "original_size": len(data),
             "limit": max_length,
             "message": "Response exceeds size limit. Please use more specific filters or query parameters to reduce data size.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -362,7 +454,7 @@ def apply_dynamic_comment_limits(
         col["comment"] = None
 
     # Calculate base size (table structure without comments)
-    base_json = json.dumps(table_copy, indent=2)
+    base_json = _dump_json(table_copy)
     base_size = len(base_json)
 
     # Calculate available budget for comments
@@ -438,12 +530,21 @@ class DatabaseMCPServer:
             config: Database configuration
         """
         self.config = config
+        # Connection details reported by get_database_info, parsed once
+        self._db_name = config.database or ""
+        self._sanitized_url = _sanitize_url(config.url)
+        # get_database_info response; every field is fixed while connected
+        self._db_info_response: Optional[list[TextContent]] = None
         self.connection = DatabaseConnection(config)
         self.adapter = create_adapter(config)
         self.inspector: Optional[MetadataInspector] = None
         self.executor: Optional[QueryExecutor] = None
         self.analyzer: Optional[StatisticsAnalyzer] = None
         self.searcher: Optional[ObjectSearcher] = None
+        # Tool surface, built on first use; capabilities never change afterwards
+        self._tools: Optional[list[Tool]] = None
+        # Tool name -> (handler, compiled argument validator) for available tools
+        self._dispatch: dict[str, tuple[ToolHandler, Draft202012Validator]] = {}
         self.server = Server(
             "db-connect-mcp",
             on_list_tools=self._list_tools,
@@ -455,7 +556,9 @@ class DatabaseMCPServer:
         await self.connection.initialize()
 
         self.inspector = MetadataInspector(self.connection, self.adapter)
-        self.executor = QueryExecutor(self.connection, self.adapter)
+        self.executor = QueryExecutor(
+            self.connection, self.adapter, self.config.max_result_bytes
+        )
         self.analyzer = StatisticsAnalyzer(self.connection, self.adapter)
         self.searcher = ObjectSearcher(self.inspector)
 
@@ -469,9 +572,9 @@ class DatabaseMCPServer:
 
     async def _register_tools(self) -> None:
         """Register MCP tools based on database capabilities."""
-        # Low-level MCP v2 handlers are bound in the Server constructor.
-        # This hook remains for tool-related initialization work.
-        pass
+        # Low-level MCP v2 handlers are bound in the Server constructor; build
+        # the tool list and dispatch table now so the first request finds them
+        self._available_tools()
 
     async def _list_tools(
         self,
@@ -482,6 +585,39 @@ class DatabaseMCPServer:
         return ListToolsResult(tools=self._available_tools())
 
     def _available_tools(self) -> list[Tool]:
+        """Return the tool surface supported by the configured database.
+
+        The list is built once and reused, since the adapter's capabilities
+        are fixed for the lifetime of the server.
+        """
+        if self._tools is None:
+            self._tools = self._build_tools()
+            handlers = self._tool_handlers()
+            self._dispatch = {
+                tool.name: (
+                    handlers[tool.name],
+                    Draft202012Validator(tool.input_schema),
+                )
+                for tool in self._tools
+            }
+        return self._tools
+
+    def _tool_handlers(self) -> dict[str, ToolHandler]:
+        """Map every tool name to its handler, regardless of capabilities."""
+        return {
+            "get_database_info": self.handle_get_database_info,
+            "list_schemas": self.handle_list_schemas,
+            "list_tables": self.handle_list_tables,
+            "describe_table": self.handle_describe_table,
+            "execute_query": self.handle_execute_query,
+            "sample_data": self.handle_sample_data,
+            "search_objects": self.handle_search_objects,
+            "get_table_relationships": self.handle_get_relationships,
+            "analyze_column": self.handle_analyze_column,
+            "explain_query": self.handle_explain_query,
+        }
+
+    def _build_tools(self) -> list[Tool]:
         """Build the tool surface supported by the configured database."""
         tools = [
             self._create_get_database_info_tool(),
@@ -510,28 +646,9 @@ class DatabaseMCPServer:
         params: CallToolRequestParams,
     ) -> CallToolResult:
         """Dispatch a tool call while preserving model-visible error results."""
-        handlers = {
-            "get_database_info": self.handle_get_database_info,
-            "list_schemas": self.handle_list_schemas,
-            "list_tables": self.handle_list_tables,
-            "describe_table": self.handle_describe_table,
-            "execute_query": self.handle_execute_query,
-            "sample_data": self.handle_sample_data,
-            "search_objects": self.handle_search_objects,
-        }
-        if self.adapter.capabilities.foreign_keys:
-            handlers["get_table_relationships"] = self.handle_get_relationships
-        if self.adapter.capabilities.advanced_stats:
-            handlers["analyze_column"] = self.handle_analyze_column
-        if self.adapter.capabilities.explain_plans:
-            handlers["explain_query"] = self.handle_explain_query
-
-        handler = handlers.get(params.name)
-        available_tool = next(
-            (tool for tool in self._available_tools() if tool.name == params.name),
-            None,
-        )
-        if handler is None or available_tool is None:
+        self._available_tools()  # builds the dispatch table on first use
+        dispatch = self._dispatch.get(params.name)
+        if dispatch is None:
             return CallToolResult(
                 content=[
                     TextContent(
@@ -542,9 +659,10 @@ class DatabaseMCPServer:
                 isError=True,
             )
 
+        handler, validator = dispatch
         arguments = params.arguments or {}
         try:
-            Draft202012Validator(available_tool.input_schema).validate(arguments)
+            validator.validate(arguments)
         except ValidationError as exc:
             return CallToolResult(
                 content=[
@@ -572,11 +690,7 @@ class DatabaseMCPServer:
         return Tool(
             name="get_database_info",
             description="Get database information including version, size, and capabilities",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
+            inputSchema=_EMPTY_INPUT_SCHEMA,
         )
 
     def _create_list_schemas_tool(self) -> Tool:
@@ -584,11 +698,7 @@ class DatabaseMCPServer:
         return Tool(
             name="list_schemas",
             description="List all schemas/databases in the database instance",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
+            inputSchema=_EMPTY_INPUT_SCHEMA,
         )
 
     def _create_list_tables_tool(self) -> Tool:
@@ -832,19 +942,13 @@ class DatabaseMCPServer:
         if self.inspector is None:
             raise RuntimeError("Server not initialized")
 
-        version = await self.connection.get_version()
-
-        # Sanitize connection URL (remove password)
-        url_parts = self.config.url.split("@")
-        if len(url_parts) > 1:
-            sanitized_url = f"<credentials>@{url_parts[-1]}"
-        else:
-            sanitized_url = self.config.url
+        if self._db_info_response is not None:
+            return list(self._db_info_response)
 
-        from db_connect_mcp.models.database import DatabaseInfo
+        version = await self.connection.get_version()
 
         db_info = DatabaseInfo(
-            name=self.config.url.split("/")[-1],  # Extract DB name from URL
+            name=self._db_name,
             dialect=self.config.dialect,
             version=version,
             size_bytes=None,
@@ -853,17 +957,18 @@ class DatabaseMCPServer:
             capabilities=self.adapter.capabilities,
             server_encoding=None,
             collation=None,
-            connection_url=sanitized_url,
+            connection_url=self._sanitized_url,
             read_only=self.config.read_only,
         )
 
-        response = json.dumps(db_info.model_dump(mode="json"), indent=2)
-        return [
+        response = _dump_json(db_info)
+        self._db_info_response = [
             TextContent(
                 type="text",
                 text=truncate_json_response(response, MAX_RESPONSE_DATABASE_INFO),
             )
         ]
+        return list(self._db_info_response)
 
     async def handle_list_schemas(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle list_schemas request."""
@@ -871,17 +976,25 @@ class DatabaseMCPServer:
             raise RuntimeError("Server not initialized")
 
         schemas = await self.inspector.get_schemas()
-        schemas_data = [s.model_dump(mode="json") for s in schemas]
+        if not any(
+            s.comment and len(s.comment) > MAX_SCHEMA_COMMENT_LENGTH for s in schemas
+        ):
+            # Nothing to truncate, so encode the models directly
+            response = _SCHEMA_LIST.dump_json(schemas, indent=2).decode()
+        else:
+            schemas_data = [s.model_dump(mode="json") for s in schemas]
 
-        # Apply truncation to schema comments
-        schemas_data, truncated_fields = apply_truncation_to_list_schemas(
-            schemas_data, MAX_RESPONSE_LIST_SCHEMAS
-        )
+            # Apply truncation to schema comments
+            schemas_data, truncated_fields = apply_truncation_to_list_schemas(
+                schemas_data, MAX_RESPONSE_LIST_SCHEMAS
+            )
 
-        # Wrap with truncation info if any fields were truncated
-        result = wrap_list_response_with_truncation_info(schemas_data, truncated_fields)
+            # Wrap with truncation info if any fields were truncated
+            result = wrap_list_response_with_truncation_info(
+                schemas_data, truncated_fields
+            )
+            response = _dump_json(result)
 
-        response = json.dumps(result, indent=2)
         return [
             TextContent(
                 type="text",
@@ -898,17 +1011,25 @@ class DatabaseMCPServer:
         include_views = arguments.get("include_views", True)
 
         tables = await self.inspector.get_tables(schema, include_views)
-        tables_data = [t.model_dump(mode="json") for t in tables]
+        if not any(
+            t.comment and len(t.comment) > MAX_TABLE_COMMENT_LENGTH for t in tables
+        ):
+            # Nothing to truncate, so encode the models directly
+            response = _TABLE_LIST.dump_json(tables, indent=2).decode()
+        else:
+            tables_data = [t.model_dump(mode="json") for t in tables]
 
-        # Apply truncation to table comments
-        tables_data, truncated_fields = apply_truncation_to_list_tables(
-            tables_data, MAX_RESPONSE_LIST_TABLES
-        )
+            # Apply truncation to table comments
+            tables_data, truncated_fields = apply_truncation_to_list_tables(
+                tables_data, MAX_RESPONSE_LIST_TABLES
+            )
 
-        # Wrap with truncation info if any fields were truncated
-        result = wrap_list_response_with_truncation_info(tables_data, truncated_fields)
+            # Wrap with truncation info if any fields were truncated
+            result = wrap_list_response_with_truncation_info(
+                tables_data, truncated_fields
+            )
+            response = _dump_json(result)
 
-        response = json.dumps(result, indent=2)
         return [
             TextContent(
                 type="text",
@@ -937,7 +1058,7 @@ class DatabaseMCPServer:
         # Wrap with truncation info if any fields were truncated
         result = wrap_response_with_truncation_info(table_data, truncated_fields)
 
-        response = json.dumps(result, indent=2)
+        response = _dump_json(result)
         return [
             TextContent(
                 type="text",
@@ -957,7 +1078,7 @@ class DatabaseMCPServer:
 
         result = await self.executor.execute_query(query, limit=limit)
 
-        response = json.dumps(result.model_dump(mode="json"), indent=2)
+        response = await _dump_json_rows(result, len(result.rows))
         return [
             TextContent(
                 type="text",
@@ -985,7 +1106,7 @@ class DatabaseMCPServer:
         # Wrap with truncation info if any fields were truncated
         final_result = wrap_response_with_truncation_info(result_data, truncated_fields)
 
-        response = json.dumps(final_result, indent=2)
+        response = await _dump_json_rows(final_result, len(result.rows))
         return [
             TextContent(
                 type="text",
@@ -1004,9 +1125,8 @@ class DatabaseMCPServer:
         schema = arguments.get("schema")
 
         relationships = await self.inspector.get_relationships(table, schema)
-        relationships_data = [r.model_dump(mode="json") for r in relationships]
 
-        response = json.dumps(relationships_data, indent=2)
+        response = _RELATIONSHIP_LIST.dump_json(relationships, indent=2).decode()
         return [
             TextContent(
                 type="text",
@@ -1036,7 +1156,7 @@ class DatabaseMCPServer:
         # Wrap with truncation info if any fields were truncated
         result = wrap_response_with_truncation_info(stats_data, truncated_fields)
 
-        response = json.dumps(result, indent=2)
+        response = _dump_json(result)
         return [
             TextContent(
                 type="text",
@@ -1065,7 +1185,7 @@ class DatabaseMCPServer:
         # Wrap with truncation info if any fields were truncated
         result = wrap_response_with_truncation_info(plan_data, truncated_fields)
 
-        response = json.dumps(result, indent=2)
+        response = _dump_json(result)
         return [
             TextContent(
                 type="text",
@@ -1132,9 +1252,7 @@ class DatabaseMCPServer:
 
         # exclude_none keeps the JSON minimal — fields that don't apply to the
         # chosen detail level or object type are dropped entirely.
-        response = json.dumps(
-            results.model_dump(mode="json", exclude_none=True), indent=2
-        )
+        response = results.model_dump_json(indent=2, exclude_none=True)
         return [
             TextContent(
                 type="text",
@@ -1145,6 +1263,7 @@ class DatabaseMCPServer:
     async def cleanup(self) -> None:
         """Cleanup resources."""
         await self.connection.dispose()
+        self._db_info_response = None
         logger.info("Database MCP server cleaned up")
 
 
@@ -1162,6 +1281,37 @@ def _parse_int_env(
         )
 
 
+class _PoolConfig(TypedDict, total=False):
+    """Pool settings passed through to DatabaseConfig."""
+
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+
+
+def _load_pool_config() -> _PoolConfig:
+    """
+    Load connection pool settings from environment variables.
+
+    Only variables that are set are returned, so unset ones keep the
+    DatabaseConfig defaults.
+
+    Returns:
+        DatabaseConfig keyword arguments for the configured pool settings
+    """
+    pool_config: _PoolConfig = {}
+    pool_size = _parse_int_env("DB_POOL_SIZE", os.getenv("DB_POOL_SIZE"))
+    if pool_size is not None:
+        pool_config["pool_size"] = pool_size
+    max_overflow = _parse_int_env("DB_MAX_OVERFLOW", os.getenv("DB_MAX_OVERFLOW"))
+    if max_overflow is not None:
+        pool_config["max_overflow"] = max_overflow
+    pool_timeout = _parse_int_env("DB_POOL_TIMEOUT", os.getenv("DB_POOL_TIMEOUT"))
+    if pool_timeout is not None:
+        pool_config["pool_timeout"] = pool_timeout
+    return pool_config
+
+
 def _load_ssh_tunnel_config() -> Optional[SSHTunnelConfig]:
     """
     Load SSH tunnel configuration from environment variables.
@@ -1416,6 +1566,7 @@ async def main(
         url=database_url,
         ssh_tunnel=ssh_tunnel_config,
         statement_timeout=statement_timeout,
+        **_load_pool_config(),
     )
 
     # Create and initialize server
@@ -1448,6 +1599,22 @@ async def main(
         await mcp_server.cleanup()
 
 
+def _use_uvloop_if_available() -> bool:
+    """
+    Run the server on uvloop when the optional dependency is installed.
+
+    Returns:
+        True if the uvloop event loop policy was installed
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
+
+
 def cli_entry() -> None:
     """
     Synchronous entry point for console script.
@@ -1533,6 +1700,8 @@ OAuth 2.0 examples:
     # Windows-specific event loop policy
     if os.name == "nt":
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())  # type: ignore[attr-defined]
+    else:
+        _use_uvloop_if_available()
 
     try:
         asyncio.run(
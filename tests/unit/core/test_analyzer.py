@@ -1,5 +1,6 @@
 """Unit tests for StatisticsAnalyzer with mocked connections."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -179,6 +180,7 @@ class TestAnalyzeMultipleColumns:
 
         connection = MagicMock()
         connection.get_connection.return_value = mock_cm
+        connection.max_connections = 15
         return connection, mock_conn
 
     @pytest.fixture
@@ -186,8 +188,63 @@ class TestAnalyzeMultipleColumns:
         """Create a mock adapter."""
         adapter = MagicMock()
         adapter.get_column_statistics = AsyncMock()
+        adapter.get_multi_column_statistics = AsyncMock(side_effect=NotImplementedError)
+        adapter.errors_abort_transaction = True
         return adapter
 
+    @pytest.mark.asyncio
+    async def test_analyze_multiple_columns_single_scan(
+        self, mock_connection, mock_adapter
+    ):
+        """Test the adapter's single-scan statistics are used when available."""
+        connection, mock_conn = mock_connection
+        stats = [
+            ColumnStats(
+                column=name,
+                data_type="integer",
+                total_rows=100,
+                null_count=0,
+                sample_size=100,
+            )
+            for name in ("id", "age")
+        ]
+        mock_adapter.get_multi_column_statistics.side_effect = None
+        mock_adapter.get_multi_column_statistics.return_value = stats
+
+        analyzer = StatisticsAnalyzer(connection, mock_adapter)
+        results = await analyzer.analyze_multiple_columns(
+            "users", ["id", "age"], "public"
+        )
+
+        assert results == stats
+        mock_adapter.get_multi_column_statistics.assert_called_once_with(
+            mock_conn, "users", ["id", "age"], "public"
+        )
+        mock_adapter.get_column_statistics.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_analyze_multiple_columns_single_scan_failure_falls_back(
+        self, mock_connection, mock_adapter
+    ):
+        """Test a failed single scan falls back to per-column analysis."""
+        connection, _ = mock_connection
+        stats = ColumnStats(
+            column="flag",
+            data_type="boolean",
+            total_rows=100,
+            null_count=0,
+            sample_size=100,
+        )
+        mock_adapter.get_multi_column_statistics.side_effect = Exception(
+            "function min(boolean) does not exist"
+        )
+        mock_adapter.get_column_statistics.return_value = stats
+
+        analyzer = StatisticsAnalyzer(connection, mock_adapter)
+        results = await analyzer.analyze_multiple_columns("users", ["flag"], "public")
+
+        assert results == [stats]
+
     @pytest.mark.asyncio
     async def test_analyze_multiple_columns_success(
         self, mock_connection, mock_adapter
@@ -287,3 +344,68 @@ class TestAnalyzeMultipleColumns:
 
         assert results == []
         mock_adapter.get_column_statistics.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_analyze_multiple_columns_bounded_by_pool(
+        self, mock_connection, mock_adapter
+    ):
+        """Test columns run concurrently but never beyond pool capacity."""
+        connection, _ = mock_connection
+        connection.max_connections = 2
+        active = 0
+        peak = 0
+
+        async def column_stats(conn, table, column, schema):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return ColumnStats(
+                column=column,
+                data_type="integer",
+                total_rows=10,
+                null_count=0,
+                sample_size=10,
+            )
+
+        mock_adapter.get_column_statistics.side_effect = column_stats
+
+        analyzer = StatisticsAnalyzer(connection, mock_adapter)
+        results = await analyzer.analyze_multiple_columns(
+            "users", ["a", "b", "c", "d"], "public"
+        )
+
+        assert [r.column for r in results] == ["a", "b", "c", "d"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_multiple_columns_reuses_worker_connections(
+        self, mock_connection, mock_adapter
+    ):
+        """Test each worker checks out one connection for all its columns."""
+        connection, mock_conn = mock_connection
+        connection.max_connections = 2
+        mock_adapter.errors_abort_transaction = False
+
+        async def column_stats(conn, table, column, schema):
+            assert conn is mock_conn
+            await asyncio.sleep(0)
+            return ColumnStats(
+                column=column,
+                data_type="integer",
+                total_rows=10,
+                null_count=0,
+                sample_size=10,
+            )
+
+        mock_adapter.get_column_statistics.side_effect = column_stats
+
+        analyzer = StatisticsAnalyzer(connection, mock_adapter)
+        results = await analyzer.analyze_multiple_columns(
+            "users", ["a", "b", "c", "d", "e"], "public"
+        )
+
+        assert [r.column for r in results] == ["a", "b", "c", "d", "e"]
+        # One checkout for the single-scan attempt, then one per worker
+        assert connection.get_connection.call_count == 3
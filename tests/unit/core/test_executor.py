@@ -6,6 +6,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from sqlalchemy.ext.asyncio import AsyncConnection
+
 from db_connect_mcp.core.executor import QueryExecutor, json_default
 
 
@@ -180,6 +182,31 @@ class TestQueryValidation:
         """
         executor._validate_query(query)  # Should not raise
 
+    def test_validate_block_comment_hides_keyword(self, mock_connection, mock_adapter):
+        """Test keywords inside block comments are ignored."""
+        executor = QueryExecutor(mock_connection, mock_adapter)
+        executor._validate_query("SELECT /* DROP */ 1 /* DELETE\n */ FROM t")
+
+    def test_validate_unterminated_block_comments(self, mock_connection, mock_adapter):
+        """Test many unterminated comment openers are scanned in linear time."""
+        executor = QueryExecutor(mock_connection, mock_adapter)
+        with pytest.raises(ValueError, match="DROP"):
+            executor._validate_query("SELECT 1 " + "/*" * 200_000 + " DROP")
+
+    def test_validate_lowercase_keywords(self, mock_connection, mock_adapter):
+        """Test keyword checks do not depend on letter case."""
+        executor = QueryExecutor(mock_connection, mock_adapter)
+        executor._validate_query("select * from users")
+        with pytest.raises(ValueError, match="DELETE"):
+            executor._validate_query("with t as (delete from users) select 1")
+
+    def test_validate_rejects_repeated_query(self, mock_connection, mock_adapter):
+        """Test a cached rejection still raises on every call."""
+        executor = QueryExecutor(mock_connection, mock_adapter)
+        for _ in range(2):
+            with pytest.raises(ValueError, match="DROP"):
+                executor._validate_query("DROP TABLE users")
+
     def test_validate_empty_query_rejected(self, mock_connection, mock_adapter):
         """Test empty query is rejected."""
         executor = QueryExecutor(mock_connection, mock_adapter)
@@ -224,6 +251,11 @@ class TestLimitHandling:
         executor = QueryExecutor(mock_connection, mock_adapter)
         assert executor._has_limit("SELECT * FROM users limit 10") is True
 
+    def test_has_limit_bind_parameter(self, mock_connection, mock_adapter):
+        """Test LIMIT given as a bind parameter counts as present."""
+        executor = QueryExecutor(mock_connection, mock_adapter)
+        assert executor._has_limit("SELECT * FROM users LIMIT :limit") is True
+
     def test_add_limit(self, mock_connection, mock_adapter):
         """Test adding LIMIT clause."""
         executor = QueryExecutor(mock_connection, mock_adapter)
@@ -289,6 +321,232 @@ class TestExplainQuery:
             await executor.explain_query("SELECT 1")
 
 
+class TestRunQuery:
+    """Tests for converting query results to rows."""
+
+    @pytest.mark.asyncio
+    async def test_rows_keyed_by_column(self):
+        """Test rows are keyed by column name and bytes are base64 encoded."""
+        result = MagicMock()
+        result.keys.return_value = ["id", "payload"]
+        result.__iter__.return_value = iter([(1, b"\x00\xff"), (2, None)])
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+
+        executor = QueryExecutor(MagicMock(), MagicMock())
+        query_result = await executor._run_query(conn, "SELECT 1", None, 2)
+
+        assert query_result.columns == ["id", "payload"]
+        assert query_result.rows == [
+            {"id": 1, "payload": "AP8="},
+            {"id": 2, "payload": None},
+        ]
+        assert query_result.truncated is True
+
+    @pytest.mark.asyncio
+    async def test_rows_past_byte_cap_are_dropped(self):
+        """Test rows beyond max_result_bytes are dropped and flagged."""
+        result = MagicMock()
+        result.keys.return_value = ["id", "payload"]
+        result.__iter__.return_value = iter([(i, "x" * 400) for i in range(10)])
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+
+        executor = QueryExecutor(MagicMock(), MagicMock())
+        query_result = await executor._run_query(conn, "SELECT 1", None, 100, 1024)
+
+        assert [row["id"] for row in query_result.rows] == [0, 1]
+        assert query_result.row_count == 2
+        assert query_result.truncated is True
+        assert query_result.warning == "Results truncated to 1024 bytes"
+
+    @pytest.mark.asyncio
+    async def test_rows_past_byte_cap_are_not_fetched(self):
+        """Test iteration over the result stops at the byte cap."""
+        fetched = []
+
+        def rows():
+            for i in range(10):
+                fetched.append(i)
+                yield (i, "x" * 400)
+
+        result = MagicMock()
+        result.keys.return_value = ["id", "payload"]
+        result.__iter__.return_value = rows()
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+
+        executor = QueryExecutor(MagicMock(), MagicMock())
+        await executor._run_query(conn, "SELECT 1", None, 100, 1024)
+
+        # Two rows fit and the third is the one that passes the cap
+        assert fetched == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_capped_rows_stream_from_server_side_cursor(self):
+        """Test async connections stream rows and close the cursor early."""
+        fetched = []
+
+        async def rows():
+            for i in range(10):
+                fetched.append(i)
+                yield (i, "x" * 400)
+
+        stream = MagicMock()
+        stream.keys.return_value = ["id", "payload"]
+        stream.__aiter__ = lambda self: rows()
+        stream.close = AsyncMock()
+        conn = MagicMock(spec=AsyncConnection)
+        conn.stream = AsyncMock(return_value=stream)
+
+        executor = QueryExecutor(MagicMock(), MagicMock())
+        query_result = await executor._run_query(conn, "SELECT 1", None, 100, 1024)
+
+        assert conn.stream.await_args.kwargs["execution_options"] == {"yield_per": 1000}
+        assert fetched == [0, 1, 2]
+        stream.close.assert_awaited_once()
+        assert [row["id"] for row in query_result.rows] == [0, 1]
+        assert query_result.warning == "Results truncated to 1024 bytes"
+
+    @pytest.mark.asyncio
+    async def test_execute_query_applies_byte_cap(self):
+        """Test execute_query passes the executor's byte cap to the run."""
+        result = MagicMock()
+        result.keys.return_value = ["id", "payload"]
+        result.__iter__.return_value = iter([(i, "x" * 400) for i in range(10)])
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+        mock_cm = AsyncMock()
+        mock_cm.__aenter__.return_value = conn
+        connection = MagicMock()
+        connection.get_connection.return_value = mock_cm
+
+        executor = QueryExecutor(connection, MagicMock(), max_result_bytes=1024)
+        query_result = await executor.execute_query("SELECT 1", limit=100)
+
+        assert query_result.row_count == 2
+        assert query_result.warning == "Results truncated to 1024 bytes"
+
+
+class TestJsonSafeRows:
+    """Tests for converting result rows to JSON-safe values."""
+
+    def test_values_match_isoformat_and_base64(self):
+        """Test dates, times, bytes and other types convert as documented."""
+        from decimal import Decimal
+
+        from db_connect_mcp.core.executor import _json_safe_rows
+
+        rows = [
+            {
+                "ts": datetime.datetime(2024, 1, 15, 10, 30, 45, 123),
+                "day": datetime.date(2024, 1, 15),
+                "amount": Decimal("1.50"),
+                "raw": b"hi",
+                "span": datetime.timedelta(hours=2),
+            }
+        ]
+
+        assert _json_safe_rows(rows) == [
+            {
+                "ts": "2024-01-15T10:30:45.000123",
+                "day": "2024-01-15",
+                "amount": "1.50",
+                "raw": "aGk=",
+                "span": "2:00:00",
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_capped_rows_fit_within_limit(self):
+        """Test capping keeps the longest prefix whose encoding fits."""
+        import orjson
+
+        from db_connect_mcp.core.executor import _iterate, _json_safe_rows_capped
+
+        rows = [{"id": i, "name": f"row-{i}"} for i in range(50)]
+        full_size = len(orjson.dumps(rows))
+
+        assert await _json_safe_rows_capped(_iterate(rows), full_size) == (
+            rows,
+            False,
+        )
+        kept, dropped = await _json_safe_rows_capped(_iterate(rows), full_size // 2)
+        assert dropped is True
+        assert kept == rows[: len(kept)]
+        assert len(orjson.dumps(kept)) <= full_size // 2
+        assert len(orjson.dumps(rows[: len(kept) + 1])) > full_size // 2
+
+    def test_timezone_aware_time(self):
+        """Test timezone-aware times, which orjson rejects, are isoformatted."""
+        from db_connect_mcp.core.executor import _json_safe_rows
+
+        tz = datetime.timezone(datetime.timedelta(hours=2))
+        rows = [
+            {
+                "at": datetime.time(10, 30, tzinfo=tz),
+                "ts": datetime.datetime(2024, 1, 15, 10, 30, tzinfo=tz),
+            }
+        ]
+
+        assert _json_safe_rows(rows) == [
+            {"at": "10:30:00+02:00", "ts": "2024-01-15T10:30:00+02:00"}
+        ]
+
+
+class TestSampleData:
+    """Tests for sample_data."""
+
+    @pytest.mark.asyncio
+    async def test_sample_query_runs_unmodified_on_sizing_connection(self):
+        """Test the adapter's sample SQL runs as-is on the same connection."""
+        result = MagicMock()
+        result.keys.return_value = ["id"]
+        result.__iter__.return_value = iter([(1,)])
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+        mock_cm = AsyncMock()
+        mock_cm.__aenter__.return_value = conn
+        connection = MagicMock()
+        connection.get_connection.return_value = mock_cm
+
+        adapter = MagicMock()
+        sample_sql = 'SELECT * FROM "users" LIMIT :limit'
+        adapter.get_sample_query = AsyncMock(return_value=(sample_sql, {"limit": 5}))
+
+        executor = QueryExecutor(connection, adapter)
+        query_result = await executor.sample_data("users", limit=5)
+
+        adapter.get_sample_query.assert_awaited_once_with(conn, "users", None, 5)
+        assert conn.execute.await_args.args[0].text == sample_sql
+        assert conn.execute.await_args.args[1] == {"limit": 5}
+        assert query_result.rows == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_sample_ignores_byte_cap(self):
+        """Test wide samples keep every row; the server shortens the cells."""
+        result = MagicMock()
+        result.keys.return_value = ["id", "payload"]
+        result.__iter__.return_value = iter([(i, "x" * 400) for i in range(10)])
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+        mock_cm = AsyncMock()
+        mock_cm.__aenter__.return_value = conn
+        connection = MagicMock()
+        connection.get_connection.return_value = mock_cm
+
+        adapter = MagicMock()
+        adapter.get_sample_query = AsyncMock(
+            return_value=('SELECT * FROM "users" LIMIT :limit', {"limit": 100})
+        )
+
+        executor = QueryExecutor(connection, adapter, max_result_bytes=1024)
+        query_result = await executor.sample_data("users", limit=100)
+
+        assert query_result.row_count == 10
+        assert query_result.truncated is False
+
+
 class TestTestQuerySyntax:
     """Tests for test_query_syntax method."""
 
@@ -1,8 +1,20 @@
 """Unit tests for MetadataInspector internal methods."""
 
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from sqlalchemy import VARCHAR, Enum, create_engine, text
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import NoSuchTableError
 
-from db_connect_mcp.core.inspector import MetadataInspector
+from db_connect_mcp.core.inspector import (
+    _TYPE_NAMES,
+    MetadataInspector,
+    _ReflectionCache,
+    _type_name,
+)
 from db_connect_mcp.models.table import IndexInfo
 
 
@@ -117,3 +129,498 @@ class TestIndexFromSA:
         }
         result = inspector._index_from_sa(idx_data)
         assert result.index_type is None
+
+
+class TestReflectTable:
+    """Test _reflect_tables batched reflection against SQLite."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create an in-memory SQLite database with two related tables."""
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+            conn.execute(
+                text(
+                    "CREATE TABLE orders ("
+                    "id INTEGER PRIMARY KEY, "
+                    "user_id INTEGER REFERENCES users(id), "
+                    "code TEXT UNIQUE, "
+                    "qty INTEGER CHECK (qty > 0))"
+                )
+            )
+            conn.execute(text("CREATE INDEX idx_orders_user ON orders (user_id)"))
+            conn.execute(text("CREATE VIEW big_orders AS SELECT * FROM orders"))
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def inspector(self):
+        """Create an inspector with an adapter supporting indexes and FKs."""
+        adapter = MagicMock()
+        adapter.capabilities.indexes = True
+        adapter.capabilities.foreign_keys = True
+        return MetadataInspector(MagicMock(), adapter)
+
+    def test_reflects_table_metadata(self, engine, inspector: MetadataInspector):
+        """Columns, keys, indexes and constraints should be reflected."""
+        with engine.connect() as conn:
+            data = inspector._reflect_tables(sa_inspect(conn), ["orders"], None)[
+                "orders"
+            ]
+
+        assert [c["name"] for c in data["columns"]] == ["id", "user_id", "code", "qty"]
+        assert data["pk_constraint"]["constrained_columns"] == ["id"]
+        assert [i["name"] for i in data["indexes"]] == ["idx_orders_user"]
+        assert data["foreign_keys"][0]["referred_table"] == "users"
+        assert data["unique_constraints"][0]["column_names"] == ["code"]
+        assert len(data["check_constraints"]) == 1
+
+    def test_reflects_view(self, engine, inspector: MetadataInspector):
+        """Views should be reflected like tables."""
+        with engine.connect() as conn:
+            data = inspector._reflect_tables(sa_inspect(conn), ["big_orders"], None)[
+                "big_orders"
+            ]
+
+        assert len(data["columns"]) == 4
+
+    def test_missing_table_raises(self, engine, inspector: MetadataInspector):
+        """A missing table should raise NoSuchTableError."""
+        with engine.connect() as conn:
+            with pytest.raises(NoSuchTableError):
+                inspector._reflect_tables(sa_inspect(conn), ["users", "missing"], None)
+
+    def test_unsupported_check_constraints_tried_once(
+        self, engine, inspector: MetadataInspector
+    ):
+        """A dialect without check constraint reflection is asked only once."""
+        with engine.connect() as conn:
+            sa_inspector = sa_inspect(conn)
+            with patch.object(
+                sa_inspector,
+                "get_multi_check_constraints",
+                side_effect=NotImplementedError,
+            ) as get_checks:
+                inspector._reflect_tables(sa_inspector, ["orders"], None)
+                data = inspector._reflect_tables(sa_inspector, ["orders"], None)
+
+        assert get_checks.call_count == 1
+        assert data["orders"]["check_constraints"] == []
+
+    def test_reflects_several_tables(self, engine, inspector: MetadataInspector):
+        """Several tables should be reflected in one call."""
+        with engine.connect() as conn:
+            data = inspector._reflect_tables(
+                sa_inspect(conn), ["users", "orders"], None
+            )
+
+        assert list(data) == ["users", "orders"]
+        assert data["users"]["foreign_keys"] == []
+        assert data["orders"]["foreign_keys"][0]["referred_table"] == "users"
+
+
+class TestReflectionCache:
+    """Test the long-lived reflection info_cache."""
+
+    @pytest.fixture
+    def inspector(self):
+        """Create an inspector; the connection and adapter are not used."""
+        return MetadataInspector(MagicMock(), MagicMock())
+
+    def test_cache_is_bounded(self):
+        """The oldest entry should be evicted once maxsize is reached."""
+        cache = _ReflectionCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 3
+        cache["c"] = 4
+
+        assert cache == {"b": 2, "c": 4}
+
+    def test_inspectors_share_cache(self, inspector: MetadataInspector):
+        """Reflection results should be reused by later inspectors."""
+        engine = create_engine("sqlite://")
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("CREATE TABLE users (id INTEGER)"))
+                assert inspector._inspect(conn).get_table_names() == ["users"]
+                conn.execute(text("CREATE TABLE orders (id INTEGER)"))
+                assert inspector._inspect(conn).get_table_names() == ["users"]
+
+                inspector.invalidate_cache()
+                assert inspector._inspect(conn).get_table_names() == [
+                    "orders",
+                    "users",
+                ]
+        finally:
+            engine.dispose()
+
+    def test_cache_expires(self, inspector: MetadataInspector):
+        """Entries older than the TTL should be dropped on the next inspect."""
+        inspector._info_cache["key"] = "value"
+        inspector._info_cache_time -= inspector._REFLECTION_TTL + 1
+
+        engine = create_engine("sqlite://")
+        try:
+            with engine.connect() as conn:
+                inspector._inspect(conn)
+        finally:
+            engine.dispose()
+
+        assert "key" not in inspector._info_cache
+
+
+class TestGetSchemas:
+    """Test get_schemas counting and enrichment."""
+
+    @pytest.fixture
+    def connection(self):
+        """Create a connection manager handing out one mock connection."""
+        conn = MagicMock()
+        conn.run_sync = AsyncMock()
+        mock_cm = AsyncMock()
+        mock_cm.__aenter__.return_value = conn
+        connection = MagicMock()
+        connection.get_connection.return_value = mock_cm
+        connection.dialect = "postgresql"
+        connection.max_connections = 2
+        return connection
+
+    @pytest.fixture
+    def adapter(self):
+        """Create an adapter that returns schemas unchanged."""
+        adapter = MagicMock()
+        adapter.capabilities.views = True
+        adapter.enrich_schemas_batch = AsyncMock(side_effect=lambda conn, s: s)
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_counts_come_from_one_query(self, connection, adapter):
+        """Counts for all schemas come from the adapter, minus system schemas."""
+        adapter.get_schema_object_counts = AsyncMock(
+            return_value={"pg_toast": (5, 0), "public": (3, 1), "sales": (2, 0)}
+        )
+
+        schemas = await MetadataInspector(connection, adapter).get_schemas()
+
+        assert [(s.name, s.table_count, s.view_count) for s in schemas] == [
+            ("public", 3, 1),
+            ("sales", 2, 0),
+        ]
+        conn = connection.get_connection.return_value.__aenter__.return_value
+        conn.run_sync.assert_not_called()
+        # System schemas are excluded by the query itself
+        assert "pg_catalog" in adapter.get_schema_object_counts.await_args.args[1]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_reflection(self, connection, adapter):
+        """Adapters without a counts query fall back to reflection."""
+        adapter.get_schema_object_counts = AsyncMock(side_effect=NotImplementedError)
+        conn = connection.get_connection.return_value.__aenter__.return_value
+        conn.run_sync.return_value = [
+            {"name": "default", "table_count": 4, "view_count": 0}
+        ]
+
+        schemas = await MetadataInspector(connection, adapter).get_schemas()
+
+        assert [(s.name, s.table_count) for s in schemas] == [("default", 4)]
+        conn.run_sync.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_enrichment_is_batched(self, connection, adapter):
+        """All schemas are enriched in one batch on the same connection."""
+        adapter.get_schema_object_counts = AsyncMock(
+            return_value={name: (1, 0) for name in ["a", "b", "c"]}
+        )
+
+        schemas = await MetadataInspector(connection, adapter).get_schemas()
+
+        adapter.enrich_schemas_batch.assert_awaited_once()
+        assert adapter.enrich_schemas_batch.await_args.args[1] == schemas
+        assert connection.get_connection.call_count == 1
+
+
+class TestIsSystemSchema:
+    """Test the Python-side system schema check."""
+
+    @pytest.mark.parametrize(
+        "dialect,schema,expected",
+        [
+            ("postgresql", "pg_catalog", True),
+            ("postgresql", "_timescaledb_internal", True),
+            ("postgresql", "public", False),
+            ("mysql", "performance_schema", True),
+            ("mysql", "_timescaledb_internal", False),
+            ("clickhouse", "system", True),
+            ("sqlite", "main", False),
+        ],
+    )
+    def test_system_schemas(self, dialect, schema, expected):
+        """System schemas are recognized per dialect."""
+        connection = MagicMock()
+        connection.dialect = dialect
+        inspector = MetadataInspector(connection, MagicMock())
+
+        assert inspector._is_system_schema(schema) is expected
+
+
+class TestDescribeTable:
+    """Test describe_table assembly of reflected metadata."""
+
+    @pytest.mark.asyncio
+    async def test_marks_key_and_indexed_columns(self):
+        """Columns are flagged from the PK, index, FK and unique metadata."""
+        conn = MagicMock()
+        conn.run_sync = AsyncMock(
+            return_value={
+                "orders": {
+                    "columns": [
+                        {"name": name, "type": "INTEGER", "nullable": True}
+                        for name in ["id", "user_id", "code"]
+                    ],
+                    "pk_constraint": {"constrained_columns": ["id"]},
+                    "indexes": [
+                        {
+                            "name": "idx_user",
+                            "column_names": ["user_id"],
+                            "unique": False,
+                        }
+                    ],
+                    "foreign_keys": [
+                        {
+                            "name": "fk_user",
+                            "constrained_columns": ["user_id"],
+                            "referred_table": "users",
+                            "referred_columns": ["id"],
+                        }
+                    ],
+                    "unique_constraints": [
+                        {"name": "uq_code", "column_names": ["code"]}
+                    ],
+                    "check_constraints": [],
+                }
+            }
+        )
+        mock_cm = AsyncMock()
+        mock_cm.__aenter__.return_value = conn
+        connection = MagicMock()
+        connection.get_connection.return_value = mock_cm
+        adapter = MagicMock()
+        adapter.capabilities.comments = False
+        adapter.enrich_tables_batch = AsyncMock(side_effect=lambda conn, t: t)
+
+        table = await MetadataInspector(connection, adapter).describe_table("orders")
+
+        columns = {col.name: col for col in table.columns}
+        assert columns["id"].primary_key
+        assert columns["user_id"].indexed
+        assert columns["user_id"].foreign_key == "users.id"
+        assert columns["code"].unique
+        assert not columns["code"].primary_key
+
+        # Unvalidated models still carry every field with its default
+        dumped = table.model_dump()
+        assert dumped["columns"][0]["extra_info"] == {}
+        assert dumped["indexes"][0]["primary"] is False
+        assert dumped["constraints"][1]["definition"] is None
+
+
+class TestForeignKeyCache:
+    """Test foreign keys are shared between describe_table and relationships."""
+
+    @pytest.mark.asyncio
+    async def test_relationships_reuse_described_foreign_keys(self):
+        """get_relationships after describe_table needs no connection."""
+        engine = create_engine("sqlite://")
+        connection = MagicMock()
+        adapter = MagicMock()
+        adapter.capabilities.foreign_keys = True
+        inspector = MetadataInspector(connection, adapter)
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+                conn.execute(
+                    text(
+                        "CREATE TABLE orders (id INTEGER, "
+                        "user_id INTEGER REFERENCES users(id))"
+                    )
+                )
+                inspector._reflect_tables(inspector._inspect(conn), ["orders"], None)
+        finally:
+            engine.dispose()
+
+        relationships = await inspector.get_relationships("orders")
+
+        assert [r.to_table for r in relationships] == ["users"]
+        connection.get_connection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_relationship_options(self):
+        """ON DELETE/UPDATE come from the options entry when present."""
+        adapter = MagicMock()
+        adapter.capabilities.foreign_keys = True
+        inspector = MetadataInspector(MagicMock(), adapter)
+        fk = {
+            "constrained_columns": ["user_id"],
+            "referred_table": "users",
+            "referred_columns": ["id"],
+        }
+        inspector._fk_cache[(None, "orders")] = (
+            time.monotonic(),
+            [
+                {**fk, "name": "fk_a", "options": {"ondelete": "CASCADE"}},
+                {**fk, "name": "fk_b"},
+            ],
+        )
+
+        relationships = await inspector.get_relationships("orders")
+
+        assert [(r.on_delete, r.on_update) for r in relationships] == [
+            ("CASCADE", None),
+            (None, None),
+        ]
+
+    def test_entries_expire(self):
+        """Cached foreign keys older than the TTL are ignored."""
+        inspector = MetadataInspector(MagicMock(), MagicMock())
+        inspector._fk_cache[(None, "orders")] = (
+            time.monotonic() - inspector._REFLECTION_TTL - 1,
+            [],
+        )
+
+        assert inspector._cached_foreign_keys((None, "orders")) is None
+
+
+class TestCoalesce:
+    """Test concurrent identical lookups share one round trip."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_describes_share_one_reflection(self):
+        """Simultaneous describe_table calls for one table reflect it once."""
+        inspector = MetadataInspector(MagicMock(), MagicMock())
+        release = asyncio.Event()
+
+        async def describe_tables(names, schema):
+            await release.wait()
+            return [MagicMock(name=names[0])]
+
+        fetch = AsyncMock(side_effect=describe_tables)
+        with patch.object(inspector, "describe_tables", fetch):
+            pending = asyncio.gather(
+                inspector.describe_table("orders"),
+                inspector.describe_table("orders"),
+                inspector.describe_table("users"),
+            )
+            await asyncio.sleep(0)
+            release.set()
+            orders_a, orders_b, users = await pending
+
+        assert orders_a is orders_b
+        assert users is not orders_a
+        assert fetch.await_count == 2
+        assert inspector._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_failures_reach_every_caller_and_are_not_kept(self):
+        """A failed lookup is raised to each waiter and retried next time."""
+        inspector = MetadataInspector(MagicMock(), MagicMock())
+        fetch = AsyncMock(side_effect=NoSuchTableError("orders"))
+
+        with patch.object(inspector, "describe_tables", fetch):
+            results = await asyncio.gather(
+                inspector.describe_table("orders"),
+                inspector.describe_table("orders"),
+                return_exceptions=True,
+            )
+            with pytest.raises(NoSuchTableError):
+                await inspector.describe_table("orders")
+
+        assert all(isinstance(r, NoSuchTableError) for r in results)
+        assert fetch.await_count == 2
+
+
+class TestGetTables:
+    """Test get_tables listing."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create an adapter that supports views and enriches nothing."""
+        adapter = MagicMock()
+        adapter.capabilities.views = True
+        adapter.enrich_tables_batch = AsyncMock(side_effect=lambda conn, t: t)
+        return adapter
+
+    @staticmethod
+    def _connection(conn):
+        mock_cm = AsyncMock()
+        mock_cm.__aenter__.return_value = conn
+        connection = MagicMock()
+        connection.get_connection.return_value = mock_cm
+        return connection
+
+    @pytest.mark.asyncio
+    async def test_tables_come_from_one_query(self, adapter):
+        """Tables and views are listed by the adapter in one call."""
+        conn = MagicMock()
+        conn.run_sync = AsyncMock()
+        adapter.list_tables = AsyncMock(
+            return_value=[("orders", "BASE TABLE"), ("big_orders", "VIEW")]
+        )
+
+        tables = await MetadataInspector(self._connection(conn), adapter).get_tables(
+            "public"
+        )
+
+        assert [(t.name, t.table_type) for t in tables] == [
+            ("orders", "BASE TABLE"),
+            ("big_orders", "VIEW"),
+        ]
+        assert adapter.list_tables.await_args.args[1:] == ("public", True)
+        conn.run_sync.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_reflection(self, adapter):
+        """Adapters without a listing query fall back to reflection."""
+        adapter.list_tables = AsyncMock(side_effect=NotImplementedError)
+        engine = create_engine("sqlite://")
+        try:
+            with engine.begin() as sync_conn:
+                sync_conn.execute(text("CREATE TABLE orders (id INTEGER)"))
+                sync_conn.execute(
+                    text("CREATE VIEW big_orders AS SELECT * FROM orders")
+                )
+                conn = MagicMock()
+                conn.run_sync = AsyncMock(side_effect=lambda fn: fn(sync_conn))
+
+                inspector = MetadataInspector(self._connection(conn), adapter)
+                tables = await inspector.get_tables()
+                without_views = await inspector.get_tables(include_views=False)
+        finally:
+            engine.dispose()
+
+        assert [(t.name, t.table_type) for t in tables] == [
+            ("orders", "BASE TABLE"),
+            ("big_orders", "VIEW"),
+        ]
+        assert [t.name for t in without_views] == ["orders"]
+
+
+class TestTypeName:
+    """Test memoized rendering of reflected column types."""
+
+    def test_equal_types_share_a_name(self):
+        """Separately reflected but equal types render once."""
+        _TYPE_NAMES.clear()
+
+        assert _type_name(VARCHAR(255)) == "VARCHAR(255)"
+        assert _type_name(VARCHAR(255)) == "VARCHAR(255)"
+        assert _type_name(VARCHAR(64)) == "VARCHAR(64)"
+        assert len(_TYPE_NAMES) == 2
+
+    def test_unhashable_arguments_are_rendered_directly(self):
+        """Types with unhashable arguments are rendered without caching."""
+        _TYPE_NAMES.clear()
+
+        assert _type_name(Enum("a", "b", name="status")) == "VARCHAR(1)"
+        assert _TYPE_NAMES == {}
@@ -8,12 +8,14 @@ These tests do not touch a real database — they exercise:
   * Limit / truncation / early-termination handling
 """
 
+import asyncio
 from typing import Optional
 from unittest.mock import AsyncMock
 
 import pytest
 
 from db_connect_mcp.core.search import (
+    DESCRIBE_CONCURRENCY,
     MAX_TABLES_TO_DESCRIBE,
     ObjectSearcher,
     _normalize_object_types,
@@ -199,6 +201,7 @@ def _make_inspector_stub(
 ) -> AsyncMock:
     """Create an AsyncMock inspector with predictable, scriptable responses."""
     inspector = AsyncMock()
+    inspector.connection.max_connections = 15
     inspector.get_schemas = AsyncMock(return_value=schemas)
 
     async def get_tables(schema, include_views=True):
@@ -485,6 +488,32 @@ class TestObjectSearcher:
         assert results.note is not None
         assert "cap" in results.note.lower()
 
+    async def test_table_names_match_in_schemas_past_describe_cap(self):
+        public_tables = [
+            _make_table(f"t_{i}", schema="public")
+            for i in range(MAX_TABLES_TO_DESCRIBE + 5)
+        ]
+        inspector = _make_inspector_stub(
+            schemas=[_make_schema("public"), _make_schema("analytics")],
+            tables_by_schema={
+                "public": public_tables,
+                "analytics": [_make_table("t_events", schema="analytics")],
+            },
+            described={},
+        )
+        searcher = ObjectSearcher(inspector)
+
+        results = await searcher.search(
+            pattern="t_%",
+            object_types=[SearchObjectType.TABLE, SearchObjectType.COLUMN],
+            limit=1000,
+        )
+        assert results.early_termination is True
+        assert inspector.describe_table.call_count == MAX_TABLES_TO_DESCRIBE
+        names = {r.name for r in results.results if r.object_type == "table"}
+        assert "t_events" in names
+        assert len(names) == len(public_tables) + 1
+
     async def test_full_detail_includes_column_extras(self):
         described = {
             ("public", "t"): _make_table(
@@ -538,3 +567,64 @@ class TestObjectSearcher:
         assert "table" in types
         assert "column" in types
         assert "index" in types
+
+    async def test_describes_run_concurrently_in_table_order(self):
+        # Describes overlap up to DESCRIBE_CONCURRENCY, and results still
+        # follow the listing order regardless of completion order.
+        tables = [_make_table(f"t_{i}") for i in range(DESCRIBE_CONCURRENCY * 2)]
+        inspector = _make_inspector_stub(
+            schemas=[_make_schema("public")],
+            tables_by_schema={"public": tables},
+            described={},
+        )
+        running = 0
+        peak = 0
+
+        async def describe_table(table_name, schema):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Later tables finish first
+            await asyncio.sleep(0.001 * (len(tables) - int(table_name[2:])))
+            running -= 1
+            return _make_table(table_name, columns=[_make_column("id")])
+
+        inspector.describe_table = AsyncMock(side_effect=describe_table)
+        searcher = ObjectSearcher(inspector)
+
+        results = await searcher.search(
+            pattern="id", object_types=[SearchObjectType.COLUMN], schema="public"
+        )
+
+        assert peak == DESCRIBE_CONCURRENCY
+        assert [r.table for r in results.results] == [t.name for t in tables]
+
+    async def test_describe_concurrency_fits_connection_pool(self):
+        # A pool smaller than DESCRIBE_CONCURRENCY caps concurrent describes,
+        # so none wait on the pool until they time out.
+        tables = [_make_table(f"t_{i}") for i in range(DESCRIBE_CONCURRENCY * 2)]
+        inspector = _make_inspector_stub(
+            schemas=[_make_schema("public")],
+            tables_by_schema={"public": tables},
+            described={},
+        )
+        inspector.connection.max_connections = 2
+        running = 0
+        peak = 0
+
+        async def describe_table(table_name, schema):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return _make_table(table_name)
+
+        inspector.describe_table = AsyncMock(side_effect=describe_table)
+        searcher = ObjectSearcher(inspector)
+
+        await searcher.search(
+            pattern="id", object_types=[SearchObjectType.COLUMN], schema="public"
+        )
+
+        assert peak == 2
@@ -214,6 +214,8 @@ class TestDatabaseConfig:
         assert config.pool_timeout == 30
         assert config.read_only is True
         assert config.statement_timeout == 900
+        assert config.pool_recycle == 1800
+        assert config.pool_use_lifo is True
 
     def test_custom_pool_settings(self):
         """Test custom pool settings."""
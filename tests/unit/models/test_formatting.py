@@ -0,0 +1,28 @@
+"""Tests for model formatting helpers."""
+
+import pytest
+
+from db_connect_mcp.models.formatting import format_size
+
+
+class TestFormatSize:
+    """Test format_size unit selection."""
+
+    @pytest.mark.parametrize(
+        "size_bytes,expected",
+        [
+            (0, "0.00 B"),
+            (1023, "1023.00 B"),
+            (1024, "1.00 KB"),
+            (1024 * 1024 - 1, "1024.00 KB"),
+            (3 * 1024**4, "3.00 TB"),
+            (2048 * 1024**5, "2048.00 PB"),
+        ],
+    )
+    def test_units(self, size_bytes, expected):
+        """Each size is shown in the largest unit it reaches."""
+        assert format_size(size_bytes) == expected
+
+    def test_max_unit(self):
+        """Sizes beyond max_unit stay in max_unit."""
+        assert format_size(2 * 1024**5, max_unit="TB") == "2048.00 TB"
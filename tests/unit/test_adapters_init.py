@@ -1,5 +1,8 @@
 """Unit tests for adapters module initialization and factory functions."""
 
+import math
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from db_connect_mcp.adapters import (
@@ -10,7 +13,10 @@ from db_connect_mcp.adapters import (
     create_adapter,
     detect_dialect,
 )
+from db_connect_mcp.adapters.postgresql import _histogram_percentiles
 from db_connect_mcp.models.config import DatabaseConfig
+from db_connect_mcp.models.database import SchemaInfo
+from db_connect_mcp.models.table import TableInfo
 
 
 class TestDetectDialect:
@@ -142,3 +148,394 @@ class TestAdapterCapabilities:
         assert caps.indexes is True  # ClickHouse has specialized indexes
         assert caps.advanced_stats is True  # ClickHouse has columnar statistics
         assert caps.explain_plans is True
+
+    def test_capabilities_are_cached(self):
+        """Test capabilities are built once per adapter instance."""
+        adapter = PostgresAdapter()
+        assert adapter.capabilities is adapter.capabilities
+
+
+class TestTableReference:
+    """Tests for qualified table reference building."""
+
+    def test_table_reference_is_memoized(self):
+        """Test repeated lookups return the cached reference."""
+        adapter = PostgresAdapter()
+        ref = adapter._build_table_reference("users", "public")
+        assert ref == '"public"."users"'
+        assert adapter._build_table_reference("users", "public") is ref
+
+    def test_invalid_identifier_not_cached(self):
+        """Test invalid identifiers still raise on every call."""
+        adapter = MySQLAdapter()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid table name"):
+                adapter._build_table_reference("bad;name", None)
+        assert adapter._table_ref_cache == {}
+
+    def test_cache_evicts_oldest_reference_when_full(self):
+        """Test the memo stays bounded, evicting the oldest reference."""
+        adapter = PostgresAdapter()
+        with patch.object(PostgresAdapter, "_TABLE_REF_CACHE_SIZE", 2):
+            for name in ("a", "b", "c"):
+                adapter._build_table_reference(name, "public")
+        assert list(adapter._table_ref_cache) == [("public", "b"), ("public", "c")]
+
+
+class TestPostgresCatalogCache:
+    """Tests for the TTL cache in front of PostgreSQL table enrichment."""
+
+    @staticmethod
+    def _connection():
+        row = {
+            "total_size": 16384,
+            "table_size": 8192,
+            "indexes_size": 8192,
+            "row_count": 10,
+            "comment": "Users",
+            "table_kind": "r",
+            "persistence": "p",
+            "is_partition": False,
+        }
+        result = MagicMock()
+        result.mappings.return_value.fetchone.return_value = row
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+        return conn
+
+    @pytest.mark.asyncio
+    async def test_repeated_enrichment_is_served_from_cache(self):
+        """Test a second call within the TTLs issues no query."""
+        adapter = PostgresAdapter()
+        conn = self._connection()
+
+        with patch("time.monotonic", return_value=100.0):
+            first = await adapter.enrich_table_info(
+                conn, TableInfo(name="users", schema="public")
+            )
+            second = await adapter.enrich_table_info(
+                conn, TableInfo(name="users", schema="public")
+            )
+
+        assert conn.execute.await_count == 1
+        assert second.comment == first.comment == "Users"
+        assert second.size_bytes == 8192
+        assert second.extra_info["relkind"] == "r"
+
+    @pytest.mark.asyncio
+    async def test_sizes_expire_before_catalog_facts(self):
+        """Test only sizes are re-read once their shorter TTL passes."""
+        adapter = PostgresAdapter()
+        conn = self._connection()
+
+        with patch("time.monotonic", return_value=100.0):
+            await adapter.enrich_table_info(
+                conn, TableInfo(name="users", schema="public")
+            )
+        with patch("time.monotonic", return_value=110.0):
+            table = await adapter.enrich_table_info(
+                conn, TableInfo(name="users", schema="public")
+            )
+
+        assert conn.execute.await_count == 2
+        refresh_sql = conn.execute.await_args.args[0].text
+        assert "pg_total_relation_size" in refresh_sql
+        assert "obj_description" not in refresh_sql
+        assert table.comment == "Users"
+
+    @pytest.mark.asyncio
+    async def test_batch_enrichment_uses_one_query(self):
+        """Test a batch of tables is read in one query and fills the cache."""
+        rows = [
+            {
+                "table_name": name,
+                "total_size": 16384,
+                "table_size": 8192,
+                "indexes_size": 8192,
+                "row_count": 10,
+                "comment": None,
+                "table_kind": "r",
+                "persistence": "p",
+                "is_partition": False,
+            }
+            for name in ("users", "orders")
+        ]
+        result = MagicMock()
+        result.mappings.return_value = rows
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+        adapter = PostgresAdapter()
+
+        with patch("time.monotonic", return_value=100.0):
+            tables = await adapter.enrich_tables_batch(
+                conn,
+                [
+                    TableInfo(name="users", schema="public"),
+                    TableInfo(name="orders", schema="public"),
+                ],
+            )
+            await adapter.enrich_table_info(
+                conn, TableInfo(name="orders", schema="public")
+            )
+
+        assert conn.execute.await_count == 1
+        assert conn.execute.await_args.args[1]["table_names"] == ["users", "orders"]
+        assert [t.size_bytes for t in tables] == [8192, 8192]
+        assert tables[1].extra_info["relkind"] == "r"
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_stalest_table_when_full(self):
+        """Test the caches stay bounded, evicting the earliest fetched table."""
+        adapter = PostgresAdapter()
+        conn = self._connection()
+
+        with (
+            patch.object(PostgresAdapter, "_TABLE_CACHE_SIZE", 2),
+            patch("time.monotonic", return_value=100.0),
+        ):
+            for name in ("a", "b", "c"):
+                await adapter.enrich_table_info(
+                    conn, TableInfo(name=name, schema="public")
+                )
+
+        assert list(adapter._catalog_cache) == [("public", "b"), ("public", "c")]
+        assert list(adapter._size_cache) == [("public", "b"), ("public", "c")]
+
+
+class TestPostgresListTables:
+    """Tests for PostgreSQL table listing."""
+
+    @pytest.mark.asyncio
+    async def test_listing_fills_enrichment_cache(self):
+        """Test tables listed from pg_class are enriched without a query."""
+        rows = [
+            {
+                "schema_name": "public",
+                "table_name": name,
+                "is_view": name == "big_orders",
+                "total_size": 16384,
+                "table_size": 8192,
+                "indexes_size": 8192,
+                "row_count": 10,
+                "comment": None,
+                "table_kind": "v" if name == "big_orders" else "r",
+                "persistence": "p",
+                "is_partition": False,
+            }
+            for name in ("orders", "big_orders")
+        ]
+        result = MagicMock()
+        result.mappings.return_value = rows
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+        adapter = PostgresAdapter()
+
+        listed = await adapter.list_tables(conn, None, True)
+        tables = await adapter.enrich_tables_batch(
+            conn,
+            [TableInfo(name=name, table_type=kind) for name, kind in listed],
+        )
+
+        assert listed == [("orders", "BASE TABLE"), ("big_orders", "VIEW")]
+        assert conn.execute.await_count == 1
+        assert [t.row_count for t in tables] == [10, 10]
+
+
+class TestPostgresSchemaBatch:
+    """Tests for PostgreSQL batch schema enrichment."""
+
+    @pytest.mark.asyncio
+    async def test_batch_enrichment_uses_one_query(self):
+        """Test owners and sizes for all schemas come from one query."""
+        rows = [
+            {
+                "schema_name": "public",
+                "owner": "app",
+                "comment": None,
+                "size_bytes": 8192,
+            },
+            {
+                "schema_name": "sales",
+                "owner": "etl",
+                "comment": "Sales",
+                "size_bytes": None,
+            },
+        ]
+        result = MagicMock()
+        result.mappings.return_value = rows
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+
+        schemas = await PostgresAdapter().enrich_schemas_batch(
+            conn, [SchemaInfo(name="public"), SchemaInfo(name="sales")]
+        )
+
+        assert conn.execute.await_count == 1
+        assert conn.execute.await_args.args[1]["schema_names"] == ["public", "sales"]
+        assert [(s.owner, s.size_bytes) for s in schemas] == [
+            ("app", 8192),
+            ("etl", None),
+        ]
+        assert schemas[1].comment == "Sales"
+
+
+class TestHistogramPercentiles:
+    """Tests for percentile estimates from PostgreSQL pg_stats."""
+
+    def test_uniform_histogram(self):
+        """Test equi-depth buckets interpolate linearly, ignoring NULLs."""
+        percentiles = _histogram_percentiles([0.0, 10.0], 0.5, [], [])
+        assert percentiles == pytest.approx((2.5, 5.0, 7.5, 9.5, 9.9))
+
+    def test_most_common_values_are_point_masses(self):
+        """Test a frequent value absorbs the percentiles that fall on it."""
+        percentiles = _histogram_percentiles([0.0, 100.0], 0.0, [50.0], [0.5])
+        assert percentiles == pytest.approx((50.0, 50.0, 50.0, 90.0, 98.0))
+
+    def test_missing_histogram(self):
+        """Test columns without a usable histogram get no estimate."""
+        assert _histogram_percentiles([1.0], 0.0, [], []) is None
+
+
+class TestPostgresExplainPlan:
+    """Tests for PostgreSQL EXPLAIN plan analysis."""
+
+    @pytest.mark.asyncio
+    async def test_nested_seq_scan_is_flagged(self):
+        """Test a sequential scan below the root node produces a warning."""
+        plan = (
+            '[{"Plan": {"Node Type": "Hash Join", "Total Cost": 10.0, "Plans": ['
+            '{"Node Type": "Index Scan", "Relation Name": "users"},'
+            '{"Node Type": "Hash", "Plans": ['
+            '{"Node Type": "Seq Scan", "Relation Name": "orders"}]}]}}]'
+        )
+        result = await PostgresAdapter().parse_explain_plan(plan, analyzed=False)
+        assert any("Sequential scan" in w for w in result["warnings"])
+
+    @pytest.mark.asyncio
+    async def test_seq_scan_text_outside_node_type_is_ignored(self):
+        """Test only node types count, not relation names or filters."""
+        plan = (
+            '[{"Plan": {"Node Type": "Index Scan", "Relation Name": "users",'
+            ' "Filter": "(note = \'Seq Scan\'::text)"}}]'
+        )
+        result = await PostgresAdapter().parse_explain_plan(plan, analyzed=False)
+        assert result["warnings"] == []
+
+
+class TestPostgresColumnStatistics:
+    """Tests for PostgreSQL column statistics driven by the catalogs."""
+
+    @pytest.mark.asyncio
+    async def test_empty_table_skips_statistics_scan(self):
+        """Test a table with no heap pages is answered from the catalog alone."""
+        catalog_row = (
+            "id",
+            "integer",
+            "N",
+            0.0,
+            None,
+            None,
+            None,
+            None,
+            None,
+            True,
+        )
+        result = MagicMock()
+        result.fetchall.return_value = [catalog_row]
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+
+        stats = await PostgresAdapter().get_column_statistics(
+            conn, "users", "id", "public"
+        )
+
+        assert conn.execute.await_count == 1
+        assert stats.data_type == "integer"
+        assert stats.total_rows == 0
+        assert stats.warning is None
+
+
+class TestPostgresSampleQuery:
+    """Tests for PostgreSQL sampling query generation."""
+
+    @staticmethod
+    def _connection(has_system_rows, estimated_rows, relkind="r"):
+        result = MagicMock()
+        result.mappings.return_value.one.return_value = {
+            "has_system_rows": has_system_rows,
+            "estimated_rows": estimated_rows,
+            "relkind": relkind,
+        }
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+        return conn
+
+    @pytest.mark.asyncio
+    async def test_system_rows_when_extension_installed(self):
+        """Test tsm_system_rows is preferred when available."""
+        conn = self._connection(True, 1_000_000)
+        query, params = await PostgresAdapter().get_sample_query(
+            conn, "users", "public", 100
+        )
+        assert "TABLESAMPLE SYSTEM_ROWS (:limit)" in query
+        assert params == {"limit": 100}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("has_system_rows", [True, False])
+    async def test_view_uses_plain_limit(self, has_system_rows):
+        """Test views, which reject TABLESAMPLE, are sampled with LIMIT."""
+        conn = self._connection(has_system_rows, 1_000_000, relkind="v")
+        query, params = await PostgresAdapter().get_sample_query(
+            conn, "active_users", "public", 100
+        )
+        assert query == 'SELECT * FROM "public"."active_users" LIMIT :limit'
+        assert params == {"limit": 100}
+
+    @pytest.mark.asyncio
+    async def test_materialized_view_is_sampled(self):
+        """Test materialized views, which accept TABLESAMPLE, are sampled."""
+        conn = self._connection(True, 1_000_000, relkind="m")
+        query, _ = await PostgresAdapter().get_sample_query(
+            conn, "daily_totals", "public", 100
+        )
+        assert "TABLESAMPLE SYSTEM_ROWS (:limit)" in query
+
+    @pytest.mark.asyncio
+    async def test_bernoulli_sample_sized_from_reltuples(self):
+        """Test the fallback samples rows, oversampled with a margin."""
+        conn = self._connection(False, 1_000_000)
+        query, params = await PostgresAdapter().get_sample_query(
+            conn, "users", "public", 100
+        )
+        assert "TABLESAMPLE BERNOULLI (CAST(:percent AS float4))" in query
+        assert params == {"percent": 0.03, "limit": 100}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [1, 10, 100, 1000])
+    async def test_large_table_sample_reaches_limit(self, limit):
+        """Test the Bernoulli sample almost surely holds limit rows.
+
+        Each of N rows is kept with probability p, so the sample size is
+        binomial. Its mean must clear the limit by more than six standard
+        deviations, making a short sample vanishingly unlikely.
+        """
+        estimated_rows = 1_000_000
+        conn = self._connection(False, estimated_rows)
+        _, params = await PostgresAdapter().get_sample_query(
+            conn, "users", "public", limit
+        )
+        p = params["percent"] / 100
+        mean = estimated_rows * p
+        std_dev = math.sqrt(estimated_rows * p * (1 - p))
+        assert mean - 6 * std_dev >= limit
+
+    @pytest.mark.asyncio
+    async def test_small_table_uses_plain_limit(self):
+        """Test tables smaller than the oversampled request skip TABLESAMPLE."""
+        conn = self._connection(False, 50)
+        query, params = await PostgresAdapter().get_sample_query(
+            conn, "users", "public", 100
+        )
+        assert "TABLESAMPLE" not in query
+        assert params == {"limit": 100}
@@ -1,17 +1,29 @@
 """Unit tests for server utility functions."""
 
+import asyncio
+import json
 import os
-from unittest.mock import MagicMock, patch
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from mcp.types import CallToolRequestParams
+from mcp.types import CallToolRequestParams, TextContent
 
 from db_connect_mcp.models.capabilities import DatabaseCapabilities
 from db_connect_mcp.models.config import DatabaseConfig
+from db_connect_mcp.models.database import SchemaInfo
+from db_connect_mcp.models.table import RelationshipInfo, TableInfo
 from db_connect_mcp.server import (
     DatabaseMCPServer,
+    OFFLOAD_DUMP_MIN_ROWS,
+    _EMPTY_INPUT_SCHEMA,
+    _dump_json,
+    _dump_json_rows,
+    _load_pool_config,
     _load_ssh_tunnel_config,
     _parse_int_env,
+    _sanitize_url,
+    _use_uvloop_if_available,
 )
 
 
@@ -67,6 +79,73 @@ class TestParseIntEnv:
             _parse_int_env("SPACE_VAR", "   ")
 
 
+class TestDumpJson:
+    """Tests for the _dump_json response serializer."""
+
+    def test_matches_indented_stdlib_output(self):
+        """Output should parse back to the input and use two-space indents."""
+        data = {"rows": [{"id": 1, "name": "café"}], "truncated": False}
+        result = _dump_json(data)
+
+        assert json.loads(result) == data
+        assert '\n  "rows": [' in result
+        assert "café" in result
+
+    def test_models_are_encoded_directly(self):
+        """Pydantic models should serialize like their JSON-mode dump."""
+        model = DatabaseCapabilities(foreign_keys=False)
+        with patch.object(
+            DatabaseCapabilities, "model_dump", side_effect=AssertionError
+        ):
+            result = _dump_json(model)
+
+        assert json.loads(result) == model.model_dump(mode="json")
+        assert result.startswith('{\n  "')
+
+    def test_wide_integers_fall_back_to_stdlib(self):
+        """Integers beyond 64 bits should still serialize."""
+        data = {"total": 2**70}
+        assert json.loads(_dump_json(data)) == data
+
+
+class TestDumpJsonRows:
+    """Tests for serializing result sets off the event loop."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("row_count", "offloaded"),
+        [(OFFLOAD_DUMP_MIN_ROWS, False), (OFFLOAD_DUMP_MIN_ROWS + 1, True)],
+    )
+    async def test_large_results_use_a_thread(self, row_count: int, offloaded: bool):
+        """Only result sets above the threshold are encoded in a thread."""
+        data = {"rows": [{"id": i} for i in range(row_count)]}
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            result = await _dump_json_rows(data, row_count)
+
+        assert json.loads(result) == data
+        assert to_thread.called is offloaded
+
+
+class TestSanitizeUrl:
+    """Tests for _sanitize_url helper function."""
+
+    def test_credentials_are_replaced(self):
+        """Username and password should be hidden behind a placeholder."""
+        result = _sanitize_url("postgresql+asyncpg://user:secret@db:5432/app")
+        assert result == "postgresql+asyncpg://<credentials>@db:5432/app"
+
+    def test_password_containing_at_sign(self):
+        """An encoded '@' in the password must not leak into the output."""
+        result = _sanitize_url("mysql+aiomysql://user:p%40ss@db:3306/app")
+        assert result == "mysql+aiomysql://<credentials>@db:3306/app"
+        assert "p%40ss" not in result
+
+    def test_url_without_credentials_is_unchanged(self):
+        """URLs without credentials should be returned as-is."""
+        url = "postgresql+asyncpg://localhost:5432/app"
+        assert _sanitize_url(url) == url
+
+
 class TestMCPToolDispatch:
     """Tests for MCP v2 tool availability and argument validation."""
 
@@ -126,6 +205,208 @@ class TestMCPToolDispatch:
         assert result.is_error
         assert expected_error in str(result.content)
 
+    def test_tool_list_is_built_once(
+        self, server_without_optional_capabilities: DatabaseMCPServer
+    ):
+        """The tool surface should be reused rather than rebuilt per request."""
+        server = server_without_optional_capabilities
+        with patch.object(
+            server, "_build_tools", wraps=server._build_tools
+        ) as build_tools:
+            first = server._available_tools()
+            second = server._available_tools()
+
+        assert first is second
+        assert build_tools.call_count == 1
+        assert [tool.name for tool in first] == [
+            "get_database_info",
+            "list_schemas",
+            "list_tables",
+            "describe_table",
+            "execute_query",
+            "sample_data",
+            "search_objects",
+        ]
+
+    def test_argument_free_tools_use_empty_schema(
+        self, server_without_optional_capabilities: DatabaseMCPServer
+    ):
+        """Tools without arguments should accept only an empty object."""
+        tools = {
+            t.name: t for t in server_without_optional_capabilities._available_tools()
+        }
+
+        for name in ("get_database_info", "list_schemas"):
+            assert tools[name].input_schema == _EMPTY_INPUT_SCHEMA
+
+    @pytest.mark.asyncio
+    async def test_initialize_builds_tools_up_front(
+        self, server_without_optional_capabilities: DatabaseMCPServer
+    ):
+        """initialize() should leave the tool list and dispatch table ready."""
+        server = server_without_optional_capabilities
+        with patch.object(server.connection, "initialize", AsyncMock()):
+            await server.initialize()
+
+        assert server._tools is not None
+        assert set(server._dispatch) == {tool.name for tool in server._tools}
+
+    @pytest.mark.asyncio
+    async def test_dispatch_table_routes_to_handler(
+        self, server_without_optional_capabilities: DatabaseMCPServer
+    ):
+        """Tool calls should reach the handler bound when the tools were built."""
+        server = server_without_optional_capabilities
+        handler = AsyncMock(return_value=[TextContent(type="text", text="{}")])
+        with patch.object(server, "handle_describe_table", handler):
+            result = await server._call_tool(
+                MagicMock(),
+                CallToolRequestParams(
+                    name="describe_table", arguments={"table": "users"}
+                ),
+            )
+
+        assert not result.is_error
+        handler.assert_awaited_once_with({"table": "users"})
+        assert set(server._dispatch) == {tool.name for tool in server._tools or []}
+
+
+class TestDatabaseInfoCache:
+    """Tests for the memoized get_database_info response."""
+
+    @pytest.mark.asyncio
+    async def test_response_is_built_once_until_cleanup(self):
+        """Repeated calls should not query the server version again."""
+        server = DatabaseMCPServer(
+            DatabaseConfig(url="postgresql+asyncpg://user:secret@db:5432/app")
+        )
+        server.inspector = MagicMock()
+        get_version = AsyncMock(return_value="PostgreSQL 17.2")
+
+        with (
+            patch.object(server.connection, "get_version", get_version),
+            patch.object(server.connection, "dispose", AsyncMock()),
+        ):
+            first = await server.handle_get_database_info({})
+            second = await server.handle_get_database_info({})
+            await server.cleanup()
+            await server.handle_get_database_info({})
+
+        assert first == second
+        assert '"name": "app"' in first[0].text
+        assert "secret" not in first[0].text
+        assert get_version.await_count == 2
+
+
+class TestListResponses:
+    """Tests for list handlers encoding models directly."""
+
+    @pytest.fixture
+    def server(self) -> DatabaseMCPServer:
+        """Create a server with a stub inspector."""
+        server = DatabaseMCPServer(
+            DatabaseConfig(url="postgresql+asyncpg://localhost:5432/app")
+        )
+        server.inspector = MagicMock()
+        return server
+
+    @pytest.mark.asyncio
+    async def test_list_tables_matches_model_dump(self, server: DatabaseMCPServer):
+        """Without long comments the response equals the JSON-mode dump."""
+        tables = [
+            TableInfo(name="users", schema="public", comment="People", size_bytes=2048),
+            TableInfo(name="orders", schema="public", table_type="VIEW"),
+        ]
+        server.inspector.get_tables = AsyncMock(return_value=tables)
+
+        (content,) = await server.handle_list_tables({"schema": "public"})
+
+        assert json.loads(content.text) == [t.model_dump(mode="json") for t in tables]
+
+    @pytest.mark.asyncio
+    async def test_long_comments_are_still_truncated(self, server: DatabaseMCPServer):
+        """Long comments still go through truncation and are reported."""
+        schemas = [SchemaInfo(name="public", comment="x" * 5000)]
+        server.inspector.get_schemas = AsyncMock(return_value=schemas)
+
+        (content,) = await server.handle_list_schemas({})
+        response = json.loads(content.text)
+
+        assert response["_truncation_info"]["truncated_fields"] == [
+            "schemas[0].comment"
+        ]
+        assert len(response["data"][0]["comment"]) < 5000
+
+    @pytest.mark.asyncio
+    async def test_relationships_match_model_dump(self, server: DatabaseMCPServer):
+        """Relationships are encoded like their JSON-mode dump."""
+        relationships = [
+            RelationshipInfo(
+                from_table="orders",
+                from_columns=["user_id"],
+                to_table="users",
+                to_columns=["id"],
+                constraint_name="fk_user",
+            )
+        ]
+        server.inspector.get_relationships = AsyncMock(return_value=relationships)
+
+        (content,) = await server.handle_get_relationships({"table": "orders"})
+
+        assert json.loads(content.text) == [
+            r.model_dump(mode="json") for r in relationships
+        ]
+
+
+class TestLoadPoolConfig:
+    """Tests for _load_pool_config helper function."""
+
+    def test_unset_variables_keep_defaults(self):
+        """No pool variables should yield no overrides."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert _load_pool_config() == {}
+
+    def test_pool_variables_are_parsed(self):
+        """Set pool variables should map to DatabaseConfig fields."""
+        env = {"DB_POOL_SIZE": "8", "DB_MAX_OVERFLOW": "4", "DB_POOL_TIMEOUT": "60"}
+        with patch.dict(os.environ, env, clear=True):
+            pool_config = _load_pool_config()
+
+        assert pool_config == {"pool_size": 8, "max_overflow": 4, "pool_timeout": 60}
+        config = DatabaseConfig(url="postgresql://localhost/app", **pool_config)
+        assert config.pool_size + config.max_overflow == 12
+
+    def test_invalid_value_raises_error(self):
+        """Non-integer values should name the offending variable."""
+        with patch.dict(os.environ, {"DB_POOL_SIZE": "many"}, clear=True):
+            with pytest.raises(ValueError, match="DB_POOL_SIZE"):
+                _load_pool_config()
+
+
+class TestUseUvloopIfAvailable:
+    """Tests for the optional uvloop event loop."""
+
+    def test_missing_uvloop_keeps_default_loop(self):
+        """Without uvloop installed the event loop policy is left alone."""
+        with (
+            patch.dict(sys.modules, {"uvloop": None}),
+            patch("asyncio.set_event_loop_policy") as set_policy,
+        ):
+            assert _use_uvloop_if_available() is False
+
+        set_policy.assert_not_called()
+
+    def test_installed_uvloop_sets_policy(self):
+        """With uvloop installed its event loop policy is used."""
+        uvloop = MagicMock()
+        with (
+            patch.dict(sys.modules, {"uvloop": uvloop}),
+            patch("asyncio.set_event_loop_policy") as set_policy,
+        ):
+            assert _use_uvloop_if_available() is True
+
+        set_policy.assert_called_once_with(uvloop.EventLoopPolicy.return_value)
+
 
 class TestLoadSSHTunnelConfig:
     """Tests for _load_ssh_tunnel_config function."""